@@ -0,0 +1,108 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+from app.core.accel_redirect import accel_file_response
+from app.core.conditional_get import make_etag
+from app.core.dependencies import get_current_user, get_current_user_optional, get_db
+from app.core.range_requests import ranged_file_response
+from app.core.security import verify_archive_part_token
+from app.domain.models.user import User
+from app.domain.schemas.archive import ArchiveJob, ArchiveJobCreate, ArchiveManifest
+from app.application.services.archive_job_service import archive_jobs, criteria_request_key, job_response
+from app.application.services.archive_spool_service import archive_spool, manifest_with_urls
+from app.application.services.bulk_download_service import BulkDownloadService
+
+router = APIRouter()
+
+
+@router.post("/jobs", response_model=ArchiveJob, status_code=status.HTTP_202_ACCEPTED)
+def create_archive_job(
+    job_data: ArchiveJobCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Cria o lote em segundo plano e responde na hora com o job (202).
+    
+    Acompanhe em GET /api/v1/archives/jobs/{job_id}; concluído, o job traz o manifesto com as
+    URLs das partes. Pedidos idênticos (mesmos material kinds, tags, operação e tamanho de
+    parte) recebem o mesmo job enquanto ele estiver em andamento ou com o lote válido.
+    """
+    request_key = criteria_request_key(
+        job_data.tag_ids,
+        job_data.material_kind_ids,
+        job_data.operation,
+        job_data.max_zip_size_mb,
+    )
+    job = archive_jobs.submit(
+        request_key,
+        collect=lambda: BulkDownloadService(db).items_by_criteria(
+            tag_ids=job_data.tag_ids or None,
+            material_kind_ids=job_data.material_kind_ids or None,
+            operation=job_data.operation,
+        ),
+        max_part_bytes=job_data.max_zip_size_mb * 1024 * 1024,
+    )
+    return job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ArchiveJob)
+def get_archive_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Progresso do job: arquivos incluídos, bytes gravados e materiais não incluídos."""
+    return job_response(archive_jobs.get(job_id))
+
+
+@router.get("/{archive_id}", response_model=ArchiveManifest)
+def get_archive_manifest(
+    archive_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Manifesto de um download em lote (partes, tamanhos e materiais não incluídos).
+    
+    Apenas o usuário que gerou o lote tem acesso (lotes de jobs são compartilhados);
+    lotes vencidos respondem 404.
+    """
+    return manifest_with_urls(archive_spool.get_manifest(archive_id, current_user.id))
+
+
+@router.get("/{archive_id}/parts/{filename}")
+def download_archive_part(
+    request: Request,
+    archive_id: str,
+    filename: str,
+    token: Optional[str] = Query(None),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """Baixa uma parte (ZIP) do lote, lida do disco em blocos.
+    
+    Autorização pelo header Bearer ou pela URL assinada do manifesto (?token=, válida por
+    ARCHIVE_PART_URL_TTL_SECONDS), que o navegador baixa direto, sem passar pela memória da página.
+    Suporta Range (inclusive sufixo "bytes=-N") para retomar downloads interrompidos;
+    If-Range com o ETag da parte garante que a retomada é do mesmo arquivo. Com
+    ACCEL_REDIRECT_ENABLED o nginx envia a parte (X-Accel-Redirect).
+    """
+    if token is not None and verify_archive_part_token(token, archive_id):
+        owner_id = None
+    elif current_user is not None:
+        owner_id = current_user.id
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    path = archive_spool.get_part_path(archive_id, filename, owner_id)
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    accelerated = accel_file_response(path, "application/zip", headers)
+    if accelerated is not None:
+        return accelerated
+    stat = path.stat()
+    return ranged_file_response(
+        request,
+        path,
+        media_type="application/zip",
+        headers=headers,
+        etag=make_etag("archive-part", archive_id, filename, stat.st_size, stat.st_mtime_ns),
+    )
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, Header, HTTPException, status, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.dependencies import get_db, get_current_user, get_current_user_optional
 from app.core.rate_limit_helpers import apply_rate_limit
+from app.core.conditional_get import is_not_modified, not_modified_response, set_validators, table_versions_etag
 from app.domain.models.user import User
 from app.domain.schemas.language import LanguageCreate, LanguageUpdate, LanguageResponse
 from app.application.services.language_service import LanguageService
@@ -13,6 +14,7 @@ router = APIRouter()
 @router.get("/", response_model=List[LanguageResponse])
 def list_languages(
     request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     active_only: bool = False,
@@ -27,6 +29,11 @@ def list_languages(
     if current_user is None:
         apply_rate_limit(request, "20/minute")
     
+    etag = table_versions_etag(db, ("languages",), request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_validators(response, etag)
+    
     service = LanguageService(db)
     languages = service.get_all(skip=skip, limit=limit, active_only=active_only)
     return languages
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 from app.core.dependencies import get_db, get_current_user, get_current_user_optional
 from app.core.rate_limit_helpers import apply_rate_limit
+from app.core.conditional_get import is_not_modified, not_modified_response, set_validators, table_versions_etag
 from app.domain.models.user import User
 from app.domain.schemas.material_type import MaterialTypeCreate, MaterialTypeUpdate, MaterialTypeResponse
 from app.application.services.material_type_service import MaterialTypeService
@@ -14,6 +15,7 @@ router = APIRouter()
 @router.get("/", response_model=List[MaterialTypeResponse])
 def list_material_types(
     request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -27,6 +29,11 @@ def list_material_types(
     if current_user is None:
         apply_rate_limit(request, "20/minute")
     
+    etag = table_versions_etag(db, ("material_types",), request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_validators(response, etag)
+    
     service = MaterialTypeService(db)
     types = service.get_all(skip=skip, limit=limit)
     return types
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Request, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
-import os
 import logging
+from app.core.config import settings
 from app.core.dependencies import get_db, get_current_user, get_current_user_optional, get_storage
 from app.core.rate_limit_helpers import apply_rate_limit
 
@@ -24,8 +24,19 @@ def _parse_form_optional_bool(val: Optional[str]) -> Optional[bool]:
         return None
     return str(val).strip().lower() in ('true', '1', 'on', 'yes')
 from app.domain.models.user import User
-from app.domain.schemas.praise_material import PraiseMaterialCreate, PraiseMaterialUpdate, PraiseMaterialResponse
+from app.domain.schemas.praise_material import (
+    PraiseMaterialCreate,
+    PraiseMaterialUpdate,
+    PraiseMaterialResponse,
+    PraiseMaterialByIdsRequest,
+    PraiseMaterialByIdsResponse,
+)
+from app.domain.schemas.fast_serializers import praise_materials_to_dicts
 from app.application.services.praise_material_service import PraiseMaterialService
+from app.application.services.material_file_service import recorded_file_is_current
+from app.application.services.archive_job_service import archive_jobs, criteria_request_key, job_response
+from app.application.services.bulk_download_service import BulkDownloadService
+from app.domain.schemas.archive import ArchiveJob
 from app.infrastructure.database.repositories.material_type_repository import MaterialTypeRepository
 from app.infrastructure.storage.storage_client import StorageClient
 import mimetypes
@@ -56,6 +67,8 @@ def list_praise_materials(
         materials = service.get_by_praise_id(praise_id, is_old=is_old)
     else:
         materials = service.get_all(skip=skip, limit=limit)
+    if settings.FAST_JSON_RESPONSES:
+        return ORJSONResponse(content=praise_materials_to_dicts(materials))
     return materials
 
 
@@ -120,10 +133,40 @@ def batch_search_materials(
         is_old=is_old,
     )
     
+    if settings.FAST_JSON_RESPONSES:
+        return ORJSONResponse(content=praise_materials_to_dicts(materials))
     return materials
 
 
-@router.get("/batch-download")
+@router.post("/by-ids", response_model=PraiseMaterialByIdsResponse)
+def get_praise_materials_by_ids(
+    request: Request,
+    data: PraiseMaterialByIdsRequest,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """Obtém vários materiais por ID numa única consulta.
+    
+    items segue a ordem de ids (repetidos aparecem uma vez); IDs inexistentes vêm em
+    missing_ids em vez de gerar 404.
+    
+    Rota pública: pode ser acessada sem autenticação, mas com rate limiting.
+    Usuários autenticados têm acesso ilimitado.
+    """
+    if current_user is None:
+        apply_rate_limit(request, "600/minute")
+
+    service = PraiseMaterialService(db)
+    materials, missing_ids = service.get_by_ids(data.ids)
+    if settings.FAST_JSON_RESPONSES:
+        return ORJSONResponse(content={
+            "items": praise_materials_to_dicts(materials),
+            "missing_ids": [str(material_id) for material_id in missing_ids],
+        })
+    return {"items": materials, "missing_ids": missing_ids}
+
+
+@router.get("/batch-download", response_model=ArchiveJob, status_code=status.HTTP_202_ACCEPTED)
 def batch_download_materials(
     tag_ids: Optional[str] = Query(None, description="IDs de tags separados por vírgula"),
     material_kind_ids: Optional[str] = Query(None, description="IDs de material kinds separados por vírgula"),
@@ -131,17 +174,15 @@ def batch_download_materials(
     max_zip_size_mb: int = Query(100, ge=10, le=10000, description="Tamanho máximo por ZIP em MB (10000 = ZIP único)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    storage: StorageClient = Depends(get_storage),
 ):
-    """Baixa materiais por critérios (tags, material kinds) em formato ZIP.
+    """Gera o download de materiais por critérios (tags, material kinds) em ZIPs.
     
     Divide em múltiplos ZIPs quando exceder max_zip_size_mb. Use 10000 para ZIP único.
     Exige pelo menos tag_ids ou material_kind_ids.
+    
+    Mesmo job de POST /api/v1/archives/jobs: o lote é montado em segundo plano e a resposta
+    é o job (202), acompanhado em GET /api/v1/archives/jobs/{job_id}.
     """
-    import io
-    import zipfile
-    import os
-
     parsed_tag_ids = None
     if tag_ids:
         try:
@@ -162,163 +203,16 @@ def batch_download_materials(
                 detail="Invalid material_kind_ids format. Expected comma-separated UUIDs."
             )
 
-    if not parsed_tag_ids and not parsed_material_kind_ids:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Provide at least tag_ids or material_kind_ids"
-        )
-
-    if operation not in ["union", "intersection"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="operation must be 'union' or 'intersection'"
-        )
-
-    service = PraiseMaterialService(db)
-    materials = service.get_by_criteria(
-        tag_ids=parsed_tag_ids,
-        material_kind_ids=parsed_material_kind_ids,
-        operation=operation,
-    )
-
-    material_type_repo = MaterialTypeRepository(db)
-    materials_to_download = []
-    for material in materials:
-        material_type = material_type_repo.get_by_id(material.material_type_id)
-        if not material_type:
-            continue
-        if material_type.name.lower() in ['pdf', 'audio']:
-            materials_to_download.append({
-                'material': material,
-                'praise': material.praise,
-                'material_type': material_type,
-                'material_kind': material.material_kind,
-            })
-
-    if not materials_to_download:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No file materials found for the given criteria"
-        )
-
-    max_zip_size_bytes = max_zip_size_mb * 1024 * 1024
-    master_zip_buffer = io.BytesIO()
-
-    with zipfile.ZipFile(master_zip_buffer, 'w', zipfile.ZIP_DEFLATED) as master_zip:
-        current_zip_buffer = io.BytesIO()
-        current_zip_size = 0
-        current_part = 1
-        current_zip_file = None
-        file_count = 0
-        skipped_materials = []
-        zip_parts_info = []
-
-        for item in materials_to_download:
-            material = item['material']
-            praise = item['praise']
-            material_type = item['material_type']
-            material_kind = item['material_kind']
-
-            try:
-                if not storage.file_exists(material.path):
-                    logger.warning(f"File does not exist: {material.path}")
-                    skipped_materials.append({
-                        'material_id': str(material.id),
-                        'praise_name': praise.name,
-                        'path': material.path,
-                        'reason': "File does not exist in storage"
-                    })
-                    continue
-
-                file_content = storage.download_file(material.path)
-                if len(file_content) == 0:
-                    logger.warning(f"Downloaded file is empty: {material.path}")
-                    skipped_materials.append({
-                        'material_id': str(material.id),
-                        'praise_name': praise.name,
-                        'path': material.path,
-                        'reason': "Downloaded file is empty"
-                    })
-                    continue
-
-                if current_zip_file is None or (current_zip_size + len(file_content) > max_zip_size_bytes and current_zip_size > 0):
-                    if current_zip_file is not None:
-                        current_zip_file.close()
-                        current_zip_buffer.seek(0)
-                        part_filename = f"part_{current_part:03d}.zip"
-                        master_zip.writestr(part_filename, current_zip_buffer.read())
-                        zip_parts_info.append({
-                            'filename': part_filename,
-                            'size': current_zip_size,
-                            'file_count': file_count
-                        })
-                        logger.info(f"Created ZIP part {current_part} with {file_count} files ({current_zip_size / 1024 / 1024:.2f} MB)")
-
-                    current_zip_buffer = io.BytesIO()
-                    current_zip_file = zipfile.ZipFile(current_zip_buffer, 'w', zipfile.ZIP_DEFLATED)
-                    current_zip_size = 0
-                    current_part += 1
-                    file_count = 0
-
-                file_ext = os.path.splitext(material.path)[1] or ('.pdf' if material_type.name.lower() == 'pdf' else '.mp3')
-                praise_name_safe = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in praise.name)
-                material_kind_name = material_kind.name if material_kind else "material"
-                material_kind_name_safe = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in material_kind_name)
-                zip_filename = f"{praise_name_safe}/{material_kind_name_safe}/{material.id}{file_ext}"
-
-                current_zip_file.writestr(zip_filename, file_content)
-                current_zip_size += len(file_content)
-                file_count += 1
-
-            except Exception as e:
-                logger.error(f"Error processing material {material.id}: {str(e)}", exc_info=True)
-                skipped_materials.append({
-                    'material_id': str(material.id),
-                    'praise_name': praise.name,
-                    'path': material.path,
-                    'reason': f"Error: {str(e)}"
-                })
-                continue
-
-        if current_zip_file is not None:
-            current_zip_file.close()
-            current_zip_buffer.seek(0)
-            part_filename = f"part_{current_part:03d}.zip"
-            master_zip.writestr(part_filename, current_zip_buffer.read())
-            zip_parts_info.append({
-                'filename': part_filename,
-                'size': current_zip_size,
-                'file_count': file_count
-            })
-            logger.info(f"Created ZIP part {current_part} with {file_count} files ({current_zip_size / 1024 / 1024:.2f} MB)")
-
-        readme_content = "Download de Materiais em Lote\n"
-        readme_content += "===========================\n\n"
-        readme_content += f"Total de arquivos: {sum(info['file_count'] for info in zip_parts_info)}\n"
-        readme_content += f"Total de ZIPs criados: {len(zip_parts_info)}\n"
-        readme_content += f"Tamanho máximo por ZIP: {max_zip_size_mb} MB\n\n"
-        if zip_parts_info:
-            readme_content += "ZIPs incluídos:\n"
-            for info in zip_parts_info:
-                readme_content += f"- {info['filename']}: {info['file_count']} arquivos ({info['size'] / 1024 / 1024:.2f} MB)\n"
-        if skipped_materials:
-            readme_content += f"\nMateriais não incluídos ({len(skipped_materials)}):\n"
-            for mat in skipped_materials:
-                readme_content += f"- {mat['praise_name']} - Material ID {mat['material_id']}: {mat.get('reason', 'Unknown')}\n"
-
-        master_zip.writestr("README.txt", readme_content.encode('utf-8'))
-
-    master_zip_buffer.seek(0)
-    zip_filename = "materials_batch.zip"
-
-    return StreamingResponse(
-        io.BytesIO(master_zip_buffer.read()),
-        media_type="application/zip",
-        headers={
-            "Content-Disposition": f'attachment; filename="{zip_filename}"',
-            "Content-Type": "application/zip"
-        }
+    job = archive_jobs.submit(
+        criteria_request_key(parsed_tag_ids or [], parsed_material_kind_ids or [], operation, max_zip_size_mb),
+        collect=lambda: BulkDownloadService(db).items_by_criteria(
+            tag_ids=parsed_tag_ids,
+            material_kind_ids=parsed_material_kind_ids,
+            operation=operation,
+        ),
+        max_part_bytes=max_zip_size_mb * 1024 * 1024,
     )
+    return job_response(job)
 
 
 # IMPORTANTE: Rotas mais específicas DEVEM vir antes das rotas genéricas
@@ -353,7 +247,11 @@ def get_download_url(
             detail="Download URL only available for file materials (PDF or AUDIO)"
         )
     
-    url = storage.generate_url(material.path, expiration=expiration)
+    # Caminho resolvido gravado no material (storage local), sem procurar o arquivo
+    url = storage.generate_url(material.resolved_path or material.path, expiration=expiration)
+    if url.startswith("/"):
+        # URL local (/assets/...) com a versão do arquivo: muda quando ele é substituído
+        url = f"{url}?v={material.file_version}"
     return {"download_url": url, "expires_in": expiration}
 
 
@@ -367,14 +265,34 @@ def download_material(
 ):
     """Serve o arquivo do material diretamente (apenas para arquivos).
     
-    Suporta HTTP Range requests para seek em áudio/vídeo no navegador.
+    O arquivo é enviado em blocos, sem carregá-lo em memória. Suporta HTTP Range (inclusive
+    sufixo e vários intervalos, em multipart/byteranges) para seek em áudio/PDF no navegador,
+    e If-Range com o ETag ou a data de Last-Modified para retomar downloads. Com
+    ACCEL_REDIRECT_ENABLED o envio fica com o nginx (X-Accel-Redirect) e a API só autoriza.
+    
+    Caminho, tamanho, content type e checksum vêm dos metadados gravados no material, conferidos
+    com um único stat do caminho gravado; materiais sem checksum ou cujo arquivo não confere com o
+    registro (trocado ou removido fora da API) procuram o arquivo e usam o stat.
+    ETag e Last-Modified saem desses dados: If-None-Match / If-Modified-Since respondem 304
+    sem abrir o arquivo. Com ?v={file_version} (a versão
+    atual) a resposta é immutable; substituir o arquivo incrementa a versão e muda a URL.
     
     Rota pública: pode ser acessada sem autenticação, mas com rate limiting.
     Usuários autenticados têm acesso ilimitado.
     """
-    from fastapi.responses import RedirectResponse, Response
+    from fastapi.responses import RedirectResponse
     from pathlib import Path
+    from datetime import datetime
+    from app.core.accel_redirect import accel_file_response
+    from app.core.conditional_get import (
+        FILE_CACHE_CONTROL,
+        IMMUTABLE_CACHE_CONTROL,
+        is_not_modified,
+        make_etag,
+        not_modified_response,
+    )
     from app.core.config import settings
+    from app.core.range_requests import ranged_file_response
     import mimetypes
     
     if current_user is None:
@@ -392,78 +310,65 @@ def download_material(
         )
     
     if settings.STORAGE_MODE == "local":
-        storage_path = Path(settings.STORAGE_LOCAL_PATH)
-        if not storage_path.exists():
-            container_path = Path("/storage/assets")
-            if container_path.exists():
-                storage_path = container_path
-        
-        file_path = storage_path / material.path
-        
-        if not file_path.exists():
-            direct_path = Path("/storage/assets") / material.path
-            if direct_path.exists():
-                file_path = direct_path
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"File not found at {file_path} or {direct_path}"
-                )
-        
-        content_type, _ = mimetypes.guess_type(str(file_path))
-        if not content_type:
-            content_type = "application/octet-stream"
+        if recorded_file_is_current(material):
+            # Metadados gravados no upload/importação; tamanho e data conferem com o disco
+            file_path = Path(material.resolved_path)
+            file_size = material.file_size
+            modified_at = material.file_modified_at
+            content_type = material.content_type or "application/octet-stream"
+            etag = make_etag("material-file", material.id, material.file_version, material.checksum)
+        else:
+            # Sem metadados completos ou divergentes do disco (até o reconcile): procura o arquivo
+            storage_path = Path(settings.STORAGE_LOCAL_PATH)
+            if not storage_path.exists():
+                container_path = Path("/storage/assets")
+                if container_path.exists():
+                    storage_path = container_path
+            
+            file_path = storage_path / material.path
+            
+            if not file_path.exists():
+                direct_path = Path("/storage/assets") / material.path
+                if direct_path.exists():
+                    file_path = direct_path
+                else:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"File not found at {file_path} or {direct_path}"
+                    )
+            
+            content_type, _ = mimetypes.guess_type(str(file_path))
+            if not content_type:
+                content_type = "application/octet-stream"
+            
+            stat = file_path.stat()
+            file_size = stat.st_size
+            modified_at = datetime.utcfromtimestamp(stat.st_mtime)
+            etag = make_etag("material-file", material.id, material.file_version, stat.st_size, stat.st_mtime_ns)
         
-        file_size = file_path.stat().st_size
-        range_header = request.headers.get("range")
+        # If-None-Match / If-Modified-Since sem abrir o arquivo; a versão na URL permite immutable
+        versioned = request.query_params.get("v") == str(material.file_version)
+        cache_control = IMMUTABLE_CACHE_CONTROL if versioned else FILE_CACHE_CONTROL
+        if is_not_modified(request, etag, modified_at):
+            response = not_modified_response(etag, modified_at)
+            response.headers["Cache-Control"] = cache_control
+            return response
         
-        base_headers = {
-            "Accept-Ranges": "bytes",
+        headers = {
             "Content-Disposition": f'inline; filename="{file_path.name}"',
-            "Cache-Control": "public, max-age=3600",
+            "Cache-Control": cache_control,
         }
-        
-        if range_header:
-            range_spec = range_header.strip().lower()
-            if range_spec.startswith("bytes="):
-                range_spec = range_spec[6:]
-                parts = range_spec.split("-", 1)
-                start = int(parts[0]) if parts[0] else 0
-                end = int(parts[1]) if len(parts) > 1 and parts[1] else file_size - 1
-                
-                if start >= file_size:
-                    return Response(
-                        status_code=416,
-                        headers={"Content-Range": f"bytes */{file_size}"},
-                    )
-                
-                end = min(end, file_size - 1)
-                content_length = end - start + 1
-                
-                with open(file_path, "rb") as f:
-                    f.seek(start)
-                    data = f.read(content_length)
-                
-                base_headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
-                base_headers["Content-Length"] = str(content_length)
-                
-                return Response(
-                    content=data,
-                    status_code=206,
-                    media_type=content_type,
-                    headers=base_headers,
-                )
-        
-        with open(file_path, "rb") as f:
-            data = f.read()
-        
-        base_headers["Content-Length"] = str(file_size)
-        
-        return Response(
-            content=data,
-            status_code=200,
+        accelerated = accel_file_response(file_path, content_type, headers)
+        if accelerated is not None:
+            return accelerated
+        return ranged_file_response(
+            request,
+            file_path,
             media_type=content_type,
-            headers=base_headers,
+            headers=headers,
+            etag=etag,
+            file_size=file_size,
+            modified_at=modified_at,
         )
     else:
         url = storage.generate_url(material.path, expiration=3600)
@@ -1,26 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
-import zipfile
-import io
-import os
+from app.core.accel_redirect import accel_file_response
+from app.core.config import settings
 from app.core.dependencies import get_db, get_current_user, get_current_user_optional, get_storage
 from app.core.rate_limit_helpers import apply_rate_limit
+from app.core.conditional_get import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    set_validators,
+    table_versions_etag,
+)
 from app.domain.models.user import User
-from app.domain.schemas.praise import PraiseCreate, PraiseUpdate, PraiseResponse, ReviewActionRequest
+from app.domain.schemas.praise import (
+    PraiseCreate,
+    PraiseUpdate,
+    PraiseResponse,
+    PraiseSummaryResponse,
+    PraiseFacetsResponse,
+    PraiseSuggestion,
+    PraiseByIdsRequest,
+    PraiseByIdsResponse,
+    ReviewActionRequest,
+)
+from app.domain.schemas.archive import ArchiveJob
+from app.domain.schemas.fast_serializers import praise_documents_to_dicts, praise_summary_to_dict
 from app.application.services.praise_service import PraiseService
+from app.application.services.praise_search_index import praise_search_index
+from app.application.services.archive_job_service import archive_jobs, job_response
+from app.application.services.bulk_download_service import BulkDownloadService
+from app.application.services.praise_archive_service import PraiseArchive, praise_archive_cache
+from app.application.services.praise_export_service import EXPORT_FORMATS, iter_csv, iter_ndjson
 from app.infrastructure.storage.storage_client import StorageClient
-from app.infrastructure.database.repositories.material_type_repository import MaterialTypeRepository
-from app.infrastructure.database.repositories.material_kind_repository import MaterialKindRepository
 
 router = APIRouter()
 
+# Tabelas de que dependem as leituras de praises (ETag via contadores de table_versions)
+PRAISE_READ_TABLES = (
+    "praises",
+    "praise_materials",
+    "praise_tag_association",
+    "praise_tags",
+    "material_kinds",
+    "material_types",
+)
+
 
 @router.get("/", response_model=List[PraiseResponse])
 def list_praises(
     request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     name: Optional[str] = Query(None),
@@ -30,21 +62,79 @@ def list_praises(
     category: Optional[str] = Query(None, description="Filtrar por categoria (ex.: Coletânea); vazio = todos"),
     youtube_url: Optional[str] = Query(None, description="URL ou ID do vídeo YouTube para filtrar o louvor"),
     search_in_lyrics: bool = Query(False, description="Incluir busca no conteúdo da letra"),
-    sort_by: str = Query("name", description="Ordenar por: name ou number"),
+    fuzzy: bool = Query(False, description="Tolerar erros de digitação no nome (similaridade de trigramas)"),
+    sort_by: str = Query("name", description="Ordenar por: name, number ou relevance (relevância da busca em nome/letra)"),
     sort_direction: str = Query("asc", description="Direção: asc ou desc"),
     no_number: str = Query("last", description="Praises sem número: first, last ou hide (apenas quando sort_by=number)"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco do header X-Next-Cursor; quando informado, skip é ignorado"),
+    view: str = Query("full", description="full (padrão) ou summary (projeção leve: id, name, number, tonality, tags)"),
+    fields: Optional[str] = Query(None, description="Campos do resumo separados por vírgula (implica view=summary)"),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Lista todos os praises com paginação, busca por nome/tag e ordenação no banco.
     
+    Paginação por offset (skip/limit) ou por cursor: quando a página vem cheia, o header
+    X-Next-Cursor traz o cursor da próxima página (mesmos filtros e ordenação).
+    
+    Com view=summary ou fields=..., retorna PraiseSummaryResponse só com os campos pedidos,
+    consultando apenas as colunas necessárias (sem materiais nem review_history).
+    
+    Envia ETag; com If-None-Match igual, responde 304 sem corpo (nada mudou no catálogo).
+    
+    Com FAST_JSON_RESPONSES=true, o corpo (mesmo JSON) é montado sem validação Pydantic
+    por item e codificado com orjson.
+    
     Rota pública: pode ser acessada sem autenticação, mas com rate limiting.
     Usuários autenticados têm acesso ilimitado.
     """
     # Aplicar rate limiting (usuários autenticados podem ter limites maiores depois)
     apply_rate_limit(request, "600/minute")
+
+    # GET condicional: If-None-Match com a versão atual responde 304 sem consultar praises
+    etag = table_versions_etag(db, PRAISE_READ_TABLES, "list", request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     
     service = PraiseService(db)
+    if view == "summary" or fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        summary_fields = service.resolve_summary_fields(requested)
+        items = service.get_summaries(
+            fields=summary_fields,
+            skip=skip,
+            limit=limit,
+            name=name,
+            tag_id=tag_id,
+            tonality=tonality,
+            rhythm=rhythm,
+            category=category,
+            youtube_url=youtube_url,
+            search_in_lyrics=search_in_lyrics,
+            fuzzy=fuzzy,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            no_number=no_number,
+            cursor=cursor,
+        )
+        headers = {}
+        next_cursor = service.next_cursor(
+            items, limit, sort_by=sort_by, sort_direction=sort_direction, no_number=no_number
+        )
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        if settings.FAST_JSON_RESPONSES:
+            content = [praise_summary_to_dict(item, summary_fields) for item in items]
+            summary_response = ORJSONResponse(content=content, headers=headers)
+        else:
+            content = [
+                PraiseSummaryResponse(**item).model_dump(mode="json", include=set(summary_fields))
+                for item in items
+            ]
+            summary_response = JSONResponse(content=content, headers=headers)
+        set_validators(summary_response, etag)
+        return summary_response
+
     praises = service.get_all(
         skip=skip,
         limit=limit,
@@ -55,234 +145,161 @@ def list_praises(
         category=category,
         youtube_url=youtube_url,
         search_in_lyrics=search_in_lyrics,
+        fuzzy=fuzzy,
         sort_by=sort_by,
         sort_direction=sort_direction,
         no_number=no_number,
+        cursor=cursor,
+    )
+    next_cursor = service.next_cursor(
+        praises, limit, sort_by=sort_by, sort_direction=sort_direction, no_number=no_number
     )
+    if settings.FAST_JSON_RESPONSES:
+        # Documentos do modelo de leitura direto para orjson, sem validar cada PraiseResponse
+        fast_response = ORJSONResponse(content=praise_documents_to_dicts(praises))
+        if next_cursor:
+            fast_response.headers["X-Next-Cursor"] = next_cursor
+        set_validators(fast_response, etag)
+        return fast_response
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    set_validators(response, etag)
     return praises
 
 
-@router.get("/download-by-material-kind")
-def download_praises_by_material_kind(
+@router.get("/facets", response_model=PraiseFacetsResponse)
+def get_praise_facets(
     request: Request,
-    material_kind_id: UUID = Query(..., description="ID do material kind para filtrar materiais"),
-    tag_id: Optional[UUID] = Query(None, description="ID da tag para filtrar praises (opcional)"),
-    max_zip_size_mb: int = Query(100, ge=10, le=1000, description="Tamanho máximo de cada ZIP em MB (padrão: 100)"),
+    response: Response,
+    name: Optional[str] = Query(None),
+    tag_id: Optional[UUID] = Query(None),
+    tonality: Optional[str] = Query(None, description="Filtrar por tom (ex.: C, Dm); vazio = todos"),
+    rhythm: Optional[str] = Query(None, description="Filtrar por ritmo; vazio = todos"),
+    category: Optional[str] = Query(None, description="Filtrar por categoria (ex.: Coletânea); vazio = todos"),
+    youtube_url: Optional[str] = Query(None, description="URL ou ID do vídeo YouTube para filtrar o louvor"),
+    search_in_lyrics: bool = Query(False, description="Incluir busca no conteúdo da letra"),
+    fuzzy: bool = Query(False, description="Tolerar erros de digitação no nome (similaridade de trigramas)"),
+    sort_by: str = Query("name", description="Mesmo valor da listagem (no_number=hide só vale com number)"),
+    no_number: str = Query("last", description="Praises sem número: first, last ou hide (apenas quando sort_by=number)"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    storage: StorageClient = Depends(get_storage)
+    current_user: Optional[User] = Depends(get_current_user_optional)
 ):
-    """Baixa materiais de um material_kind específico de múltiplos praises em formato ZIP
+    """Total e contagens por tom, ritmo, categoria e tag para os filtros da listagem.
     
-    Filtra praises por tag (se fornecido) e agrupa materiais do material_kind especificado.
-    Divide em múltiplos ZIPs quando exceder o tamanho máximo especificado.
-    Retorna um ZIP mestre contendo os ZIPs menores.
+    Aceita os mesmos filtros de GET /api/v1/praises e calcula tudo numa única consulta.
+    
+    Rota pública: pode ser acessada sem autenticação, mas com rate limiting.
     """
     apply_rate_limit(request, "600/minute")
 
-    import logging
-    from app.core.config import settings
+    etag = table_versions_etag(db, PRAISE_READ_TABLES, "facets", request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_validators(response, etag)
+
+    service = PraiseService(db)
+    return service.get_facets(
+        name=name,
+        tag_id=tag_id,
+        tonality=tonality,
+        rhythm=rhythm,
+        category=category,
+        youtube_url=youtube_url,
+        search_in_lyrics=search_in_lyrics,
+        fuzzy=fuzzy,
+        sort_by=sort_by,
+        no_number=no_number,
+    )
+
+
+@router.get("/suggest", response_model=List[PraiseSuggestion])
+def suggest_praises(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100, description="Texto digitado (nome, número ou trecho da letra)"),
+    limit: int = Query(10, ge=1, le=50),
+    include_lyrics: bool = Query(True, description="Incluir palavras da letra nas sugestões"),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """Sugestões para autocomplete a partir do índice em memória (não consulta o banco).
     
-    logger = logging.getLogger(__name__)
+    Ordem: número exato/prefixo, prefixo do nome, palavras do nome, trecho do nome e letra.
+    Retorna 503 enquanto o índice ainda está sendo construído.
     
-    # Validar que material_kind existe
-    material_kind_repo = MaterialKindRepository(db)
-    material_kind = material_kind_repo.get_by_id(material_kind_id)
-    if not material_kind:
+    Rota pública: pode ser acessada sem autenticação, mas com rate limiting.
+    """
+    apply_rate_limit(request, "600/minute")
+
+    if not praise_search_index.ready:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"MaterialKind with id {material_kind_id} not found"
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search index is not ready yet"
         )
+    return praise_search_index.suggest(q, limit=limit, include_lyrics=include_lyrics)
+
+
+@router.get("/export")
+def export_praises(
+    request: Request,
+    format: str = Query("ndjson", description="ndjson (um PraiseResponse por linha) ou csv"),
+    tag_id: Optional[UUID] = Query(None, description="Exportar apenas praises com esta tag"),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """Exporta o catálogo inteiro (praises com tags e materiais) numa única resposta em streaming.
     
-    # Buscar praises (filtrados por tag se fornecido)
-    service = PraiseService(db)
-    # Usar limite reduzido para evitar sobrecarga
-    praises = service.get_all(skip=0, limit=1000, tag_id=tag_id)
-    
-    logger.info(f"Found {len(praises)} praises (tag_id={tag_id}) for material_kind {material_kind_id}")
-    
-    # Buscar tipo de material para filtrar apenas arquivos
-    material_type_repo = MaterialTypeRepository(db)
-    
-    # Coletar todos os materiais relevantes
-    materials_to_download = []
-    for praise in praises:
-        for material in praise.materials:
-            # Filtrar apenas materiais do material_kind especificado
-            if material.material_kind_id != material_kind_id:
-                continue
-            
-            # Verificar se é tipo arquivo
-            material_type = material_type_repo.get_by_id(material.material_type_id)
-            if not material_type:
-                continue
-            
-            material_type_name = material_type.name.lower()
-            if material_type_name in ['pdf', 'audio']:
-                materials_to_download.append({
-                    'material': material,
-                    'praise': praise,
-                    'material_type': material_type
-                })
-    
-    logger.info(f"Found {len(materials_to_download)} file materials to download")
+    Os praises são lidos em lotes por cursor do servidor e enviados à medida que são
+    serializados, sem paginação e com memória constante no servidor.
     
-    if not materials_to_download:
+    Rota pública: pode ser acessada sem autenticação, mas com rate limiting.
+    Usuários autenticados têm acesso ilimitado.
+    """
+    if current_user is None:
+        apply_rate_limit(request, "5/minute")
+
+    if format not in EXPORT_FORMATS:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No file materials found for material_kind {material_kind_id}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="format must be 'ndjson' or 'csv'"
         )
-    
-    # Calcular tamanho máximo em bytes
-    max_zip_size_bytes = max_zip_size_mb * 1024 * 1024
-    
-    # Criar ZIP mestre em memória
-    master_zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(master_zip_buffer, 'w', zipfile.ZIP_DEFLATED) as master_zip:
-        # Lista para armazenar informações dos ZIPs criados
-        zip_parts_info = []
-        
-        # Processar materiais em partes (ZIPs menores)
-        current_zip_buffer = io.BytesIO()
-        current_zip_size = 0
-        current_part = 1
-        current_zip_file = None
-        file_count = 0
-        skipped_materials = []
-        
-        for item in materials_to_download:
-            material = item['material']
-            praise = item['praise']
-            material_type = item['material_type']
-            
-            try:
-                # Verificar se arquivo existe
-                if not storage.file_exists(material.path):
-                    logger.warning(f"File does not exist: {material.path}")
-                    skipped_materials.append({
-                        'material_id': str(material.id),
-                        'praise_name': praise.name,
-                        'path': material.path,
-                        'reason': "File does not exist in storage"
-                    })
-                    continue
-                
-                # Baixar arquivo
-                file_content = storage.download_file(material.path)
-                
-                if len(file_content) == 0:
-                    logger.warning(f"Downloaded file is empty: {material.path}")
-                    skipped_materials.append({
-                        'material_id': str(material.id),
-                        'praise_name': praise.name,
-                        'path': material.path,
-                        'reason': "Downloaded file is empty"
-                    })
-                    continue
-                
-                # Verificar se precisa criar novo ZIP
-                if current_zip_file is None or (current_zip_size + len(file_content) > max_zip_size_bytes and current_zip_size > 0):
-                    # Fechar ZIP atual se existir
-                    if current_zip_file is not None:
-                        current_zip_file.close()
-                        current_zip_buffer.seek(0)
-                        part_filename = f"part_{current_part:03d}.zip"
-                        master_zip.writestr(part_filename, current_zip_buffer.read())
-                        zip_parts_info.append({
-                            'filename': part_filename,
-                            'size': current_zip_size,
-                            'file_count': file_count
-                        })
-                        logger.info(f"Created ZIP part {current_part} with {file_count} files ({current_zip_size / 1024 / 1024:.2f} MB)")
-                    
-                    # Criar novo ZIP
-                    current_zip_buffer = io.BytesIO()
-                    current_zip_file = zipfile.ZipFile(current_zip_buffer, 'w', zipfile.ZIP_DEFLATED)
-                    current_zip_size = 0
-                    current_part += 1
-                    file_count = 0
-                
-                # Obter extensão do arquivo
-                file_ext = os.path.splitext(material.path)[1] or ('.pdf' if material_type.name.lower() == 'pdf' else '.mp3')
-                
-                # Criar nome do arquivo no ZIP: {praise_name}/{material_kind_name}/arquivo.ext
-                praise_name_safe = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in praise.name)
-                material_kind_name_safe = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in material_kind.name)
-                zip_filename = f"{praise_name_safe}/{material_kind_name_safe}/{material.id}{file_ext}"
-                
-                # Adicionar ao ZIP atual
-                current_zip_file.writestr(zip_filename, file_content)
-                current_zip_size += len(file_content)
-                file_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error processing material {material.id}: {str(e)}", exc_info=True)
-                skipped_materials.append({
-                    'material_id': str(material.id),
-                    'praise_name': praise.name,
-                    'path': material.path,
-                    'reason': f"Error: {str(e)}"
-                })
-                continue
-        
-        # Fechar último ZIP se existir
-        if current_zip_file is not None:
-            current_zip_file.close()
-            current_zip_buffer.seek(0)
-            part_filename = f"part_{current_part:03d}.zip"
-            master_zip.writestr(part_filename, current_zip_buffer.read())
-            zip_parts_info.append({
-                'filename': part_filename,
-                'size': current_zip_size,
-                'file_count': file_count
-            })
-            logger.info(f"Created ZIP part {current_part} with {file_count} files ({current_zip_size / 1024 / 1024:.2f} MB)")
-        
-        # Criar README.txt no ZIP mestre
-        readme_content = f"Download de Materiais por Material Kind\n"
-        readme_content += f"==========================================\n\n"
-        readme_content += f"Material Kind: {material_kind.name}\n"
-        if tag_id:
-            # Buscar nome da tag
-            from app.infrastructure.database.repositories.praise_tag_repository import PraiseTagRepository
-            tag_repo = PraiseTagRepository(db)
-            tag = tag_repo.get_by_id(tag_id)
-            if tag:
-                readme_content += f"Tag filtrada: {tag.name}\n"
-        readme_content += f"\nTotal de arquivos: {sum(info['file_count'] for info in zip_parts_info)}\n"
-        readme_content += f"Total de ZIPs criados: {len(zip_parts_info)}\n"
-        readme_content += f"Tamanho máximo por ZIP: {max_zip_size_mb} MB\n\n"
-        
-        if zip_parts_info:
-            readme_content += "ZIPs incluídos:\n"
-            for info in zip_parts_info:
-                readme_content += f"- {info['filename']}: {info['file_count']} arquivos ({info['size'] / 1024 / 1024:.2f} MB)\n"
-        
-        if skipped_materials:
-            readme_content += f"\nMateriais que não puderam ser incluídos ({len(skipped_materials)}):\n"
-            for mat in skipped_materials:
-                readme_content += f"- {mat['praise_name']} - Material ID {mat['material_id']}: {mat.get('reason', 'Unknown reason')}\n"
-        
-        master_zip.writestr("README.txt", readme_content.encode('utf-8'))
-    
-    # Preparar resposta
-    master_zip_buffer.seek(0)
-    
-    # Criar nome do arquivo ZIP mestre
-    material_kind_name_safe = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in material_kind.name)
-    zip_filename = f"materials_{material_kind_name_safe}.zip"
-    
+
+    content = iter_ndjson(tag_id) if format == "ndjson" else iter_csv(tag_id)
     return StreamingResponse(
-        io.BytesIO(master_zip_buffer.read()),
-        media_type="application/zip",
-        headers={
-            "Content-Disposition": f'attachment; filename="{zip_filename}"',
-            "Content-Type": "application/zip"
-        }
+        content,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="praises.{format}"'},
     )
 
 
+@router.get("/download-by-material-kind", response_model=ArchiveJob, status_code=status.HTTP_202_ACCEPTED)
+def download_praises_by_material_kind(
+    request: Request,
+    material_kind_id: UUID = Query(..., description="ID do material kind para filtrar materiais"),
+    tag_id: Optional[UUID] = Query(None, description="ID da tag para filtrar praises (opcional)"),
+    max_zip_size_mb: int = Query(100, ge=10, le=1000, description="Tamanho máximo de cada ZIP em MB (padrão: 100)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Gera o download dos materiais de um material_kind específico de múltiplos praises
+    
+    Filtra praises por tag (se fornecido) e agrupa materiais do material_kind especificado.
+    O lote é montado em segundo plano: a resposta é o job (202), acompanhado em
+    GET /api/v1/archives/jobs/{job_id}; concluído, traz o manifesto com as URLs das partes.
+    """
+    apply_rate_limit(request, "600/minute")
+
+    request_key = {
+        "source": "download-by-material-kind",
+        "material_kind_id": str(material_kind_id),
+        "tag_id": str(tag_id) if tag_id else None,
+        "max_zip_size_mb": max_zip_size_mb,
+    }
+    job = archive_jobs.submit(
+        request_key,
+        collect=lambda: BulkDownloadService(db).items_by_material_kind(material_kind_id, tag_id),
+        max_part_bytes=max_zip_size_mb * 1024 * 1024,
+    )
+    return job_response(job)
+
+
 @router.get("/{praise_id}/download-zip")
 def download_praise_zip(
     request: Request,
@@ -291,214 +308,77 @@ def download_praise_zip(
     current_user: User = Depends(get_current_user),
     storage: StorageClient = Depends(get_storage)
 ):
-    """Baixa um praise completo em formato ZIP com todos os materiais de arquivo"""
+    """Baixa um praise completo em formato ZIP com todos os materiais de arquivo
+    
+    O ZIP é gerado em streaming: os arquivos são lidos do storage em blocos e comprimidos
+    à medida que são enviados, então o download começa imediatamente e a memória usada
+    não depende do tamanho dos materiais. Com PRAISE_ARCHIVE_CACHE_ENABLED o ZIP gerado
+    fica em disco e os próximos downloads (enquanto os materiais não mudarem) são servidos
+    direto do arquivo, sem reler o storage nem recomprimir (pelo nginx, com
+    ACCEL_REDIRECT_ENABLED).
+    """
     apply_rate_limit(request, "600/minute")
 
-    import logging
-    from app.core.config import settings
-    
-    logger = logging.getLogger(__name__)
-    
-    # Log da configuração de storage
-    logger.info(f"Storage mode: {settings.STORAGE_MODE}, Local path: {settings.STORAGE_LOCAL_PATH}")
-    
-    # Buscar praise e materiais
-    service = PraiseService(db)
-    praise = service.get_by_id(praise_id)
-    
-    # Garantir que os materiais estão carregados (refresh se necessário)
-    # O repository já carrega com joinedload, mas vamos garantir
-    db.refresh(praise, ['materials'])
-    
-    # Buscar tipo de material para filtrar apenas arquivos
-    material_type_repo = MaterialTypeRepository(db)
-    
-    # Log inicial: listar todos os materiais encontrados
-    logger.info(f"Processing {len(praise.materials)} materials for praise {praise_id} ({praise.name})")
-    
-    # Log detalhado de cada material encontrado
-    for idx, material in enumerate(praise.materials):
-        logger.info(f"Material {idx+1}/{len(praise.materials)}: ID={material.id}, path={material.path}, type_id={material.material_type_id}, kind_id={material.material_kind_id}")
-    
-    # Criar ZIP em memória
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        file_count = 0
-        non_file_materials = []
-        skipped_materials = []
-        
-        # Processar cada material
-        for material in praise.materials:
-            logger.info(f"Processing material {material.id}, path: {material.path}, type_id: {material.material_type_id}")
-            
-            material_type = material_type_repo.get_by_id(material.material_type_id)
-            
-            if not material_type:
-                logger.warning(f"Material type not found for material {material.id} (type_id: {material.material_type_id})")
-                skipped_materials.append({
-                    'material_id': str(material.id),
-                    'reason': f"Material type not found (type_id: {material.material_type_id})"
-                })
-                continue
-            
-            material_type_name = material_type.name.lower()
-            logger.info(f"Material {material.id} has type: {material_type.name} (normalized: {material_type_name})")
-            
-            # Se for arquivo (PDF ou AUDIO), baixar e adicionar ao ZIP
-            if material_type_name in ['pdf', 'audio']:
-                try:
-                    logger.info(f"Attempting to download file for material {material.id} from path: {material.path}")
-                    
-                    # Verificar se arquivo existe no storage ANTES de tentar baixar
-                    file_exists = storage.file_exists(material.path)
-                    logger.info(f"File exists check for {material.path}: {file_exists}")
-                    
-                    if not file_exists:
-                        logger.warning(f"✗ File does not exist in storage: {material.path} for material {material.id}")
-                        skipped_materials.append({
-                            'material_id': str(material.id),
-                            'path': material.path,
-                            'reason': "File does not exist in storage"
-                        })
-                        continue
-                    
-                    # Baixar arquivo do storage
-                    logger.info(f"Downloading file from storage: {material.path}")
-                    file_content = storage.download_file(material.path)
-                    logger.info(f"✓ Downloaded {len(file_content)} bytes for material {material.id}")
-                    
-                    if len(file_content) == 0:
-                        logger.warning(f"Downloaded file is empty for material {material.id}, path: {material.path}")
-                        skipped_materials.append({
-                            'material_id': str(material.id),
-                            'path': material.path,
-                            'reason': "Downloaded file is empty"
-                        })
-                        continue
-                    
-                    # Obter nome do material_kind para nomear o arquivo
-                    material_kind_name = "Unknown"
-                    if material.material_kind:
-                        material_kind_name = material.material_kind.name
-                    else:
-                        # Buscar material_kind se não estiver carregado
-                        from app.infrastructure.database.repositories.material_kind_repository import MaterialKindRepository
-                        material_kind_repo = MaterialKindRepository(db)
-                        material_kind = material_kind_repo.get_by_id(material.material_kind_id)
-                        if material_kind:
-                            material_kind_name = material_kind.name
-                    
-                    # Obter extensão do arquivo original
-                    file_ext = os.path.splitext(material.path)[1] or ('.pdf' if material_type_name == 'pdf' else '.mp3')
-                    
-                    # Criar nome do arquivo no ZIP: {material_kind_name}_{material_id}.{ext}
-                    # Sanitizar nome do material_kind para evitar problemas com caracteres especiais
-                    safe_material_kind_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in material_kind_name)
-                    zip_filename = f"{safe_material_kind_name}_{material.id}{file_ext}"
-                    
-                    # Adicionar ao ZIP
-                    zip_file.writestr(zip_filename, file_content)
-                    file_count += 1
-                    logger.info(f"✓ Added file to ZIP: {zip_filename} ({len(file_content)} bytes)")
-                    
-                except Exception as e:
-                    logger.error(f"✗ Error downloading file {material.path} for material {material.id}: {str(e)}", exc_info=True)
-                    skipped_materials.append({
-                        'material_id': str(material.id),
-                        'path': material.path,
-                        'reason': f"Error: {str(e)}"
-                    })
-                    # Continuar com outros arquivos mesmo se um falhar
-                    continue
-            else:
-                # Para materiais não-arquivo, adicionar informações ao README
-                logger.info(f"Material {material.id} is not a file type ({material_type.name}), skipping download")
-                non_file_materials.append({
-                    'material_kind': material.material_kind.name if material.material_kind else "Unknown",
-                    'material_type': material_type.name,
-                    'path': material.path
-                })
-        
-        logger.info(f"Total files added to ZIP: {file_count}")
-        if skipped_materials:
-            logger.warning(f"Skipped {len(skipped_materials)} materials: {skipped_materials}")
-        
-        # Criar arquivo README.txt com informações do praise e links externos
-        readme_content = f"Praise: {praise.name}\n"
-        if praise.number:
-            readme_content += f"Número: {praise.number}\n"
-        readme_content += f"\nMateriais de arquivo incluídos: {file_count}\n"
-        
-        if skipped_materials:
-            readme_content += f"\nMateriais que não puderam ser incluídos ({len(skipped_materials)}):\n"
-            for mat in skipped_materials:
-                readme_content += f"- Material ID {mat['material_id']}: {mat.get('reason', 'Unknown reason')}\n"
-                if 'path' in mat:
-                    readme_content += f"  Path: {mat['path']}\n"
-        
-        if non_file_materials:
-            readme_content += "\nMateriais externos (não incluídos no ZIP):\n"
-            for mat in non_file_materials:
-                readme_content += f"- {mat['material_kind']} ({mat['material_type']}): {mat['path']}\n"
-        
-        if praise.tags:
-            readme_content += "\nTags:\n"
-            for tag in praise.tags:
-                readme_content += f"- {tag.name}\n"
-        
-        zip_file.writestr("README.txt", readme_content.encode('utf-8'))
-        
-        # Criar arquivo README.txt com informações do praise e links externos
-        readme_content = f"Praise: {praise.name}\n"
-        if praise.number:
-            readme_content += f"Número: {praise.number}\n"
-        readme_content += f"\nMateriais de arquivo incluídos: {file_count}\n"
-        
-        if non_file_materials:
-            readme_content += "\nMateriais externos (não incluídos no ZIP):\n"
-            for mat in non_file_materials:
-                readme_content += f"- {mat['material_kind']} ({mat['material_type']}): {mat['path']}\n"
-        
-        if praise.tags:
-            readme_content += "\nTags:\n"
-            for tag in praise.tags:
-                readme_content += f"- {tag.name}\n"
-        
-        zip_file.writestr("README.txt", readme_content.encode('utf-8'))
-    
-    # Se não houver arquivos, ainda retornar ZIP com apenas o README
-    if file_count == 0:
-        logger.warning(f"No file materials found for praise {praise_id}")
-    
-    # Preparar resposta
-    zip_buffer.seek(0)
-    
-    # Criar nome do arquivo ZIP
-    praise_name_safe = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in praise.name)
-    if praise.number:
-        zip_filename = f"{praise_name_safe}_{praise.number}.zip"
-    else:
-        zip_filename = f"{praise_name_safe}.zip"
-    
+    # Tudo o que depende do banco e do storage (existência, tamanhos) é resolvido aqui
+    archive = PraiseArchive(db, praise_id, storage)
+    headers = {"Content-Disposition": f'attachment; filename="{archive.filename}"'}
+
+    if not settings.PRAISE_ARCHIVE_CACHE_ENABLED:
+        return StreamingResponse(archive.stream(), media_type="application/zip", headers=headers)
+
+    cached_path = praise_archive_cache.get(archive)
+    if cached_path is not None:
+        accelerated = accel_file_response(cached_path, "application/zip", headers)
+        if accelerated is not None:
+            return accelerated
+        return FileResponse(cached_path, media_type="application/zip", headers=headers)
+
     return StreamingResponse(
-        io.BytesIO(zip_buffer.read()),
+        praise_archive_cache.tee(archive, archive.stream()),
         media_type="application/zip",
-        headers={
-            "Content-Disposition": f'attachment; filename="{zip_filename}"',
-            "Content-Type": "application/zip"
-        }
+        headers=headers,
     )
 
 
+@router.post("/by-ids", response_model=PraiseByIdsResponse)
+def get_praises_by_ids(
+    request: Request,
+    data: PraiseByIdsRequest,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """Obtém vários praises por ID numa única requisição (ex.: telas de repertório).
+    
+    items segue a ordem de ids (repetidos aparecem uma vez); IDs inexistentes vêm em
+    missing_ids em vez de gerar 404.
+    
+    Rota pública: pode ser acessada sem autenticação, mas com rate limiting.
+    Usuários autenticados têm acesso ilimitado.
+    """
+    apply_rate_limit(request, "600/minute")
+
+    service = PraiseService(db)
+    documents, missing_ids = service.get_documents_by_ids(data.ids)
+    if settings.FAST_JSON_RESPONSES:
+        return ORJSONResponse(content={
+            "items": praise_documents_to_dicts(documents),
+            "missing_ids": [str(praise_id) for praise_id in missing_ids],
+        })
+    return {"items": documents, "missing_ids": missing_ids}
+
+
 @router.get("/{praise_id}", response_model=PraiseResponse)
 def get_praise(
     request: Request,
+    response: Response,
     praise_id: UUID,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
-    """Obtém um praise por ID.
+    """Obtém um praise por ID (do modelo de leitura praise_catalog_entries).
+    
+    ETag e Last-Modified vêm da última gravação do documento; If-None-Match ou
+    If-Modified-Since ainda válidos respondem 304 sem ler o documento.
     
     Rota pública: pode ser acessada sem autenticação, mas com rate limiting.
     Usuários autenticados têm acesso ilimitado.
@@ -507,8 +387,19 @@ def get_praise(
     apply_rate_limit(request, "600/minute")
     
     service = PraiseService(db)
-    praise = service.get_by_id(praise_id)
-    return praise
+    refreshed_at = service.get_document_refreshed_at(praise_id)
+    if refreshed_at is not None:
+        etag = make_etag("praise", praise_id, refreshed_at.isoformat())
+        if is_not_modified(request, etag, refreshed_at):
+            return not_modified_response(etag, refreshed_at)
+
+    document = service.get_document(praise_id)
+    if refreshed_at is None:
+        # Documento acabou de ser montado (primeira leitura)
+        refreshed_at = service.get_document_refreshed_at(praise_id)
+    if refreshed_at is not None:
+        set_validators(response, make_etag("praise", praise_id, refreshed_at.isoformat()), refreshed_at)
+    return document
 
 
 @router.post("/{praise_id}/review", response_model=PraiseResponse)
@@ -0,0 +1,308 @@
+"""
+Downloads em lote em segundo plano (jobs), com progresso consultável.
+
+POST /api/v1/archives/jobs registra o job e responde na hora (202) com o id, sem prender o
+worker da requisição enquanto o ZIP é montado. Um pool de ARCHIVE_JOB_WORKERS threads monta
+o lote com ArchiveSpool.create; o progresso (arquivos incluídos, bytes gravados, materiais não
+incluídos) é consultado em GET /api/v1/archives/jobs/{job_id} e, concluído, o job aponta para o
+lote, cujas partes são baixadas em GET /api/v1/archives/{archive_id}/parts/{arquivo}.
+
+O estado de cada job fica em {ARCHIVE_SPOOL_PATH}/jobs/{job_id}.json, então qualquer worker do
+uvicorn responde a consulta. Pedidos idênticos (mesmos material kinds, tags, operação e tamanho
+de parte) caem no mesmo job: jobs/key-{hash} aponta para o job do pedido, que é reaproveitado
+enquanto estiver na fila, rodando (processo vivo) ou com o lote ainda válido. A leitura e a troca
+da chave acontecem sob flock em jobs/.claim.lock (entre threads e workers), então dois pedidos
+nunca criam jobs para a mesma chave. Por isso os lotes dos jobs são compartilhados (sem dono).
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.application.services.archive_spool_service import (
+    ArchiveItem,
+    ArchiveSpool,
+    archive_spool,
+    manifest_with_urls,
+)
+from app.infrastructure.storage.storage_factory import get_storage_client
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+# Concluído, mas o lote já venceu (removido pela limpeza do spool)
+JOB_EXPIRED = "expired"
+
+# Intervalo mínimo entre gravações do progresso em disco
+_PROGRESS_SAVE_SECONDS = 1.0
+# Lote concluído só é reaproveitado se ainda restar esse tempo para baixá-lo
+_REUSE_MIN_REMAINING = timedelta(minutes=10)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ArchiveJobManager:
+    def __init__(self, spool: ArchiveSpool, max_workers: int):
+        self.spool = spool
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Jobs deste processo ainda não terminados (o estado em disco é a fonte da verdade)
+        self._active: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def jobs_dir(self) -> Path:
+        return self.spool.jobs_dir
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="archive-job")
+        return self._executor
+
+    def submit(
+        self,
+        request_key: Dict[str, Any],
+        collect: Callable[[], Tuple[List[ArchiveItem], str]],
+        max_part_bytes: int,
+    ) -> Dict[str, Any]:
+        """Job do pedido: reaproveita um job idêntico ou cria um novo na fila.
+
+        collect() seleciona os materiais (itens e título do README); só é chamado quando um
+        job novo é criado e suas HTTPException (400/404) chegam ao cliente.
+        """
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        key_digest = hashlib.sha256(json.dumps(request_key, sort_keys=True).encode("utf-8")).hexdigest()
+        key_path = self.jobs_dir / f"key-{key_digest}"
+
+        now = datetime.utcnow().isoformat()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": JOB_QUEUED,
+            "pid": os.getpid(),
+            "created_at": now,
+            "updated_at": now,
+            "files_total": 0,
+            "files_done": 0,
+            "bytes_written": 0,
+            "skipped": [],
+            "archive_id": None,
+            "error": None,
+        }
+        existing_id = self._claim_key(key_path, job)
+        if existing_id is not None:
+            return self.get(existing_id)
+        job_id = job["job_id"]
+
+        # Seleção fora de qualquer lock: outros pedidos não esperam a consulta dos materiais
+        try:
+            items, readme_title = collect()
+        except Exception as e:
+            with self._lock:
+                self._active.pop(job_id, None)
+            job.update(status=JOB_FAILED, error=e.detail if isinstance(e, HTTPException) else str(e))
+            self._save(job)
+            self._release_key(key_path, job_id)
+            raise
+
+        job["files_total"] = len(items)
+        self._save(job)
+        self._get_executor().submit(self._run, job, items, max_part_bytes, readme_title)
+        logger.info("Job de lote %s na fila: %d arquivos", job_id, len(items))
+        return dict(job)
+
+    def _claim_lock(self):
+        """Arquivo aberto com flock exclusivo (fechar libera): serializa leitura e troca das chaves."""
+        lock_file = open(self.jobs_dir / ".claim.lock", "a")
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+
+    def _claim_key(self, key_path: Path, job: Dict[str, Any]) -> Optional[str]:
+        """Reserva a chave para job (retorna None) ou retorna o id do job existente que a atende.
+
+        O estado do job é gravado antes da chave, então quem encontra a chave sempre encontra o
+        job; uma chave vencida é trocada com os.replace de um arquivo recém-gravado.
+        """
+        with self._claim_lock():
+            try:
+                existing_id = key_path.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
+                existing_id = None
+            if existing_id:
+                existing = self._read(existing_id)
+                if existing is not None and self._is_reusable(existing):
+                    return existing_id
+
+            with self._lock:
+                self._active[job["job_id"]] = job
+            self._save(job)
+            tmp_path = key_path.with_name(f".{key_path.name}.{job['job_id']}")
+            tmp_path.write_text(job["job_id"], encoding="utf-8")
+            os.replace(tmp_path, key_path)
+            return None
+
+    def _release_key(self, key_path: Path, job_id: str) -> None:
+        """Remove a chave se ela ainda aponta para job_id (job que falhou antes de entrar na fila)."""
+        with self._claim_lock():
+            try:
+                if key_path.read_text(encoding="utf-8").strip() == job_id:
+                    key_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _is_reusable(self, job: Dict[str, Any]) -> bool:
+        if job["status"] in (JOB_QUEUED, JOB_RUNNING):
+            if job["pid"] == os.getpid():
+                return job["job_id"] in self._active
+            return _pid_alive(job["pid"])
+        if job["status"] == JOB_COMPLETED:
+            expires_at = self.spool.expires_at(job["archive_id"])
+            return expires_at is not None and expires_at - datetime.utcnow() > _REUSE_MIN_REMAINING
+        return False
+
+    def _run(self, job: Dict[str, Any], items: List[ArchiveItem], max_part_bytes: int, readme_title: str) -> None:
+        job_id = job["job_id"]
+        last_save = 0.0
+
+        def progress(files_done: int, bytes_written: int, skipped: List[Dict[str, Any]]) -> None:
+            nonlocal last_save
+            job.update(files_done=files_done, bytes_written=bytes_written, skipped=list(skipped))
+            if time.monotonic() - last_save >= _PROGRESS_SAVE_SECONDS:
+                self._save(job)
+                last_save = time.monotonic()
+
+        job["status"] = JOB_RUNNING
+        self._save(job)
+        try:
+            manifest = self.spool.create(
+                owner_id=None,
+                items=items,
+                storage=get_storage_client(),
+                max_part_bytes=max_part_bytes,
+                readme_title=readme_title,
+                progress=progress,
+            )
+            job.update(
+                status=JOB_COMPLETED,
+                archive_id=manifest["archive_id"],
+                files_done=manifest["total_files"],
+                skipped=manifest["skipped"],
+            )
+        except Exception as e:
+            logger.exception("Erro no job de lote %s: %s", job_id, e)
+            job.update(status=JOB_FAILED, error=str(e))
+        finally:
+            self._save(job)
+            with self._lock:
+                self._active.pop(job_id, None)
+
+    def _save(self, job: Dict[str, Any]) -> None:
+        """Grava o estado (escrita atômica: quem consulta nunca lê um JSON pela metade)."""
+        job["updated_at"] = datetime.utcnow().isoformat()
+        path = self.jobs_dir / f"{job['job_id']}.json"
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}")
+        tmp_path.write_text(json.dumps(job), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _read(self, job_id: str) -> Optional[Dict[str, Any]]:
+        # job_id vem da URL: só aceitar o formato gerado (hex), nunca caminhos
+        if len(job_id) != 32 or any(c not in "0123456789abcdef" for c in job_id):
+            return None
+        try:
+            return json.loads((self.jobs_dir / f"{job_id}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        """Estado do job; 404 se não existe. Job concluído cujo lote venceu aparece como expired."""
+        job = self._read(job_id)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Archive job not found"
+            )
+        if job["status"] == JOB_COMPLETED:
+            expires_at = self.spool.expires_at(job["archive_id"])
+            if expires_at is None or expires_at <= datetime.utcnow():
+                job["status"] = JOB_EXPIRED
+        elif job["status"] in (JOB_QUEUED, JOB_RUNNING) and not self._is_reusable(job):
+            job["status"] = JOB_FAILED
+            job["error"] = "Job interrupted (server restarted)"
+        return job
+
+    def cleanup_expired(self) -> int:
+        """Remove estados de jobs terminados há mais de ARCHIVE_SPOOL_TTL_SECONDS e chaves órfãs."""
+        if not self.jobs_dir.exists():
+            return 0
+        limit = datetime.utcnow() - timedelta(seconds=self.spool.ttl_seconds)
+        removed = 0
+        for path in self.jobs_dir.glob("*.json"):
+            job = self._read(path.stem)
+            if job is None or (
+                job["status"] not in (JOB_QUEUED, JOB_RUNNING)
+                and datetime.fromisoformat(job["updated_at"]) <= limit
+            ):
+                path.unlink(missing_ok=True)
+                removed += 1
+        with self._claim_lock():
+            for key_path in self.jobs_dir.glob("key-*"):
+                try:
+                    job_id = key_path.read_text(encoding="utf-8").strip()
+                except OSError:
+                    continue
+                if not (self.jobs_dir / f"{job_id}.json").exists():
+                    key_path.unlink(missing_ok=True)
+        if removed:
+            logger.info("Jobs de lote: %d estado(s) vencido(s) removido(s)", removed)
+        return removed
+
+
+# Instância única por processo (o estado dos jobs fica no diretório do spool)
+archive_jobs = ArchiveJobManager(archive_spool, settings.ARCHIVE_JOB_WORKERS)
+
+
+def criteria_request_key(
+    tag_ids: List[Any],
+    material_kind_ids: List[Any],
+    operation: str,
+    max_zip_size_mb: int,
+) -> Dict[str, Any]:
+    """Chave de deduplicação de um lote por critérios (BulkDownloadService.items_by_criteria)."""
+    tag_ids = sorted({str(tag_id) for tag_id in tag_ids})
+    return {
+        "tag_ids": tag_ids,
+        "material_kind_ids": sorted({str(kind_id) for kind_id in material_kind_ids}),
+        # Com até uma tag, união e intersecção selecionam os mesmos materiais
+        "operation": operation if len(tag_ids) > 1 else "union",
+        "max_zip_size_mb": max_zip_size_mb,
+    }
+
+
+def job_response(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Estado para a API: sem o pid e, se concluído, com o manifesto do lote (URLs das partes)."""
+    response = {key: value for key, value in job.items() if key not in ("pid", "archive_id")}
+    response["archive"] = None
+    if job["status"] == JOB_COMPLETED:
+        manifest = archive_spool.read_manifest(job["archive_id"])
+        response["archive"] = manifest_with_urls(manifest) if manifest else None
+    return response
@@ -0,0 +1,304 @@
+"""
+Arquivos em lote (ZIP em partes) gravados em disco, em vez de um ZIP de ZIPs em memória.
+
+Cada download em lote vira um diretório em ARCHIVE_SPOOL_PATH:
+
+    {archive_id}/manifest.json   dono, validade, partes e materiais não incluídos
+    {archive_id}/part_001.zip    partes de até max_part_bytes (arquivos originais)
+    ...
+
+Os arquivos do storage são buscados em paralelo e à frente (app.core.storage_prefetch, com
+orçamento de memória) e copiados em blocos para a parte aberta, então a memória não depende
+do tamanho do lote. O diretório é montado com nome temporário e renomeado no final
+(nunca há manifesto de um lote incompleto). As partes são servidas por
+GET /api/v1/archives/{archive_id}/parts/{filename} com suporte a Range (download retomável)
+e removidas depois de ARCHIVE_SPOOL_TTL_SECONDS.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+from fastapi import HTTPException, status
+from app.core.archive_builder import ArchiveBuilder, peek_chunks
+from app.core.config import settings
+from app.core.security import create_archive_part_token
+from app.core.storage_prefetch import FileStat, prefetch_files
+from app.infrastructure.storage.storage_client import StorageClient
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+# Estado dos jobs em segundo plano (archive_job_service); ignorado pela limpeza dos lotes
+JOBS_DIRNAME = "jobs"
+_PARTIAL_PREFIX = ".partial-"
+
+# Progresso da montagem: (arquivos incluídos, bytes copiados, materiais não incluídos)
+ArchiveProgress = Callable[[int, int, List[Dict[str, Any]]], None]
+
+
+@dataclass
+class ArchiveItem:
+    """Arquivo do storage a incluir no lote, com o caminho dentro do ZIP."""
+    name: str
+    path: str
+    material_id: UUID
+    praise_name: str
+    # Metadados gravados no material; None: consultados no storage durante a montagem
+    stat: Optional[FileStat] = None
+
+
+def _part_filename(number: int) -> str:
+    return f"part_{number:03d}.zip"
+
+
+class ArchiveSpool:
+    def __init__(self, root: Path, ttl_seconds: int):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def jobs_dir(self) -> Path:
+        return self.root / JOBS_DIRNAME
+
+    def create(
+        self,
+        owner_id: Optional[UUID],
+        items: List[ArchiveItem],
+        storage: StorageClient,
+        max_part_bytes: int,
+        readme_title: str,
+        progress: Optional[ArchiveProgress] = None,
+    ) -> Dict[str, Any]:
+        """Grava o lote em partes no disco e retorna o manifesto.
+
+        Sem owner_id o lote é compartilhado (qualquer usuário autenticado com o id o acessa).
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        archive_id = uuid.uuid4().hex
+        work_dir = self.root / f"{_PARTIAL_PREFIX}{archive_id}"
+        work_dir.mkdir()
+        try:
+            parts, skipped = self._write_parts(work_dir, items, storage, max_part_bytes, progress)
+            self._append_readme(work_dir, parts, skipped, max_part_bytes, readme_title)
+            created_at = datetime.utcnow()
+            manifest = {
+                "archive_id": archive_id,
+                "owner_id": str(owner_id) if owner_id else None,
+                "created_at": created_at.isoformat(),
+                "expires_at": (created_at + timedelta(seconds=self.ttl_seconds)).isoformat(),
+                "total_files": sum(part["file_count"] for part in parts),
+                "parts": parts,
+                "skipped": skipped,
+            }
+            (work_dir / MANIFEST_FILENAME).write_text(json.dumps(manifest), encoding="utf-8")
+            os.rename(work_dir, self.root / archive_id)
+        except Exception:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
+        logger.info(
+            "Lote %s gravado: %d arquivos em %d partes (%d não incluídos)",
+            archive_id, manifest["total_files"], len(parts), len(skipped),
+        )
+        return manifest
+
+    def _write_parts(
+        self,
+        work_dir: Path,
+        items: List[ArchiveItem],
+        storage: StorageClient,
+        max_part_bytes: int,
+        progress: Optional[ArchiveProgress] = None,
+    ):
+        parts: List[Dict[str, Any]] = []
+        skipped: List[Dict[str, Any]] = []
+        archive: Optional[ArchiveBuilder] = None
+        part_bytes = 0
+        files_done = 0
+        bytes_written = 0
+
+        def close_part():
+            archive.close()
+            part = parts[-1]
+            part["size"] = (work_dir / part["filename"]).stat().st_size
+
+        # Metadados e conteúdo dos próximos arquivos são buscados em paralelo, na ordem dos itens
+        stats = [item.stat for item in items]
+        for item, fetched in prefetch_files(storage, items, path_of=lambda item: item.path, stats=stats):
+            def skip(reason: str):
+                logger.warning("Material %s não incluído no lote (%s): %s", item.material_id, item.path, reason)
+                skipped.append({
+                    "material_id": str(item.material_id),
+                    "praise_name": item.praise_name,
+                    "path": item.path,
+                    "reason": reason,
+                })
+
+            if progress is not None and (files_done or skipped):
+                progress(files_done, bytes_written, skipped)
+
+            if fetched.error is None and not fetched.stat.exists:
+                skip("File does not exist in storage")
+                continue
+            if fetched.error is None and fetched.stat.size == 0:
+                skip("Downloaded file is empty")
+                continue
+            try:
+                _, chunks = peek_chunks(fetched.chunks())
+            except Exception as e:
+                skip(f"Error: {e}")
+                continue
+
+            size = fetched.stat.size or 0
+            if archive is None or (part_bytes > 0 and part_bytes + size > max_part_bytes):
+                if archive is not None:
+                    close_part()
+                filename = _part_filename(len(parts) + 1)
+                archive = ArchiveBuilder(work_dir / filename)
+                parts.append({"filename": filename, "size": 0, "file_count": 0})
+                part_bytes = 0
+
+            # Falha no meio da cópia deixaria a parte inconsistente: aborta o lote inteiro
+            bytes_written += archive.add(item.name, chunks, size=fetched.stat.size)
+            part_bytes += size
+            parts[-1]["file_count"] += 1
+            files_done += 1
+
+        if archive is not None:
+            close_part()
+        if progress is not None:
+            progress(files_done, bytes_written, skipped)
+        return parts, skipped
+
+    def _append_readme(self, work_dir: Path, parts, skipped, max_part_bytes: int, title: str) -> None:
+        """README.txt na última parte (criada só com ele se nenhum arquivo foi incluído)."""
+        readme_content = f"{title}\n"
+        readme_content += "=" * len(title) + "\n\n"
+        readme_content += f"Total de arquivos: {sum(part['file_count'] for part in parts)}\n"
+        readme_content += f"Total de ZIPs criados: {len(parts) or 1}\n"
+        readme_content += f"Tamanho máximo por ZIP: {max_part_bytes // (1024 * 1024)} MB\n\n"
+        if parts:
+            readme_content += "ZIPs incluídos:\n"
+            for part in parts:
+                readme_content += f"- {part['filename']}: {part['file_count']} arquivos ({part['size'] / 1024 / 1024:.2f} MB)\n"
+        if skipped:
+            readme_content += f"\nMateriais não incluídos ({len(skipped)}):\n"
+            for mat in skipped:
+                readme_content += f"- {mat['praise_name']} - Material ID {mat['material_id']}: {mat['reason']}\n"
+
+        if not parts:
+            parts.append({"filename": _part_filename(1), "size": 0, "file_count": 0})
+        part = parts[-1]
+        part_path = work_dir / part["filename"]
+        with ArchiveBuilder(part_path, "a") as archive:
+            readme_bytes = readme_content.encode("utf-8")
+            archive.add("README.txt", [readme_bytes], size=len(readme_bytes))
+        part["size"] = part_path.stat().st_size
+
+    def get_manifest(self, archive_id: str, owner_id: Optional[UUID]) -> Dict[str, Any]:
+        """Manifesto de um lote do usuário (ou compartilhado) ainda válido; 404 caso contrário.
+
+        owner_id None: acesso já autorizado por URL assinada da parte (sem conferir o dono).
+        """
+        manifest = self.read_manifest(archive_id)
+        if (
+            manifest is None
+            or (owner_id is not None and manifest["owner_id"] not in (None, str(owner_id)))
+            or datetime.fromisoformat(manifest["expires_at"]) <= datetime.utcnow()
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Archive not found or expired"
+            )
+        return manifest
+
+    def get_part_path(self, archive_id: str, filename: str, owner_id: Optional[UUID]) -> Path:
+        manifest = self.get_manifest(archive_id, owner_id)
+        if filename not in {part["filename"] for part in manifest["parts"]}:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Archive part not found"
+            )
+        return self.root / archive_id / filename
+
+    def expires_at(self, archive_id: str) -> Optional[datetime]:
+        """Validade do lote, ou None se ele não existe (mais)."""
+        manifest = self.read_manifest(archive_id)
+        return datetime.fromisoformat(manifest["expires_at"]) if manifest else None
+
+    def read_manifest(self, archive_id: str) -> Optional[Dict[str, Any]]:
+        # archive_id vem da URL: só aceitar o formato gerado (hex), nunca caminhos
+        if len(archive_id) != 32 or any(c not in "0123456789abcdef" for c in archive_id):
+            return None
+        try:
+            return json.loads((self.root / archive_id / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def cleanup_expired(self) -> int:
+        """Remove lotes vencidos e diretórios temporários abandonados; retorna quantos removeu."""
+        if not self.root.exists():
+            return 0
+        now = datetime.utcnow()
+        removed = 0
+        for entry in self.root.iterdir():
+            if not entry.is_dir() or entry.name == JOBS_DIRNAME:
+                continue
+            if entry.name.startswith(_PARTIAL_PREFIX):
+                expired = time.time() - entry.stat().st_mtime > self.ttl_seconds
+            else:
+                manifest = self.read_manifest(entry.name)
+                expired = manifest is None or datetime.fromisoformat(manifest["expires_at"]) <= now
+            if expired:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        if removed:
+            logger.info("Spool de lotes: %d diretório(s) vencido(s) removido(s)", removed)
+        return removed
+
+
+def manifest_with_urls(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Manifesto para a API: sem o dono e com a URL assinada (?token=) de download de cada parte.
+
+    Só deve ser gerado para quem já tem acesso ao lote: a URL dispensa o header Authorization.
+    """
+    archive_id = manifest["archive_id"]
+    token = create_archive_part_token(archive_id)
+    return {
+        **{key: value for key, value in manifest.items() if key != "owner_id"},
+        "parts": [
+            {**part, "url": f"/api/v1/archives/{archive_id}/parts/{part['filename']}?token={token}"}
+            for part in manifest["parts"]
+        ],
+    }
+
+
+# Instância única por processo (workers compartilham o diretório)
+archive_spool = ArchiveSpool(Path(settings.ARCHIVE_SPOOL_PATH), settings.ARCHIVE_SPOOL_TTL_SECONDS)
+
+
+def start_archive_spool_cleaner(extra_cleanups: Iterable[Callable[[], int]] = ()) -> None:
+    """Remove lotes vencidos na inicialização e a cada ARCHIVE_SPOOL_CLEANUP_SECONDS.
+
+    extra_cleanups rodam no mesmo ciclo (ex.: estados dos jobs em segundo plano).
+    """
+    cleanups = [archive_spool.cleanup_expired, *extra_cleanups]
+
+    def _loop():
+        while True:
+            try:
+                for cleanup in cleanups:
+                    cleanup()
+            except Exception as e:
+                logger.exception("Erro ao limpar spool de lotes: %s", e)
+            time.sleep(settings.ARCHIVE_SPOOL_CLEANUP_SECONDS)
+
+    threading.Thread(target=_loop, name="archive-spool-cleaner", daemon=True).start()
@@ -0,0 +1,129 @@
+"""
+Seleção dos materiais de um download em lote.
+
+Monta a lista de ArchiveItem (arquivo do storage + caminho dentro do ZIP) das rotas de
+download em lote e dos jobs em segundo plano (archive_job_service). Só entram materiais de
+arquivo (pdf e audio); o nome no ZIP é {praise}/{material_kind}/{material_id}.{ext}.
+"""
+
+import os
+from typing import List, Optional, Tuple
+from uuid import UUID
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from app.application.services.archive_spool_service import ArchiveItem
+from app.application.services.material_file_service import stored_file_stat
+from app.application.services.praise_material_service import PraiseMaterialService
+from app.domain.models.praise_material import PraiseMaterial
+from app.infrastructure.database.repositories.material_kind_repository import MaterialKindRepository
+from app.infrastructure.database.repositories.material_type_repository import MaterialTypeRepository
+from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+
+FILE_MATERIAL_TYPES = ("pdf", "audio")
+BULK_OPERATIONS = ("union", "intersection")
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in name)
+
+
+class BulkDownloadService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.material_kind_repo = MaterialKindRepository(db)
+        self.material_type_repo = MaterialTypeRepository(db)
+
+    def _archive_item(self, material: PraiseMaterial, praise_name: str, material_kind_name: str) -> Optional[ArchiveItem]:
+        """ArchiveItem do material, ou None se ele não for de arquivo."""
+        material_type = self.material_type_repo.get_by_id(material.material_type_id)
+        if not material_type:
+            return None
+        material_type_name = material_type.name.lower()
+        if material_type_name not in FILE_MATERIAL_TYPES:
+            return None
+        file_ext = os.path.splitext(material.path)[1] or ('.pdf' if material_type_name == 'pdf' else '.mp3')
+        return ArchiveItem(
+            name=f"{_safe_name(praise_name)}/{_safe_name(material_kind_name)}/{material.id}{file_ext}",
+            path=material.path,
+            material_id=material.id,
+            praise_name=praise_name,
+            stat=stored_file_stat(material),
+        )
+
+    def items_by_material_kind(
+        self,
+        material_kind_id: UUID,
+        tag_id: Optional[UUID] = None,
+    ) -> Tuple[List[ArchiveItem], str]:
+        """Materiais de um material_kind dos praises (até 1000, filtrados por tag se informada).
+
+        Retorna os itens e o título do README do lote.
+        """
+        material_kind = self.material_kind_repo.get_by_id(material_kind_id)
+        if not material_kind:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"MaterialKind with id {material_kind_id} not found"
+            )
+
+        # Entidades ORM (não os documentos de PraiseService.get_all): os materiais são lidos abaixo
+        # Usar limite reduzido para evitar sobrecarga
+        praises = PraiseRepository(self.db).get_all_filtered_sorted(skip=0, limit=1000, tag_id=tag_id)
+
+        items = []
+        for praise in praises:
+            for material in praise.materials:
+                if material.material_kind_id != material_kind_id:
+                    continue
+                item = self._archive_item(material, praise.name, material_kind.name)
+                if item:
+                    items.append(item)
+
+        if not items:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No file materials found for material_kind {material_kind_id}"
+            )
+        return items, f"Download de Materiais: {material_kind.name}"
+
+    def items_by_criteria(
+        self,
+        tag_ids: Optional[List[UUID]],
+        material_kind_ids: Optional[List[UUID]],
+        operation: str = "union",
+    ) -> Tuple[List[ArchiveItem], str]:
+        """Materiais por critérios (tags e/ou material kinds, união ou intersecção das tags).
+
+        Retorna os itens e o título do README do lote.
+        """
+        if not tag_ids and not material_kind_ids:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide at least tag_ids or material_kind_ids"
+            )
+
+        if operation not in BULK_OPERATIONS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="operation must be 'union' or 'intersection'"
+            )
+
+        materials = PraiseMaterialService(self.db).get_by_criteria(
+            tag_ids=tag_ids,
+            material_kind_ids=material_kind_ids,
+            operation=operation,
+        )
+
+        items = []
+        for material in materials:
+            material_kind_name = material.material_kind.name if material.material_kind else "material"
+            item = self._archive_item(material, material.praise.name, material_kind_name)
+            if item:
+                items.append(item)
+
+        if not items:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No file materials found for the given criteria"
+            )
+        return items, "Download de Materiais em Lote"
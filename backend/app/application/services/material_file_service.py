@@ -0,0 +1,168 @@
+"""
+Metadados dos arquivos dos materiais (PDF/áudio) gravados em praise_materials.
+
+Tamanho, content type, checksum (sha256), data de modificação e caminho absoluto no disco ficam
+no registro do material. Downloads, ZIPs e URLs usam o registro em vez de consultar o storage a
+cada requisição (exists/is_file/stat em até dois caminhos candidatos).
+
+No upload, tamanho e checksum são calculados enquanto o arquivo é gravado (HashingReader), sem
+reler o arquivo do storage. Materiais criados só com o path (arquivo já no storage) gravam
+tamanho e data sem checksum; scripts/reconcile_material_files.py calcula os checksums que
+faltam e repara divergências (arquivo trocado ou removido fora da API).
+"""
+
+import hashlib
+import logging
+import mimetypes
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import BinaryIO, Optional
+
+from app.core.storage_prefetch import FileStat
+from app.domain.models.praise_material import PraiseMaterial
+from app.infrastructure.storage.storage_client import StorageClient
+from app.infrastructure.storage.storage_factory import get_storage_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MaterialFileMetadata:
+    file_size: int
+    content_type: str
+    checksum: Optional[str]  # None: ainda não calculado (preenchido pelo reconcile)
+    resolved_path: Optional[str]
+    file_modified_at: datetime  # UTC sem fuso, como as demais colunas DateTime do projeto
+
+
+class HashingReader:
+    """Envolve o arquivo enviado ao storage e calcula tamanho e sha256 do que foi lido.
+
+    Sem seek/tell de propósito: o storage lê o conteúdo uma única vez, em sequência
+    (no Wasabi, o upload multipart não volta ao início do arquivo para reenviar partes).
+    """
+
+    def __init__(self, file_obj: BinaryIO):
+        self._file = file_obj
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._digest.update(data)
+        self.size += len(data)
+        return data
+
+    @property
+    def checksum(self) -> str:
+        return self._digest.hexdigest()
+
+
+def guess_content_type(path: str) -> str:
+    content_type, _ = mimetypes.guess_type(path)
+    return content_type or "application/octet-stream"
+
+
+def _modified_at(mtime: Optional[float]) -> datetime:
+    modified_at = datetime.fromtimestamp(mtime, tz=timezone.utc) if mtime is not None else datetime.now(timezone.utc)
+    return modified_at.replace(tzinfo=None)
+
+
+def read_file_metadata(
+    storage: StorageClient, path: str, checksum: bool = True
+) -> Optional[MaterialFileMetadata]:
+    """Metadados do arquivo no storage; None se não existe.
+
+    Com checksum=True lê o conteúdo inteiro; com False usa só stat/HEAD e deixa o checksum vazio.
+    """
+    resolved_path = storage.local_path(path)
+    if resolved_path is None and not storage.file_exists(path):
+        return None
+    digest = None
+    if checksum:
+        hasher = hashlib.sha256()
+        size = 0
+        for chunk in storage.iter_chunks(resolved_path or path):
+            hasher.update(chunk)
+            size += len(chunk)
+        digest = hasher.hexdigest()
+    if resolved_path:
+        stat = os.stat(resolved_path)
+        size = size if checksum else stat.st_size
+        mtime = stat.st_mtime
+    else:
+        size = size if checksum else storage.get_file_size(path)
+        mtime = storage.get_file_mtime(path)
+    if size is None:
+        return None
+    return MaterialFileMetadata(
+        file_size=size,
+        content_type=guess_content_type(path),
+        checksum=digest,
+        resolved_path=resolved_path,
+        file_modified_at=_modified_at(mtime),
+    )
+
+
+def uploaded_file_metadata(storage: StorageClient, path: str, reader: HashingReader) -> MaterialFileMetadata:
+    """Metadados de um arquivo recém-enviado por upload_file(reader, ...), sem relê-lo."""
+    resolved_path = storage.local_path(path)
+    # Local: um stat do arquivo gravado; Wasabi: o objeto acabou de ser criado
+    mtime = os.stat(resolved_path).st_mtime if resolved_path else None
+    return MaterialFileMetadata(
+        file_size=reader.size,
+        content_type=guess_content_type(path),
+        checksum=reader.checksum,
+        resolved_path=resolved_path,
+        file_modified_at=_modified_at(mtime),
+    )
+
+
+def apply_file_metadata(material: PraiseMaterial, metadata: Optional[MaterialFileMetadata]) -> None:
+    """Grava os metadados no material (None limpa: arquivo ausente ou material sem arquivo)."""
+    material.file_size = metadata.file_size if metadata else None
+    material.content_type = metadata.content_type if metadata else None
+    material.checksum = metadata.checksum if metadata else None
+    material.resolved_path = metadata.resolved_path if metadata else None
+    material.file_modified_at = metadata.file_modified_at if metadata else None
+
+
+def record_file_metadata(
+    material: PraiseMaterial, storage: Optional[StorageClient] = None, checksum: bool = False
+) -> None:
+    """Grava no material (sem commit) os metadados do arquivo já existente no storage.
+
+    Por padrão só stat/HEAD (sem baixar o arquivo): o checksum fica para o reconcile. Falhas não
+    interrompem a escrita do material: os campos ficam vazios e os leitores voltam a consultar
+    o storage até o próximo reconcile.
+    """
+    try:
+        metadata = read_file_metadata(storage or get_storage_client(), material.path, checksum=checksum)
+        apply_file_metadata(material, metadata)
+    except Exception as e:
+        logger.warning("Não foi possível ler os metadados do arquivo %s (material %s): %s", material.path, material.id, e)
+        apply_file_metadata(material, None)
+
+
+def stored_file_stat(material: PraiseMaterial) -> Optional[FileStat]:
+    """FileStat a partir do registro (None se os metadados ainda não foram gravados)."""
+    if material.file_size is None or material.file_modified_at is None:
+        return None
+    mtime = material.file_modified_at.replace(tzinfo=timezone.utc).timestamp()
+    return FileStat(exists=True, size=material.file_size, mtime=mtime)
+
+
+def recorded_file_is_current(material: PraiseMaterial) -> bool:
+    """True se o registro identifica o conteúdo (checksum) e o arquivo no caminho gravado ainda
+    tem o tamanho e a data registrados (um único stat, sem procurar caminhos candidatos)."""
+    if not material.checksum or not material.resolved_path:
+        return False
+    recorded = stored_file_stat(material)
+    if recorded is None:
+        return False
+    try:
+        stat = os.stat(material.resolved_path)
+    except OSError:
+        return False
+    return stat.st_size == recorded.size and abs(stat.st_mtime - recorded.mtime) < 0.001
@@ -5,11 +5,14 @@ from fastapi import HTTPException, status
 from app.domain.models.material_kind import MaterialKind
 from app.domain.schemas.material_kind import MaterialKindCreate, MaterialKindUpdate
 from app.infrastructure.database.repositories.material_kind_repository import MaterialKindRepository
+from app.application.services.praise_catalog_service import PraiseCatalogService
+from app.application.services.praise_archive_service import invalidate_material_kind_archives
 
 
 class MaterialKindService:
     def __init__(self, db: Session):
         self.repository = MaterialKindRepository(db)
+        self.catalog = PraiseCatalogService(db)
 
     def get_by_id(self, kind_id: UUID) -> MaterialKind:
         kind = self.repository.get_by_id(kind_id)
@@ -48,10 +51,15 @@ class MaterialKindService:
                 )
             kind.name = kind_data.name
         
-        return self.repository.update(kind)
+        kind = self.repository.update(kind)
+        self.catalog.invalidate_material_kind(kind_id)
+        invalidate_material_kind_archives(self.repository.db, kind_id)
+        return kind
 
     def delete(self, kind_id: UUID) -> bool:
         kind = self.get_by_id(kind_id)
+        self.catalog.invalidate_material_kind(kind_id)
+        invalidate_material_kind_archives(self.repository.db, kind_id)
         return self.repository.delete(kind_id)
 
 
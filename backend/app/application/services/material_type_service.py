@@ -5,11 +5,13 @@ from fastapi import HTTPException, status
 from app.domain.models.material_type import MaterialType
 from app.domain.schemas.material_type import MaterialTypeCreate, MaterialTypeUpdate
 from app.infrastructure.database.repositories.material_type_repository import MaterialTypeRepository
+from app.application.services.praise_catalog_service import PraiseCatalogService
 
 
 class MaterialTypeService:
     def __init__(self, db: Session):
         self.repository = MaterialTypeRepository(db)
+        self.catalog = PraiseCatalogService(db)
 
     def get_by_id(self, type_id: UUID) -> MaterialType:
         material_type = self.repository.get_by_id(type_id)
@@ -48,8 +50,11 @@ class MaterialTypeService:
                 )
             material_type.name = type_data.name
         
-        return self.repository.update(material_type)
+        material_type = self.repository.update(material_type)
+        self.catalog.invalidate_material_type(type_id)
+        return material_type
 
     def delete(self, type_id: UUID) -> bool:
         material_type = self.get_by_id(type_id)
+        self.catalog.invalidate_material_type(type_id)
         return self.repository.delete(type_id)
@@ -0,0 +1,351 @@
+"""
+ZIP de um praise (GET /api/v1/praises/{id}/download-zip) e cache em disco dos ZIPs gerados.
+
+O conteúdo do ZIP é identificado por um digest do que entra nele: nome da entrada (inclui o nome
+do material kind), id, path, tamanho e data de modificação de cada material de arquivo, mais os
+dados do README (nome, número, tags, materiais externos e não incluídos). O ZIP gerado fica em {PRAISE_ARCHIVE_CACHE_PATH}/{praise_id}/{digest}.zip:
+
+- hit: o arquivo é servido direto do disco (FileResponse), sem reler o storage nem recomprimir;
+- miss: o ZIP é gerado em streaming para o cliente e, ao mesmo tempo, gravado no cache; só é
+  publicado (rename) se terminou inteiro e sem falhas de leitura.
+
+Como a chave muda com o conteúdo, um ZIP antigo nunca é servido; a invalidação feita pelas
+escritas de materiais e de material kinds (invalidate_praise_archive,
+invalidate_material_kind_archives) apenas libera o disco dos praises e, com
+PRAISE_ARCHIVE_CACHE_PREWARM, agenda a geração do novo ZIP em segundo plano. O tamanho total é
+limitado por PRAISE_ARCHIVE_CACHE_MAX_BYTES (remove os menos usados).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.storage_prefetch import FileStat, prefetch_files, stat_files
+from app.core.zip_stream import ZipStreamEntry, stream_zip
+from app.infrastructure.database.database import SessionLocal
+from app.infrastructure.database.repositories.material_type_repository import MaterialTypeRepository
+from app.infrastructure.database.repositories.praise_material_repository import PraiseMaterialRepository
+from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+from app.infrastructure.storage.storage_client import StorageClient
+from app.infrastructure.storage.storage_factory import get_storage_client
+from app.application.services.material_file_service import stored_file_stat
+
+logger = logging.getLogger(__name__)
+
+# Mudanças no formato do ZIP (nomes das entradas, README) devem alterar a versão
+_ARCHIVE_FORMAT_VERSION = 1
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in name)
+
+
+class PraiseArchive:
+    """Conteúdo do ZIP de um praise, resolvido no banco e no storage antes do streaming."""
+
+    def __init__(self, db: Session, praise_id: UUID, storage: StorageClient):
+        praise = PraiseRepository(db).get_by_id(praise_id)
+        if not praise:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resource not found"
+            )
+        # Garantir que os materiais estão carregados (refresh se necessário)
+        db.refresh(praise, ['materials'])
+        material_type_repo = MaterialTypeRepository(db)
+
+        self.praise_id = praise.id
+        self.praise_name = praise.name
+        self.praise_number = praise.number
+        self.tag_names = [tag.name for tag in praise.tags]
+        self.storage = storage
+        # Arquivos do ZIP: (nome no ZIP, path no storage, metadados)
+        self._files: List[Tuple[str, str, FileStat]] = []
+        self.non_file_materials: List[Dict[str, Any]] = []
+        self.skipped_materials: List[Dict[str, Any]] = []
+        # Falhas de leitura durante o streaming (o ZIP sai sem o arquivo e não vai para o cache)
+        self.failures: List[Dict[str, Any]] = []
+        self._entry_materials: Dict[str, Dict[str, Any]] = {}
+        digest_files = []
+
+        logger.info(f"Processing {len(praise.materials)} materials for praise {praise_id} ({praise.name})")
+
+        file_materials = []
+        for material in praise.materials:
+            material_type = material_type_repo.get_by_id(material.material_type_id)
+
+            if not material_type:
+                logger.warning(f"Material type not found for material {material.id} (type_id: {material.material_type_id})")
+                self.skipped_materials.append({
+                    'material_id': str(material.id),
+                    'reason': f"Material type not found (type_id: {material.material_type_id})"
+                })
+                continue
+
+            material_type_name = material_type.name.lower()
+
+            if material_type_name not in ['pdf', 'audio']:
+                # Para materiais não-arquivo, adicionar informações ao README
+                self.non_file_materials.append({
+                    'material_kind': material.material_kind.name if material.material_kind else "Unknown",
+                    'material_type': material_type.name,
+                    'path': material.path
+                })
+                continue
+
+            file_materials.append((material, material_type_name))
+
+        # Tamanho e data gravados no material; os que ainda não têm metadados são consultados
+        # em paralelo no storage
+        file_stats = [stored_file_stat(material) for material, _ in file_materials]
+        unknown = [index for index, file_stat in enumerate(file_stats) if file_stat is None]
+        probed = stat_files(storage, [file_materials[index][0].path for index in unknown], with_mtime=True)
+        for index, file_stat in zip(unknown, probed):
+            file_stats[index] = file_stat
+
+        for (material, material_type_name), file_stat in zip(file_materials, file_stats):
+            # Verificar se arquivo existe no storage ANTES de incluir no ZIP
+            if not file_stat.exists:
+                logger.warning(f"✗ File does not exist in storage: {material.path} for material {material.id}")
+                self.skipped_materials.append({
+                    'material_id': str(material.id),
+                    'path': material.path,
+                    'reason': "File does not exist in storage"
+                })
+                continue
+
+            if file_stat.size == 0:
+                logger.warning(f"File is empty for material {material.id}, path: {material.path}")
+                self.skipped_materials.append({
+                    'material_id': str(material.id),
+                    'path': material.path,
+                    'reason': "Downloaded file is empty"
+                })
+                continue
+
+            material_kind_name = material.material_kind.name if material.material_kind else "Unknown"
+
+            # Criar nome do arquivo no ZIP: {material_kind_name}_{material_id}.{ext}
+            file_ext = os.path.splitext(material.path)[1] or ('.pdf' if material_type_name == 'pdf' else '.mp3')
+            entry_name = f"{_safe_name(material_kind_name)}_{material.id}{file_ext}"
+            self._files.append((entry_name, material.path, file_stat))
+            # Para o README, caso a leitura falhe durante o streaming
+            self._entry_materials[entry_name] = {'material_id': str(material.id), 'path': material.path}
+            digest_files.append([entry_name, str(material.id), material.path, file_stat.size, file_stat.mtime])
+
+        if praise.number:
+            self.filename = f"{_safe_name(praise.name)}_{praise.number}.zip"
+        else:
+            self.filename = f"{_safe_name(praise.name)}.zip"
+
+        self.digest = hashlib.sha256(json.dumps({
+            "version": _ARCHIVE_FORMAT_VERSION,
+            "praise": [self.praise_name, self.praise_number, sorted(self.tag_names)],
+            "files": digest_files,
+            "non_file": self.non_file_materials,
+            "skipped": self.skipped_materials,
+        }, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _on_entry_error(self, entry: ZipStreamEntry, error: Exception) -> None:
+        material_info = self._entry_materials[entry.name]
+        logger.error(f"✗ Error reading file {material_info['path']} for material {material_info['material_id']}: {error}")
+        self.failures.append({**material_info, 'reason': f"Error: {error}"})
+
+    def _build_readme(self) -> List[bytes]:
+        # Montado por último: já conhece os arquivos que falharam durante o streaming
+        file_count = len(self._files) - len(self.failures)
+        skipped = self.skipped_materials + self.failures
+        logger.info(f"Total files added to ZIP: {file_count}")
+        if skipped:
+            logger.warning(f"Skipped {len(skipped)} materials: {skipped}")
+
+        readme_content = f"Praise: {self.praise_name}\n"
+        if self.praise_number:
+            readme_content += f"Número: {self.praise_number}\n"
+        readme_content += f"\nMateriais de arquivo incluídos: {file_count}\n"
+
+        if skipped:
+            readme_content += f"\nMateriais que não puderam ser incluídos ({len(skipped)}):\n"
+            for mat in skipped:
+                readme_content += f"- Material ID {mat['material_id']}: {mat.get('reason', 'Unknown reason')}\n"
+                if 'path' in mat:
+                    readme_content += f"  Path: {mat['path']}\n"
+
+        if self.non_file_materials:
+            readme_content += "\nMateriais externos (não incluídos no ZIP):\n"
+            for mat in self.non_file_materials:
+                readme_content += f"- {mat['material_kind']} ({mat['material_type']}): {mat['path']}\n"
+
+        if self.tag_names:
+            readme_content += "\nTags:\n"
+            for tag_name in self.tag_names:
+                readme_content += f"- {tag_name}\n"
+
+        return [readme_content.encode('utf-8')]
+
+    def _entries(self) -> Iterator[ZipStreamEntry]:
+        # Os próximos arquivos são baixados em paralelo enquanto o ZIP grava o atual
+        prefetched = prefetch_files(
+            self.storage,
+            self._files,
+            path_of=lambda file: file[1],
+            stats=[file_stat for _, _, file_stat in self._files],
+        )
+        for (entry_name, _, file_stat), fetched in prefetched:
+            yield ZipStreamEntry(name=entry_name, open_chunks=fetched.chunks, size=file_stat.size)
+        yield ZipStreamEntry(name="README.txt", open_chunks=self._build_readme)
+
+    def stream(self) -> Iterator[bytes]:
+        """Bytes do ZIP: arquivos do storage lidos em blocos e README.txt no final."""
+        return stream_zip(self._entries(), on_error=self._on_entry_error)
+
+
+class PraiseArchiveCache:
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._evict_lock = threading.Lock()
+
+    def _path(self, praise_id: UUID, digest: str) -> Path:
+        return self.root / str(praise_id) / f"{digest}.zip"
+
+    def get(self, archive: PraiseArchive) -> Optional[Path]:
+        """ZIP já gerado para o conteúdo atual do praise, ou None."""
+        path = self._path(archive.praise_id, archive.digest)
+        try:
+            # mtime marca o último uso (a limpeza por tamanho remove os mais antigos)
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def tee(self, archive: PraiseArchive, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Repassa os bytes do ZIP e grava uma cópia; publica no cache se o ZIP saiu completo.
+
+        Falhas ao gravar a cópia (ex.: disco cheio) só desligam o cache desta geração: o
+        download do cliente continua. Cliente que desconecta no meio descarta a cópia.
+        """
+        final_path = self._path(archive.praise_id, archive.digest)
+        tmp_path = final_path.with_name(f".tmp-{uuid.uuid4().hex}")
+        target = None
+        try:
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+            target = open(tmp_path, "wb")
+        except OSError as e:
+            logger.warning("Cache de ZIP indisponível para praise %s: %s", archive.praise_id, e)
+
+        complete = False
+        try:
+            for chunk in chunks:
+                if target is not None:
+                    try:
+                        target.write(chunk)
+                    except OSError as e:
+                        logger.warning("Erro ao gravar ZIP do praise %s no cache: %s", archive.praise_id, e)
+                        target.close()
+                        target = None
+                yield chunk
+            complete = True
+        finally:
+            if target is not None:
+                target.close()
+                if complete and not archive.failures:
+                    try:
+                        os.replace(tmp_path, final_path)
+                    except OSError:
+                        # Praise invalidado durante a geração: o diretório (e a cópia) já foi removido
+                        tmp_path.unlink(missing_ok=True)
+                    else:
+                        self._evict()
+                else:
+                    tmp_path.unlink(missing_ok=True)
+            else:
+                tmp_path.unlink(missing_ok=True)
+
+    def build(self, archive: PraiseArchive) -> None:
+        """Gera e publica o ZIP sem cliente (pré-aquecimento)."""
+        if self.get(archive) is not None:
+            return
+        for _ in self.tee(archive, archive.stream()):
+            pass
+
+    def invalidate(self, praise_id: UUID) -> None:
+        """Remove os ZIPs do praise (inclusive gerações em andamento, que não são publicadas)."""
+        shutil.rmtree(self.root / str(praise_id), ignore_errors=True)
+
+    def _evict(self) -> None:
+        """Mantém o total abaixo de max_bytes removendo os ZIPs usados há mais tempo."""
+        with self._evict_lock:
+            files = []
+            for path in self.root.glob("*/*.zip"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                try:
+                    path.parent.rmdir()  # só remove se era o último ZIP do praise
+                except OSError:
+                    pass
+
+
+# Instância única por processo (workers compartilham o diretório)
+praise_archive_cache = PraiseArchiveCache(
+    Path(settings.PRAISE_ARCHIVE_CACHE_PATH),
+    settings.PRAISE_ARCHIVE_CACHE_MAX_BYTES,
+)
+
+# Pré-aquecimento: uma thread, para não competir com os downloads pelo storage
+_prewarm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="praise-archive-prewarm")
+
+
+def _prewarm(praise_id: UUID) -> None:
+    db = SessionLocal()
+    try:
+        praise_archive_cache.build(PraiseArchive(db, praise_id, get_storage_client()))
+    except Exception as e:
+        logger.exception("Erro ao pré-gerar ZIP do praise %s: %s", praise_id, e)
+    finally:
+        db.close()
+
+
+def invalidate_praise_archive(praise_id: UUID, prewarm: bool = True) -> None:
+    """Descarta os ZIPs do praise após uma escrita nos materiais (e agenda o novo, se configurado)."""
+    if not settings.PRAISE_ARCHIVE_CACHE_ENABLED:
+        return
+    try:
+        praise_archive_cache.invalidate(praise_id)
+        if prewarm and settings.PRAISE_ARCHIVE_CACHE_PREWARM:
+            _prewarm_executor.submit(_prewarm, praise_id)
+    except Exception as e:
+        logger.exception("Erro ao invalidar cache de ZIP do praise %s: %s", praise_id, e)
+        # Fail-safe: não propagar exceção para não quebrar a operação principal
+
+
+def invalidate_material_kind_archives(db: Session, material_kind_id: UUID) -> None:
+    """Descarta os ZIPs dos praises com materiais do kind (renomeado ou removido: nomes das entradas)."""
+    if not settings.PRAISE_ARCHIVE_CACHE_ENABLED:
+        return
+    try:
+        praise_ids = PraiseMaterialRepository(db).get_praise_ids_by_material_kind(material_kind_id)
+    except Exception as e:
+        logger.exception("Erro ao listar praises do material kind %s para o cache de ZIP: %s", material_kind_id, e)
+        return
+    for praise_id in praise_ids:
+        invalidate_praise_archive(praise_id, prewarm=False)
@@ -0,0 +1,131 @@
+"""
+Modelo de leitura desnormalizado dos praises (tabela praise_catalog_entries).
+
+Cada linha guarda o PraiseResponse já serializado, então GET /api/v1/praises e
+GET /api/v1/praises/{id} leem uma única tabela por chave primária em vez de remontar
+o grafo praises + tags + materiais + kinds/types.
+
+Manutenção incremental:
+- PraiseService e PraiseMaterialService chamam refresh() após cada escrita;
+- renomear/remover tag, material kind ou material type invalida (apaga) as linhas afetadas;
+- linhas ausentes (invalidadas, praises novos de scripts) são montadas em memória na leitura,
+  sem escrita na transação da requisição, e gravadas depois por uma thread de fundo;
+- no deploy, scripts/rebuild_praise_catalog.py --missing preenche as linhas que faltam.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.domain.models.praise import Praise
+from app.domain.schemas.praise import PraiseResponse
+from app.infrastructure.database.database import SessionLocal
+from app.infrastructure.database.repositories.praise_catalog_repository import PraiseCatalogRepository
+from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+
+logger = logging.getLogger(__name__)
+
+# Gravação das linhas ausentes encontradas nas leituras: uma thread, fora das requisições
+_fill_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="praise-catalog-fill")
+_fill_lock = threading.Lock()
+_fill_pending: Set[UUID] = set()
+
+
+def build_catalog_document(praise: Praise) -> Dict[str, Any]:
+    """Serializa o praise (com tags e materiais carregados) no formato de PraiseResponse."""
+    return PraiseResponse.model_validate(praise).model_dump(mode="json")
+
+
+class PraiseCatalogService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = PraiseCatalogRepository(db)
+        self.praise_repo = PraiseRepository(db)
+
+    def get_document(self, praise_id: UUID) -> Optional[Dict[str, Any]]:
+        """Documento do praise; se ainda não existir no modelo de leitura, monta em memória."""
+        document = self.repository.get_document(praise_id)
+        if document is not None:
+            return document
+        praise = self.praise_repo.get_by_id(praise_id)
+        if not praise:
+            return None
+        schedule_catalog_fill([praise.id])
+        return build_catalog_document(praise)
+
+    def get_refreshed_at(self, praise_id: UUID) -> Optional[datetime]:
+        """Data da última gravação do documento (None se ainda não existe no modelo de leitura)."""
+        return self.repository.get_refreshed_at(praise_id)
+
+    def get_documents(self, praise_ids: List[UUID]) -> List[Dict[str, Any]]:
+        """Documentos na ordem dos IDs; os ausentes são montados em memória numa única hidratação."""
+        documents = self.repository.get_documents(praise_ids)
+        missing = [praise_id for praise_id in praise_ids if praise_id not in documents]
+        if missing:
+            built = {praise.id: build_catalog_document(praise) for praise in self.praise_repo.get_by_ids(missing)}
+            schedule_catalog_fill(built)
+            documents.update(built)
+        return [documents[praise_id] for praise_id in praise_ids if praise_id in documents]
+
+    def refresh(self, praise: Optional[Praise]) -> None:
+        """Regrava o documento após uma escrita (praise com tags e materiais carregados)."""
+        if praise is None:
+            return
+        self._store({praise.id: build_catalog_document(praise)})
+
+    def invalidate_tag(self, tag_id: UUID) -> None:
+        self._invalidate(self.repository.delete_by_tag, tag_id)
+
+    def invalidate_material_kind(self, material_kind_id: UUID) -> None:
+        self._invalidate(self.repository.delete_by_material_kind, material_kind_id)
+
+    def invalidate_material_type(self, material_type_id: UUID) -> None:
+        self._invalidate(self.repository.delete_by_material_type, material_type_id)
+
+    def _store(self, documents: Dict[UUID, Dict[str, Any]]) -> None:
+        try:
+            self.repository.upsert_many(documents)
+        except Exception as e:
+            # Fail-safe: a escrita principal já foi confirmada; sem a linha, a próxima leitura remonta
+            logger.exception("Erro ao gravar modelo de leitura de %d praise(s): %s", len(documents), e)
+            self.db.rollback()
+            self._invalidate(self.repository.delete_many, list(documents))
+
+    def _invalidate(self, delete, key) -> None:
+        try:
+            delete(key)
+        except Exception as e:
+            logger.exception("Erro ao invalidar modelo de leitura (%s): %s", key, e)
+            self.db.rollback()
+
+
+def _fill_missing(praise_ids: List[UUID]) -> None:
+    db = SessionLocal()
+    try:
+        praises = PraiseRepository(db).get_by_ids(praise_ids)
+        PraiseCatalogRepository(db).insert_missing(
+            {praise.id: build_catalog_document(praise) for praise in praises}
+        )
+    except Exception as e:
+        logger.exception("Erro ao gravar modelo de leitura de %d praise(s): %s", len(praise_ids), e)
+        db.rollback()
+    finally:
+        db.close()
+        with _fill_lock:
+            _fill_pending.difference_update(praise_ids)
+
+
+def schedule_catalog_fill(praise_ids: Iterable[UUID]) -> None:
+    """Agenda a gravação das linhas ausentes (ignora IDs já agendados por outra leitura).
+
+    Usa INSERT ... ON CONFLICT DO NOTHING: um refresh feito por uma escrita nesse meio tempo
+    não é sobrescrito pelo documento montado aqui.
+    """
+    with _fill_lock:
+        new_ids = [praise_id for praise_id in praise_ids if praise_id not in _fill_pending]
+        _fill_pending.update(new_ids)
+    if new_ids:
+        _fill_executor.submit(_fill_missing, new_ids)
@@ -0,0 +1,102 @@
+"""
+Exportação do catálogo completo de praises em streaming (NDJSON ou CSV).
+
+Os geradores abrem a própria sessão (a resposta continua sendo enviada depois que a rota
+retorna) e leem os praises com PraiseRepository.iter_all, em lotes por cursor do servidor:
+a memória fica constante independentemente do tamanho do catálogo. A saída é agrupada em
+blocos de ~64 KB para não gerar um write por linha.
+"""
+
+import csv
+import io
+from typing import Iterator, Optional
+from uuid import UUID
+
+import orjson
+
+from app.application.services.praise_catalog_service import build_catalog_document
+from app.domain.models.praise import Praise
+from app.infrastructure.database.database import SessionLocal
+from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+EXPORT_CSV_COLUMNS = (
+    "id",
+    "number",
+    "name",
+    "author",
+    "rhythm",
+    "tonality",
+    "category",
+    "in_review",
+    "created_at",
+    "updated_at",
+    "tags",
+    "materials",
+)
+
+_CHUNK_SIZE = 64 * 1024
+_BATCH_SIZE = 500
+
+
+def _iter_praises(tag_id: Optional[UUID]) -> Iterator[Praise]:
+    db = SessionLocal()
+    try:
+        yield from PraiseRepository(db).iter_all(batch_size=_BATCH_SIZE, tag_id=tag_id)
+    finally:
+        db.close()
+
+
+def iter_ndjson(tag_id: Optional[UUID] = None) -> Iterator[bytes]:
+    """Um PraiseResponse (mesmo formato de GET /api/v1/praises/{id}) por linha."""
+    buffer = bytearray()
+    for praise in _iter_praises(tag_id):
+        buffer += orjson.dumps(build_catalog_document(praise))
+        buffer += b"\n"
+        if len(buffer) >= _CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _csv_row(praise: Praise) -> list:
+    materials = [
+        f"{material.material_kind.name if material.material_kind else ''}"
+        f" ({material.material_type.name if material.material_type else ''}): {material.path}"
+        for material in praise.materials
+    ]
+    return [
+        praise.id,
+        praise.number if praise.number is not None else "",
+        praise.name,
+        praise.author or "",
+        praise.rhythm or "",
+        praise.tonality or "",
+        praise.category or "",
+        "true" if praise.in_review else "false",
+        praise.created_at.isoformat() if praise.created_at else "",
+        praise.updated_at.isoformat() if praise.updated_at else "",
+        "; ".join(sorted(tag.name for tag in praise.tags)),
+        "; ".join(materials),
+    ]
+
+
+def iter_csv(tag_id: Optional[UUID] = None) -> Iterator[bytes]:
+    """Uma linha por praise; tags e materiais ("Kind (type): path") separados por "; "."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    # BOM: planilhas (Excel) reconhecem o UTF-8 e mostram os acentos corretamente
+    output.write("\ufeff")
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    for praise in _iter_praises(tag_id):
+        writer.writerow(_csv_row(praise))
+        if output.tell() >= _CHUNK_SIZE:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate()
+    yield output.getvalue().encode("utf-8")
@@ -1,4 +1,4 @@
-from typing import List, Optional, BinaryIO
+from typing import List, Optional, BinaryIO, Tuple
 from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
@@ -11,6 +11,15 @@ from app.infrastructure.database.repositories.material_type_repository import Ma
 from app.infrastructure.database.repositories.praise_repository import PraiseRepository
 from app.infrastructure.storage.storage_client import StorageClient
 from app.application.services.metadata_sync_service import sync_praise_to_metadata
+from app.application.services.praise_search_index import index_praise
+from app.application.services.praise_catalog_service import PraiseCatalogService
+from app.application.services.praise_archive_service import invalidate_praise_archive
+from app.application.services.material_file_service import (
+    HashingReader,
+    apply_file_metadata,
+    record_file_metadata,
+    uploaded_file_metadata,
+)
 
 
 class PraiseMaterialService:
@@ -19,6 +28,7 @@ class PraiseMaterialService:
         self.material_kind_repo = MaterialKindRepository(db)
         self.material_type_repo = MaterialTypeRepository(db)
         self.praise_repo = PraiseRepository(db)
+        self.catalog = PraiseCatalogService(db)
     
     def _detect_material_type_from_extension(self, extension: str) -> UUID:
         """Detecta o tipo de material baseado na extensão do arquivo"""
@@ -56,6 +66,13 @@ class PraiseMaterialService:
             )
         return material
 
+    def get_by_ids(self, material_ids: List[UUID]) -> Tuple[List[PraiseMaterial], List[UUID]]:
+        """Materiais na ordem pedida (IDs repetidos contam uma vez) e os IDs não encontrados."""
+        unique_ids = list(dict.fromkeys(material_ids))
+        materials = self.repository.get_by_ids(unique_ids)
+        found = {material.id for material in materials}
+        return materials, [material_id for material_id in unique_ids if material_id not in found]
+
     def get_all(self, skip: int = 0, limit: int = 100) -> List[PraiseMaterial]:
         return self.repository.get_all(skip=skip, limit=limit)
 
@@ -110,9 +127,15 @@ class PraiseMaterialService:
             is_old=material_data.is_old or False,
             old_description=material_data.old_description or None
         )
+        if self._is_file_type(material_type.name):
+            record_file_metadata(material)
         material = self.repository.create(material)
+        self.repository.refresh_lyrics_search_vector(material.id)
         praise = self.praise_repo.get_by_id(material_data.praise_id)
         sync_praise_to_metadata(praise)
+        index_praise(praise)
+        self.catalog.refresh(praise)
+        invalidate_praise_archive(material.praise_id)
         return material
 
     def create_with_upload(
@@ -141,8 +164,9 @@ class PraiseMaterialService:
         material_id = uuid4()
         import mimetypes
         content_type, _ = mimetypes.guess_type(file_name)
+        reader = HashingReader(file_obj)
         file_path = storage.upload_file(
-            file_obj,
+            reader,
             file_name,
             content_type=content_type,
             folder=f"praises/{praise_id}",
@@ -159,13 +183,18 @@ class PraiseMaterialService:
             is_old=is_old,
             old_description=old_description,
         )
+        apply_file_metadata(material, uploaded_file_metadata(storage, file_path, reader))
         material = self.repository.create(material)
         praise_full = self.praise_repo.get_by_id(praise_id)
         sync_praise_to_metadata(praise_full)
+        index_praise(praise_full)
+        self.catalog.refresh(praise_full)
+        invalidate_praise_archive(praise_id)
         return material
 
     def update(self, material_id: UUID, material_data: PraiseMaterialUpdate) -> PraiseMaterial:
         material = self.get_by_id(material_id)
+        previous_type_id = material.material_type_id
         
         if material_data.material_kind_id is not None:
             material_kind = self.material_kind_repo.get_by_id(material_data.material_kind_id)
@@ -185,8 +214,19 @@ class PraiseMaterialService:
                 )
             material.material_type_id = material_data.material_type_id
         
+        file_changed = material.material_type_id != previous_type_id
         if material_data.path is not None:
+            if material_data.path != material.path:
+                material.file_version = (material.file_version or 1) + 1
+                file_changed = True
             material.path = material_data.path
+        if file_changed:
+            # Outro arquivo (ou o material deixou de ser arquivo): metadados do novo path
+            current_type = self.material_type_repo.get_by_id(material.material_type_id)
+            if current_type and self._is_file_type(current_type.name):
+                record_file_metadata(material)
+            else:
+                apply_file_metadata(material, None)
         
         if material_data.is_old is not None:
             material.is_old = material_data.is_old
@@ -194,8 +234,12 @@ class PraiseMaterialService:
             material.old_description = material_data.old_description or None
         
         material = self.repository.update(material)
+        self.repository.refresh_lyrics_search_vector(material.id)
         praise = self.praise_repo.get_by_id(material.praise_id)
         sync_praise_to_metadata(praise)
+        index_praise(praise)
+        self.catalog.refresh(praise)
+        invalidate_praise_archive(material.praise_id)
         return material
 
     def update_with_file(
@@ -255,8 +299,9 @@ class PraiseMaterialService:
         # Faz upload do novo arquivo
         import mimetypes
         content_type, _ = mimetypes.guess_type(file_name)
+        reader = HashingReader(file_obj)
         new_path = storage.upload_file(
-            file_obj,
+            reader,
             file_name,
             content_type=content_type,
             folder=f"praises/{material.praise_id}",
@@ -268,8 +313,10 @@ class PraiseMaterialService:
         new_material_type_id = self._detect_material_type_from_extension(file_ext)
         material.material_type_id = new_material_type_id
         
-        # Atualiza o path do material
+        # Atualiza o path do material; nova versão do arquivo (URL de download versionada)
         material.path = new_path
+        material.file_version = (material.file_version or 1) + 1
+        apply_file_metadata(material, uploaded_file_metadata(storage, new_path, reader))
         
         if is_old is not None:
             material.is_old = is_old
@@ -279,6 +326,9 @@ class PraiseMaterialService:
         material = self.repository.update(material)
         praise = self.praise_repo.get_by_id(material.praise_id)
         sync_praise_to_metadata(praise)
+        index_praise(praise)
+        self.catalog.refresh(praise)
+        invalidate_praise_archive(material.praise_id)
         return material
 
     def delete(self, material_id: UUID) -> bool:
@@ -288,6 +338,9 @@ class PraiseMaterialService:
         if result:
             praise = self.praise_repo.get_by_id(praise_id)
             sync_praise_to_metadata(praise)
+            index_praise(praise)
+            self.catalog.refresh(praise)
+            invalidate_praise_archive(praise_id)
         return result
 
 
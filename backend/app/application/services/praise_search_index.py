@@ -0,0 +1,332 @@
+"""
+Índice de busca em memória (por worker) para sugestões de praises.
+
+Mantém um índice invertido sobre nome, número e palavras da letra, normalizados com
+as mesmas regras de normalize_search_query. É construído na inicialização, atualizado
+pelas escritas do PraiseService/PraiseMaterialService deste worker (index_praise /
+remove_praise_from_index) e reconstruído periodicamente para absorver escritas feitas
+por outros workers ou por scripts. As consultas (suggest) não acessam o banco.
+
+Escritas que chegam durante a reconstrução são registradas e reaplicadas sobre o índice novo
+antes da troca: a leitura do banco pode ter começado antes delas.
+"""
+
+import bisect
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.search_normalizer import normalize_search_query
+from app.domain.models.praise import Praise
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Faixas de score (menor = melhor)
+_SCORE_NUMBER_EXACT = 0
+_SCORE_NUMBER_PREFIX = 1
+_SCORE_NAME_PREFIX = 2
+_SCORE_NAME_WORDS = 3
+_SCORE_NAME_SUBSTRING = 4
+_SCORE_LYRICS = 5
+
+
+def _tokens(text: Optional[str]) -> FrozenSet[str]:
+    normalized = normalize_search_query(text)
+    return frozenset(_TOKEN_RE.findall(normalized)) if normalized else frozenset()
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def extract_lyrics(praise: Praise) -> str:
+    """Texto das letras do praise (materiais text/Lyrics), como no metadata_sync_service."""
+    parts = []
+    for material in praise.materials or []:
+        kind_name = material.material_kind.name if material.material_kind else ""
+        type_name = material.material_type.name if material.material_type else ""
+        if type_name.lower() == "text" and kind_name.lower() == "lyrics":
+            parts.append(material.path or "")
+    return "\n".join(parts)
+
+
+@dataclass
+class _Document:
+    name: str
+    number: Optional[int]
+    name_norm: str
+    name_tokens: FrozenSet[str]
+    lyrics_tokens: FrozenSet[str]
+    trigrams: FrozenSet[str] = field(default_factory=frozenset)
+
+
+class _TokenPostings:
+    """token -> IDs, com lista ordenada de tokens para busca por prefixo (bisect)."""
+
+    def __init__(self):
+        self.postings: Dict[str, Set[UUID]] = {}
+        self.sorted_tokens: List[str] = []
+
+    def add(self, praise_id: UUID, tokens: Iterable[str]) -> None:
+        for token in tokens:
+            ids = self.postings.get(token)
+            if ids is None:
+                ids = self.postings[token] = set()
+                bisect.insort(self.sorted_tokens, token)
+            ids.add(praise_id)
+
+    def remove(self, praise_id: UUID, tokens: Iterable[str]) -> None:
+        for token in tokens:
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(praise_id)
+            if not ids:
+                del self.postings[token]
+                pos = bisect.bisect_left(self.sorted_tokens, token)
+                if pos < len(self.sorted_tokens) and self.sorted_tokens[pos] == token:
+                    del self.sorted_tokens[pos]
+
+    def with_prefix(self, prefix: str) -> Set[UUID]:
+        result: Set[UUID] = set()
+        pos = bisect.bisect_left(self.sorted_tokens, prefix)
+        while pos < len(self.sorted_tokens) and self.sorted_tokens[pos].startswith(prefix):
+            result |= self.postings[self.sorted_tokens[pos]]
+            pos += 1
+        return result
+
+    def with_all_prefixes(self, prefixes: Iterable[str]) -> Set[UUID]:
+        result: Optional[Set[UUID]] = None
+        for prefix in prefixes:
+            ids = self.with_prefix(prefix)
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result or set()
+
+
+class PraiseSearchIndex:
+    """Índice invertido thread-safe de praises (nome, número e letra)."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs: Dict[UUID, _Document] = {}
+        self._name_tokens = _TokenPostings()
+        self._lyrics_tokens = _TokenPostings()
+        self._numbers = _TokenPostings()
+        self._trigrams: Dict[str, Set[UUID]] = {}
+        self.ready = False
+        self.built_at: Optional[float] = None
+        # Durante uma reconstrução: praise_id -> argumentos do último upsert (None: removido)
+        self._pending: Optional[Dict[UUID, Optional[Tuple[str, Optional[int], Optional[str]]]]] = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def upsert(self, praise_id: UUID, name: str, number: Optional[int], lyrics: Optional[str] = None) -> None:
+        name_norm = normalize_search_query(name) or ""
+        doc = _Document(
+            name=name,
+            number=number,
+            name_norm=name_norm,
+            name_tokens=_tokens(name),
+            lyrics_tokens=_tokens(lyrics),
+            trigrams=_trigrams(name_norm),
+        )
+        with self._lock:
+            if self._pending is not None:
+                self._pending[praise_id] = (name, number, lyrics)
+            self._remove_locked(praise_id)
+            self._docs[praise_id] = doc
+            self._name_tokens.add(praise_id, doc.name_tokens)
+            self._lyrics_tokens.add(praise_id, doc.lyrics_tokens)
+            if number is not None:
+                self._numbers.add(praise_id, (str(number),))
+            for trigram in doc.trigrams:
+                self._trigrams.setdefault(trigram, set()).add(praise_id)
+
+    def remove(self, praise_id: UUID) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._pending[praise_id] = None
+            self._remove_locked(praise_id)
+
+    def _remove_locked(self, praise_id: UUID) -> None:
+        doc = self._docs.pop(praise_id, None)
+        if doc is None:
+            return
+        self._name_tokens.remove(praise_id, doc.name_tokens)
+        self._lyrics_tokens.remove(praise_id, doc.lyrics_tokens)
+        if doc.number is not None:
+            self._numbers.remove(praise_id, (str(doc.number),))
+        for trigram in doc.trigrams:
+            ids = self._trigrams.get(trigram)
+            if ids is not None:
+                ids.discard(praise_id)
+                if not ids:
+                    del self._trigrams[trigram]
+
+    def begin_rebuild(self) -> None:
+        """Passa a registrar upserts/remoções até replace_with ou abort_rebuild."""
+        with self._lock:
+            self._pending = {}
+
+    def abort_rebuild(self) -> None:
+        with self._lock:
+            self._pending = None
+
+    def replace_with(self, other: "PraiseSearchIndex") -> None:
+        """Troca atomicamente o conteúdo pelo de outro índice (reconstrução completa).
+
+        As escritas registradas desde begin_rebuild são reaplicadas em other antes da troca; o
+        lock fica com este índice até o fim, então nenhuma escrita nova fica entre as duas etapas.
+        """
+        with self._lock:
+            for praise_id, args in (self._pending or {}).items():
+                if args is None:
+                    other.remove(praise_id)
+                else:
+                    other.upsert(praise_id, *args)
+            self._pending = None
+            self._docs = other._docs
+            self._name_tokens = other._name_tokens
+            self._lyrics_tokens = other._lyrics_tokens
+            self._numbers = other._numbers
+            self._trigrams = other._trigrams
+            self.built_at = time.time()
+            self.ready = True
+
+    def _substring_candidates(self, term: str) -> Set[UUID]:
+        grams = _trigrams(term)
+        if not grams:
+            return {pid for pid, doc in self._docs.items() if term in doc.name_norm}
+        candidates: Optional[Set[UUID]] = None
+        for gram in grams:
+            ids = self._trigrams.get(gram, set())
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+        return {pid for pid in candidates if term in self._docs[pid].name_norm}
+
+    def suggest(self, query: str, limit: int = 10, include_lyrics: bool = True) -> List[dict]:
+        """Sugestões por número, prefixo/substring do nome e prefixo de palavras da letra."""
+        raw = (query or "").strip()
+        term = normalize_search_query(raw)
+        scores: Dict[UUID, int] = {}
+
+        def offer(ids: Iterable[UUID], score: int) -> None:
+            for pid in ids:
+                if score < scores.get(pid, 99):
+                    scores[pid] = score
+
+        with self._lock:
+            if raw.isdigit():
+                offer(self._numbers.postings.get(raw, ()), _SCORE_NUMBER_EXACT)
+                offer(self._numbers.with_prefix(raw), _SCORE_NUMBER_PREFIX)
+
+            if term:
+                words = _TOKEN_RE.findall(term)
+                substring_ids = self._substring_candidates(term)
+                offer((pid for pid in substring_ids if self._docs[pid].name_norm.startswith(term)), _SCORE_NAME_PREFIX)
+                if words:
+                    offer(self._name_tokens.with_all_prefixes(words), _SCORE_NAME_WORDS)
+                offer(substring_ids, _SCORE_NAME_SUBSTRING)
+                if include_lyrics and words:
+                    offer(self._lyrics_tokens.with_all_prefixes(words), _SCORE_LYRICS)
+
+            ranked = sorted(scores.items(), key=lambda item: (item[1], self._docs[item[0]].name.lower()))
+            return [
+                {
+                    "id": pid,
+                    "name": self._docs[pid].name,
+                    "number": self._docs[pid].number,
+                    "matched_in": _matched_in(score),
+                }
+                for pid, score in ranked[:limit]
+            ]
+
+
+def _matched_in(score: int) -> str:
+    if score <= _SCORE_NUMBER_PREFIX:
+        return "number"
+    if score == _SCORE_LYRICS:
+        return "lyrics"
+    return "name"
+
+
+# Instância única por processo (worker)
+praise_search_index = PraiseSearchIndex()
+
+
+def build_praise_search_index() -> None:
+    """Reconstrói o índice a partir do banco (praises + letras) e troca o conteúdo atomicamente."""
+    from app.infrastructure.database.database import SessionLocal
+    from app.domain.models.praise_material import PraiseMaterial
+
+    db = SessionLocal()
+    praise_search_index.begin_rebuild()
+    try:
+        started = time.perf_counter()
+        lyrics_by_praise: Dict[UUID, List[str]] = {}
+        # lyrics_tsv só é preenchido para materiais text/Lyrics (ver PraiseMaterialRepository)
+        for praise_id, path in (
+            db.query(PraiseMaterial.praise_id, PraiseMaterial.path)
+            .filter(PraiseMaterial.lyrics_tsv.isnot(None))
+        ):
+            lyrics_by_praise.setdefault(praise_id, []).append(path or "")
+
+        fresh = PraiseSearchIndex()
+        for praise_id, name, number in db.query(Praise.id, Praise.name, Praise.number):
+            fresh.upsert(praise_id, name, number, "\n".join(lyrics_by_praise.get(praise_id, [])))
+        praise_search_index.replace_with(fresh)
+        logger.info(
+            "Índice de busca construído: %d praises em %.0f ms",
+            len(fresh), (time.perf_counter() - started) * 1000,
+        )
+    except Exception:
+        praise_search_index.abort_rebuild()
+        raise
+    finally:
+        db.close()
+
+
+def index_praise(praise: Praise) -> None:
+    """Atualiza o praise no índice (praise com materials carregados, com kind/type)."""
+    try:
+        praise_search_index.upsert(praise.id, praise.name, praise.number, extract_lyrics(praise))
+    except Exception as e:
+        logger.exception("Erro ao atualizar índice de busca para praise %s: %s", praise.id, e)
+        # Fail-safe: não propagar exceção para não quebrar a operação principal
+
+
+def remove_praise_from_index(praise_id: UUID) -> None:
+    """Remove o praise do índice quando ele é deletado."""
+    try:
+        praise_search_index.remove(praise_id)
+    except Exception as e:
+        logger.exception("Erro ao remover praise %s do índice de busca: %s", praise_id, e)
+
+
+def start_search_index_refresher() -> None:
+    """Constrói o índice em background e reconstrói a cada SEARCH_INDEX_REFRESH_SECONDS."""
+    if not settings.SEARCH_INDEX_ENABLED:
+        return
+
+    def _loop():
+        while True:
+            try:
+                build_praise_search_index()
+            except Exception as e:
+                logger.exception("Erro ao construir índice de busca: %s", e)
+            if settings.SEARCH_INDEX_REFRESH_SECONDS <= 0:
+                return
+            time.sleep(settings.SEARCH_INDEX_REFRESH_SECONDS)
+
+    threading.Thread(target=_loop, name="praise-search-index", daemon=True).start()
@@ -1,18 +1,39 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.domain.models.praise import Praise
 from app.domain.models.praise_tag import PraiseTag
-from app.domain.schemas.praise import PraiseCreate, PraiseUpdate, ReviewActionRequest
-from app.core.search_normalizer import normalize_search_query
+from app.domain.schemas.praise import (
+    PraiseCreate,
+    PraiseUpdate,
+    ReviewActionRequest,
+    PRAISE_SUMMARY_FIELDS,
+    PRAISE_SUMMARY_DEFAULT_FIELDS,
+)
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.search_normalizer import fold_search_text, normalize_search_query
 from app.core.youtube_utils import extract_youtube_video_id
 from app.infrastructure.database.repositories.praise_repository import PraiseRepository
 from app.infrastructure.database.repositories.praise_tag_repository import PraiseTagRepository
 from app.infrastructure.database.repositories.praise_material_repository import PraiseMaterialRepository
+from app.infrastructure.database.repositories.material_type_repository import MaterialTypeRepository
 from app.domain.models.praise_material import PraiseMaterial
 from app.application.services.metadata_sync_service import sync_praise_to_metadata, delete_metadata
+from app.application.services.praise_search_index import index_praise, remove_praise_from_index
+from app.application.services.praise_catalog_service import PraiseCatalogService
+from app.application.services.praise_archive_service import invalidate_praise_archive
+from app.application.services.material_file_service import record_file_metadata
+
+
+def refresh_praise_search_columns(praise: Praise) -> None:
+    """Recalcula as colunas *_search do praise a partir dos campos exibidos."""
+    praise.name_search = normalize_search_query(praise.name)
+    praise.tonality_search = fold_search_text(praise.tonality)
+    praise.rhythm_search = fold_search_text(praise.rhythm)
+    praise.category_search = fold_search_text(praise.category)
 
 
 class PraiseService:
@@ -20,6 +41,10 @@ class PraiseService:
         self.repository = PraiseRepository(db)
         self.tag_repo = PraiseTagRepository(db)
         self.material_repo = PraiseMaterialRepository(db)
+        self.material_type_repo = MaterialTypeRepository(db)
+        self.catalog = PraiseCatalogService(db)
+        # lower(name) do banco das linhas da última página listada (chave do cursor em next_cursor)
+        self._cursor_names: Dict[UUID, str] = {}
 
     def get_by_id(self, praise_id: UUID) -> Praise:
         praise = self.repository.get_by_id(praise_id)
@@ -30,6 +55,31 @@ class PraiseService:
             )
         return praise
 
+    def get_document(self, praise_id: UUID) -> Dict[str, Any]:
+        """Praise já serializado (PraiseResponse), lido do modelo de leitura praise_catalog_entries."""
+        document = self.catalog.get_document(praise_id)
+        if document is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resource not found"
+            )
+        return document
+
+    def get_documents_by_ids(self, praise_ids: List[UUID]) -> Tuple[List[Dict[str, Any]], List[UUID]]:
+        """Documentos na ordem pedida (IDs repetidos contam uma vez) e os IDs não encontrados.
+
+        Uma leitura por chave primária no modelo de leitura; só os ausentes dele são
+        hidratados (numa única consulta) pelo PraiseRepository.
+        """
+        unique_ids = list(dict.fromkeys(praise_ids))
+        documents = self.catalog.get_documents(unique_ids)
+        found = {document["id"] for document in documents}
+        return documents, [praise_id for praise_id in unique_ids if str(praise_id) not in found]
+
+    def get_document_refreshed_at(self, praise_id: UUID) -> Optional[datetime]:
+        """Última gravação do documento do praise (ETag/Last-Modified de GET /praises/{id})."""
+        return self.catalog.get_refreshed_at(praise_id)
+
     def get_all(
         self,
         skip: int = 0,
@@ -41,27 +91,201 @@ class PraiseService:
         category: Optional[str] = None,
         youtube_url: Optional[str] = None,
         search_in_lyrics: bool = False,
+        fuzzy: bool = False,
+        sort_by: str = "name",
+        sort_direction: str = "asc",
+        no_number: str = "last",
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Lista praises com filtros e ordenação aplicados no banco.
+
+        Os IDs da página vêm da tabela praises; os praises serializados (PraiseResponse)
+        vêm do modelo de leitura praise_catalog_entries, numa busca por chave primária.
+
+        Com cursor (ver next_cursor), a página começa após a última chave vista e skip é ignorado.
+        """
+        after_key = self._decode_cursor(cursor, sort_by, sort_direction, no_number) if cursor else None
+        normalized_name = normalize_search_query(name) if name else None
+        youtube_video_id = extract_youtube_video_id(youtube_url) if youtube_url else None
+        page_keys = self.repository.get_page_keys_filtered_sorted(
+            skip=skip,
+            limit=limit,
+            name=normalized_name,
+            tag_id=tag_id,
+            tonality=fold_search_text(tonality),
+            rhythm=fold_search_text(rhythm),
+            category=fold_search_text(category),
+            youtube_video_id=youtube_video_id,
+            search_in_lyrics=search_in_lyrics,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            no_number=no_number,
+            lyrics_query=name.strip() if search_in_lyrics and name else None,
+            after_key=after_key,
+            fuzzy_threshold=self._fuzzy_threshold(fuzzy),
+        )
+        self._cursor_names = dict(page_keys)
+        return self.catalog.get_documents([praise_id for praise_id, _ in page_keys])
+
+    def get_summaries(
+        self,
+        fields: Optional[List[str]] = None,
+        skip: int = 0,
+        limit: int = 100,
+        name: Optional[str] = None,
+        tag_id: Optional[UUID] = None,
+        tonality: Optional[str] = None,
+        rhythm: Optional[str] = None,
+        category: Optional[str] = None,
+        youtube_url: Optional[str] = None,
+        search_in_lyrics: bool = False,
+        fuzzy: bool = False,
         sort_by: str = "name",
         sort_direction: str = "asc",
         no_number: str = "last",
-    ) -> List[Praise]:
-        """Lista praises com filtros e ordenação aplicados no banco."""
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Mesma listagem de get_all, projetada só nos campos pedidos (sem carregar o grafo ORM)."""
+        fields = self.resolve_summary_fields(fields)
+        after_key = self._decode_cursor(cursor, sort_by, sort_direction, no_number) if cursor else None
         normalized_name = normalize_search_query(name) if name else None
         youtube_video_id = extract_youtube_video_id(youtube_url) if youtube_url else None
-        return self.repository.get_all_filtered_sorted(
+        items = self.repository.get_summaries_filtered_sorted(
+            fields,
             skip=skip,
             limit=limit,
             name=normalized_name,
             tag_id=tag_id,
-            tonality=tonality,
-            rhythm=rhythm,
-            category=category,
+            tonality=fold_search_text(tonality),
+            rhythm=fold_search_text(rhythm),
+            category=fold_search_text(category),
             youtube_video_id=youtube_video_id,
             search_in_lyrics=search_in_lyrics,
             sort_by=sort_by,
             sort_direction=sort_direction,
             no_number=no_number,
+            lyrics_query=name.strip() if search_in_lyrics and name else None,
+            after_key=after_key,
+            fuzzy_threshold=self._fuzzy_threshold(fuzzy),
         )
+        self._cursor_names = {item["id"]: item.pop("cursor_name") for item in items}
+        return items
+
+    def get_facets(
+        self,
+        name: Optional[str] = None,
+        tag_id: Optional[UUID] = None,
+        tonality: Optional[str] = None,
+        rhythm: Optional[str] = None,
+        category: Optional[str] = None,
+        youtube_url: Optional[str] = None,
+        search_in_lyrics: bool = False,
+        fuzzy: bool = False,
+        sort_by: str = "name",
+        no_number: str = "last",
+    ) -> Dict[str, Any]:
+        """Total e contagens por faceta para os mesmos filtros de get_all."""
+        normalized_name = normalize_search_query(name) if name else None
+        youtube_video_id = extract_youtube_video_id(youtube_url) if youtube_url else None
+        return self.repository.get_facet_counts(
+            name=normalized_name,
+            tag_id=tag_id,
+            tonality=fold_search_text(tonality),
+            rhythm=fold_search_text(rhythm),
+            category=fold_search_text(category),
+            youtube_video_id=youtube_video_id,
+            search_in_lyrics=search_in_lyrics,
+            sort_by=sort_by,
+            no_number=no_number,
+            lyrics_query=name.strip() if search_in_lyrics and name else None,
+            fuzzy_threshold=self._fuzzy_threshold(fuzzy),
+        )
+
+    @staticmethod
+    def _fuzzy_threshold(fuzzy: bool) -> Optional[float]:
+        """Limiar de similaridade da busca fuzzy (FUZZY_SEARCH_THRESHOLD) ou None se desativada."""
+        return settings.FUZZY_SEARCH_THRESHOLD if fuzzy else None
+
+    @staticmethod
+    def resolve_summary_fields(fields: Optional[List[str]]) -> List[str]:
+        """Valida os campos pedidos em fields=; vazio = campos padrão do resumo. id é sempre incluído."""
+        if not fields:
+            return list(PRAISE_SUMMARY_DEFAULT_FIELDS)
+        unknown = [f for f in fields if f not in PRAISE_SUMMARY_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(PRAISE_SUMMARY_FIELDS)}"
+            )
+        return ["id"] + [f for f in dict.fromkeys(fields) if f != "id"]
+
+    @staticmethod
+    def _cursor_scope(sort_by: str, sort_direction: str, no_number: str) -> Dict[str, str]:
+        """Parâmetros de ordenação que o cursor precisa repetir para continuar válido."""
+        sort_key = "number" if sort_by == "number" else "name"
+        return {
+            "s": sort_key,
+            "d": "desc" if sort_direction.lower() == "desc" else "asc",
+            "n": no_number if sort_key == "number" else "",
+        }
+
+    def _decode_cursor(
+        self, cursor: str, sort_by: str, sort_direction: str, no_number: str
+    ) -> Dict[str, Any]:
+        if sort_by == "relevance":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not available for sort_by=relevance"
+            )
+        try:
+            payload = decode_cursor(cursor)
+            scope = {k: payload.get(k) for k in ("s", "d", "n")}
+            after_key = {
+                "name": str(payload["k"]),
+                "number": payload.get("num"),
+                "id": UUID(payload["id"]),
+            }
+            if after_key["number"] is not None:
+                after_key["number"] = int(after_key["number"])
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        if scope != self._cursor_scope(sort_by, sort_direction, no_number):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor does not match the requested sorting"
+            )
+        return after_key
+
+    def next_cursor(
+        self,
+        praises: List[Any],
+        limit: int,
+        sort_by: str = "name",
+        sort_direction: str = "asc",
+        no_number: str = "last",
+    ) -> Optional[str]:
+        """Cursor opaco para a página seguinte, ou None se esta for a última (ou sort_by=relevance).
+
+        praises é a página retornada pela última chamada a get_all/get_summaries deste serviço.
+        """
+        if sort_by == "relevance" or not praises or len(praises) < limit:
+            return None
+        last = praises[-1]
+        if isinstance(last, dict):
+            # Documentos do modelo de leitura (get_all) ou itens da projeção resumida (get_summaries)
+            last_number, last_id = last["number"], last["id"]
+        else:
+            last_number, last_id = last.number, last.id
+        # Chave de nome calculada pelo banco na consulta da página (get_all/get_summaries)
+        cursor_name = self._cursor_names.get(UUID(str(last_id)))
+        if cursor_name is None:
+            return None
+        payload: Dict[str, Any] = self._cursor_scope(sort_by, sort_direction, no_number)
+        payload.update({"k": cursor_name, "num": last_number, "id": str(last_id)})
+        return encode_cursor(payload)
 
     def create(self, praise_data: PraiseCreate) -> Praise:
         in_review = praise_data.in_review or False
@@ -81,6 +305,7 @@ class PraiseService:
             tonality=praise_data.tonality or None,
             category=praise_data.category or None,
         )
+        refresh_praise_search_columns(praise)
 
         # Add tags if provided
         if praise_data.tag_ids:
@@ -109,11 +334,17 @@ class PraiseService:
                     is_old=material_data.is_old or False,
                     old_description=material_data.old_description or None
                 )
-                self.material_repo.create(material)
+                material_type = self.material_type_repo.get_by_id(material_data.material_type_id)
+                if material_type and material_type.name.lower() in ('pdf', 'audio'):
+                    record_file_metadata(material)
+                material = self.material_repo.create(material)
+                self.material_repo.refresh_lyrics_search_vector(material.id)
         
         # Refresh to get all relationships
         result = self.repository.get_by_id(praise.id)
         sync_praise_to_metadata(result)
+        index_praise(result)
+        self.catalog.refresh(result)
         return result
 
     def update(self, praise_id: UUID, praise_data: PraiseUpdate) -> Praise:
@@ -167,14 +398,19 @@ class PraiseService:
         if praise_data.category is not None:
             praise.category = praise_data.category
 
+        refresh_praise_search_columns(praise)
         self.repository.update(praise)
         praise_with_relations = self.repository.get_by_id(praise_id)
         sync_praise_to_metadata(praise_with_relations)
+        index_praise(praise_with_relations)
+        self.catalog.refresh(praise_with_relations)
         return praise_with_relations
 
     def delete(self, praise_id: UUID) -> bool:
         praise = self.get_by_id(praise_id)
         delete_metadata(praise_id)
+        remove_praise_from_index(praise_id)
+        invalidate_praise_archive(praise_id, prewarm=False)
         return self.repository.delete(praise_id)
 
     def review_action(self, praise_id: UUID, data: ReviewActionRequest) -> Praise:
@@ -215,7 +451,9 @@ class PraiseService:
             praise.review_history = history
             praise.in_review = False
 
-        return self.repository.update(praise)
+        praise = self.repository.update(praise)
+        self.catalog.refresh(praise)
+        return praise
 
 
 
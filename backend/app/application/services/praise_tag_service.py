@@ -5,11 +5,13 @@ from fastapi import HTTPException, status
 from app.domain.models.praise_tag import PraiseTag
 from app.domain.schemas.praise_tag import PraiseTagCreate, PraiseTagUpdate
 from app.infrastructure.database.repositories.praise_tag_repository import PraiseTagRepository
+from app.application.services.praise_catalog_service import PraiseCatalogService
 
 
 class PraiseTagService:
     def __init__(self, db: Session):
         self.repository = PraiseTagRepository(db)
+        self.catalog = PraiseCatalogService(db)
 
     def get_by_id(self, tag_id: UUID) -> PraiseTag:
         tag = self.repository.get_by_id(tag_id)
@@ -48,10 +50,14 @@ class PraiseTagService:
                 )
             tag.name = tag_data.name
         
-        return self.repository.update(tag)
+        tag = self.repository.update(tag)
+        # O nome da tag está no documento dos praises (praise_catalog_entries)
+        self.catalog.invalidate_tag(tag_id)
+        return tag
 
     def delete(self, tag_id: UUID) -> bool:
         tag = self.get_by_id(tag_id)
+        self.catalog.invalidate_tag(tag_id)
         return self.repository.delete(tag_id)
 
 
@@ -0,0 +1,59 @@
+"""
+Entrega de arquivos pelo proxy reverso (nginx) com X-Accel-Redirect.
+
+Com ACCEL_REDIRECT_ENABLED a API só decide se o download pode acontecer (autenticação, rate
+limit, auditoria) e responde sem corpo, com o header X-Accel-Redirect apontando para uma
+location internal do nginx. O nginx envia o arquivo do disco (sendfile, Range, If-Range,
+ETag) e o worker do Uvicorn fica livre na hora, em vez de ficar preso a transferências longas.
+
+Cada location internal é um alias de um diretório da API (ver nginx.conf); arquivos fora
+desses diretórios continuam sendo enviados pela própria API. Para testar sem nginx, use
+scripts/accel_redirect_proxy.py.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from fastapi import Response
+
+from app.core.config import settings
+
+
+def accel_locations() -> List[Tuple[str, Path]]:
+    """Locations internal do proxy e o diretório que cada uma serve."""
+    return [
+        (settings.ACCEL_REDIRECT_STORAGE_LOCATION, Path(settings.STORAGE_LOCAL_PATH)),
+        (settings.ACCEL_REDIRECT_PRAISE_ZIPS_LOCATION, Path(settings.PRAISE_ARCHIVE_CACHE_PATH)),
+        (settings.ACCEL_REDIRECT_ARCHIVES_LOCATION, Path(settings.ARCHIVE_SPOOL_PATH)),
+    ]
+
+
+def accel_redirect_uri(path: Path) -> Optional[str]:
+    """URI interna do arquivo no proxy, ou None se ele não está em nenhuma location."""
+    resolved = Path(path).resolve()
+    for location, root in accel_locations():
+        try:
+            relative = resolved.relative_to(root.resolve())
+        except ValueError:
+            continue
+        return location.rstrip("/") + "/" + quote(relative.as_posix())
+    return None
+
+
+def accel_file_response(
+    path: Path,
+    media_type: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> Optional[Response]:
+    """Resposta que delega o envio do arquivo ao proxy; None quando a API deve enviá-lo.
+
+    Content-Type, Content-Disposition e Cache-Control da resposta são mantidos pelo nginx;
+    tamanho, Last-Modified, ETag e Range ficam com ele.
+    """
+    if not settings.ACCEL_REDIRECT_ENABLED:
+        return None
+    uri = accel_redirect_uri(path)
+    if uri is None:
+        return None
+    return Response(media_type=media_type, headers={**(headers or {}), "X-Accel-Redirect": uri})
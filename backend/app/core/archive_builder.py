@@ -0,0 +1,128 @@
+"""
+Montagem de ZIP compartilhada pelos downloads (ZIP de um praise em streaming e lotes em disco).
+
+A compressão é escolhida por entrada: MP3, áudio em geral, imagens e arquivos já compactados
+são gravados sem compressão (STORED), texto é comprimido (DEFLATED) e o resto (inclusive PDF,
+que pode ter só texto ou só imagens comprimidas) é decidido pela entropia de uma amostra do
+primeiro bloco. Comprimir dados de alta entropia gasta CPU e praticamente não reduz o tamanho.
+
+O nível do DEFLATE vem de ARCHIVE_COMPRESSION_LEVEL. O benchmark em
+scripts/benchmark_archive_compression.py compara tempo de CPU e tamanho das políticas.
+"""
+
+import itertools
+import math
+import os
+import sys
+import time
+import zipfile
+from collections import Counter
+from typing import IO, Iterable, Iterator, Optional, Tuple, Union
+
+from app.core.config import settings
+
+# Formatos que já são comprimidos: DEFLATE não reduz o tamanho de forma relevante
+STORED_EXTENSIONS = frozenset({
+    ".mp3", ".m4a", ".aac", ".ogg", ".oga", ".opus", ".flac", ".wma",
+    ".mp4", ".m4v", ".webm", ".mov",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".zip", ".gz", ".bz2", ".xz", ".7z", ".rar",
+})
+# Texto comprime bem e barato
+DEFLATED_EXTENSIONS = frozenset({
+    ".txt", ".csv", ".json", ".xml", ".html", ".htm", ".svg", ".md",
+    ".cho", ".chopro", ".chordpro", ".mid", ".midi", ".musicxml", ".mscx",
+})
+
+# Amostra do primeiro bloco usada quando a extensão não decide
+ENTROPY_SAMPLE_BYTES = 64 * 1024
+# Acima disso (bits por byte, máximo 8) os dados já estão comprimidos
+STORED_ENTROPY_THRESHOLD = 7.5
+
+ArchiveTarget = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+def sample_entropy(data: bytes) -> float:
+    """Entropia de Shannon (bits por byte) dos dados."""
+    total = len(data)
+    return sum(count / total * math.log2(total / count) for count in Counter(data).values())
+
+
+def choose_compress_type(name: str, sample: bytes) -> int:
+    """ZIP_STORED ou ZIP_DEFLATED para a entrada, pela extensão ou pela entropia da amostra."""
+    extension = os.path.splitext(name)[1].lower()
+    if extension in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    if extension in DEFLATED_EXTENSIONS:
+        return zipfile.ZIP_DEFLATED
+    if sample_entropy(sample[:ENTROPY_SAMPLE_BYTES]) >= STORED_ENTROPY_THRESHOLD:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def set_compress_level(info: zipfile.ZipInfo, level: int) -> None:
+    """Nível do DEFLATE da entrada: ZipFile.open(info, "w") usa o do ZipInfo, não o do ZipFile."""
+    if sys.version_info >= (3, 13):
+        info.compress_level = level
+    else:
+        info._compresslevel = level
+
+
+def peek_chunks(chunks: Iterable[bytes]) -> Tuple[bytes, Iterator[bytes]]:
+    """Lê o primeiro bloco (falhas de abertura aparecem aqui) e devolve o iterador completo."""
+    iterator = iter(chunks)
+    first = next(iterator, b"")
+    return first, itertools.chain((first,), iterator)
+
+
+class ArchiveBuilder:
+    """ZIP gravado em um caminho ou objeto de arquivo (com ou sem seek), entrada a entrada."""
+
+    def __init__(self, target: ArchiveTarget, mode: str = "w", compresslevel: Optional[int] = None):
+        self._zip = zipfile.ZipFile(target, mode)
+        self.compresslevel = settings.ARCHIVE_COMPRESSION_LEVEL if compresslevel is None else compresslevel
+
+    def write_entry(
+        self,
+        name: str,
+        chunks: Iterable[bytes],
+        size: Optional[int] = None,
+        compress_type: Optional[int] = None,
+    ) -> Iterator[int]:
+        """Grava a entrada bloco a bloco, gerando o tamanho de cada bloco gravado.
+
+        Quem consome pode drenar a saída ou medir progresso entre os blocos. O primeiro bloco
+        é lido antes do cabeçalho: erro nessa leitura não deixa nada escrito no ZIP.
+        size (quando conhecido) decide se a entrada precisa de ZIP64: tamanho desconhecido (None)
+        ou perto do limite grava ZIP64. compress_type None aplica a política por extensão/entropia.
+        """
+        first, chunks = peek_chunks(chunks)
+        info = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+        info.compress_type = choose_compress_type(name, first) if compress_type is None else compress_type
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            set_compress_level(info, self.compresslevel)
+        # Mesma margem do zipfile para a entrada crescer na compressão
+        force_zip64 = size is None or size * 1.05 > zipfile.ZIP64_LIMIT
+        with self._zip.open(info, "w", force_zip64=force_zip64) as target:
+            for chunk in chunks:
+                target.write(chunk)
+                yield len(chunk)
+
+    def add(
+        self,
+        name: str,
+        chunks: Iterable[bytes],
+        size: Optional[int] = None,
+        compress_type: Optional[int] = None,
+    ) -> int:
+        """Grava a entrada inteira; retorna os bytes (não comprimidos) gravados."""
+        return sum(self.write_entry(name, chunks, size=size, compress_type=compress_type))
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> "ArchiveBuilder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
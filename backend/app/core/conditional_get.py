@@ -0,0 +1,79 @@
+"""GET condicional: ETag / If-None-Match e Last-Modified / If-Modified-Since (respostas 304)."""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable, Optional
+from fastapi import Request, Response, status
+from sqlalchemy.orm import Session
+from app.infrastructure.database.repositories.table_version_repository import TableVersionRepository
+
+# O cliente pode guardar a resposta, mas deve revalidar (If-None-Match) antes de reutilizá-la
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# Arquivos de material: URL sem versão pode mudar de conteúdo quando o arquivo é substituído
+FILE_CACHE_CONTROL = "public, max-age=3600"
+# URL com a versão do arquivo (?v=file_version): o conteúdo dessa URL nunca muda
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def make_etag(*parts: Any) -> str:
+    """ETag forte a partir das partes que determinam o conteúdo da resposta."""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def table_versions_etag(db: Session, tables: Iterable[str], *parts: Any) -> str:
+    """ETag de uma leitura que depende das tabelas informadas (contadores de table_versions).
+
+    Custa uma consulta por chave primária, feita antes de carregar qualquer dado.
+    """
+    tables = tuple(tables)
+    versions = TableVersionRepository(db).get_versions(tables)
+    return make_etag(*(f"{table}:{versions[table]}" for table in tables), *parts)
+
+
+def _http_date(value: datetime) -> str:
+    # Colunas DateTime do projeto guardam UTC sem fuso (datetime.utcnow)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """True se o cliente já tem a versão atual (If-None-Match tem precedência sobre If-Modified-Since)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            # Comparação fraca (RFC 9110): W/"x" casa com "x"
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == "*" or candidate == etag:
+                return True
+        return False
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if last_modified is not None and if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        modified = last_modified if last_modified.tzinfo else last_modified.replace(tzinfo=timezone.utc)
+        return modified.replace(microsecond=0) <= since
+    return False
+
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime] = None) -> None:
+    """Adiciona ETag (e Last-Modified) à resposta completa."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = _http_date(last_modified)
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """Resposta 304 sem corpo, com os mesmos validadores da resposta completa."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
@@ -30,6 +30,46 @@ class Settings(BaseSettings):
     # Local Storage (usado quando STORAGE_MODE=local)
     STORAGE_LOCAL_PATH: str = "/storage/assets"
 
+    # Índice de busca em memória (sugestões em /api/v1/praises/suggest)
+    SEARCH_INDEX_ENABLED: bool = True
+    SEARCH_INDEX_REFRESH_SECONDS: int = 300  # reconstrução periódica (0 = apenas na inicialização)
+
+    # Busca fuzzy de nomes (fuzzy=true): limiar de word_similarity do pg_trgm (0 a 1)
+    FUZZY_SEARCH_THRESHOLD: float = 0.4
+
+    # Cache das tabelas de referência (kinds/types, tags, linguagens e traduções)
+    LOOKUP_CACHE_ENABLED: bool = True
+    LOOKUP_CACHE_BACKEND: str = "database"  # "database" (table_versions, entre workers) ou "local"
+    LOOKUP_CACHE_CHECK_SECONDS: float = 5.0  # intervalo mínimo entre consultas de versão
+    LOOKUP_CACHE_STATS_LOG_SECONDS: int = 900  # contadores (hits/misses) no log; 0 = só no encerramento
+
+    # Downloads em lote: partes ZIP gravadas em disco e servidas com Range
+    ARCHIVE_SPOOL_PATH: str = "/tmp/coldigom-archives"
+    ARCHIVE_SPOOL_TTL_SECONDS: int = 6 * 3600  # validade de cada lote
+    ARCHIVE_SPOOL_CLEANUP_SECONDS: int = 600  # intervalo da limpeza de lotes vencidos
+    ARCHIVE_PART_URL_TTL_SECONDS: int = 3600  # validade das URLs assinadas das partes (?token=)
+    ARCHIVE_JOB_WORKERS: int = 2  # threads por processo montando lotes em segundo plano (jobs)
+    # Nível do DEFLATE nos ZIPs (1 = rápido ... 9 = menor); áudio e PDFs já comprimidos vão sem compressão
+    ARCHIVE_COMPRESSION_LEVEL: int = 6
+    # Montagem de ZIPs: arquivos do storage consultados/baixados em paralelo, na ordem
+    STORAGE_PREFETCH_WORKERS: int = 8
+    STORAGE_PREFETCH_MAX_BYTES: int = 64 * 1024 * 1024  # memória máxima em downloads antecipados, por processo
+
+    # ZIP de um praise gerado uma vez e servido do disco enquanto os materiais não mudarem
+    PRAISE_ARCHIVE_CACHE_ENABLED: bool = True
+    PRAISE_ARCHIVE_CACHE_PATH: str = "/tmp/coldigom-praise-zips"
+    PRAISE_ARCHIVE_CACHE_MAX_BYTES: int = 2 * 1024 * 1024 * 1024  # remove os menos usados acima disso
+    PRAISE_ARCHIVE_CACHE_PREWARM: bool = False  # regenerar em segundo plano após escritas nos materiais
+
+    # Downloads entregues pelo nginx (X-Accel-Redirect): a API só autoriza, o proxy envia o arquivo
+    ACCEL_REDIRECT_ENABLED: bool = False
+    ACCEL_REDIRECT_STORAGE_LOCATION: str = "/_protected/storage/"  # alias de STORAGE_LOCAL_PATH
+    ACCEL_REDIRECT_PRAISE_ZIPS_LOCATION: str = "/_protected/praise-zips/"  # alias de PRAISE_ARCHIVE_CACHE_PATH
+    ACCEL_REDIRECT_ARCHIVES_LOCATION: str = "/_protected/archives/"  # alias de ARCHIVE_SPOOL_PATH
+
+    # Listagens de praises/materiais montadas como dicts e codificadas com orjson (sem validação Pydantic)
+    FAST_JSON_RESPONSES: bool = False
+
     # JWT
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
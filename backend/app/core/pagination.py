@@ -0,0 +1,30 @@
+"""Cursor opaco para paginação keyset: base64url de um JSON com a última chave de ordenação vista."""
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """Serializa a chave de ordenação em um token opaco e seguro para URL."""
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decodifica um cursor gerado por encode_cursor.
+
+    Raises:
+        ValueError: Se o cursor estiver malformado
+    """
+    if not cursor or not isinstance(cursor, str):
+        raise ValueError("Empty cursor")
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor payload")
+    return payload
@@ -0,0 +1,190 @@
+"""Respostas de arquivo com suporte a Range (download retomável, seek de áudio/PDF) e If-Range.
+
+O arquivo é enviado do disco em blocos (memória constante por conexão) ou, quando o servidor
+ASGI oferece a extensão http.response.zerocopysend, com sendfile direto do descritor.
+"""
+import os
+import secrets
+from datetime import datetime, timezone
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import anyio
+from fastapi import Request, Response, status
+from starlette.types import Receive, Scope, Send
+
+FILE_CHUNK_SIZE = 256 * 1024
+# Pedidos com mais intervalos que isso são atendidos com o arquivo inteiro
+MAX_RANGES = 32
+
+ByteRange = Tuple[int, int]
+
+
+def parse_byte_ranges(range_header: str, file_size: int) -> Optional[List[ByteRange]]:
+    """Intervalos (início, fim inclusivo) de "bytes=a-b", "bytes=a-", "bytes=-N" (vários separados por vírgula).
+
+    Retorna None quando o header deve ser ignorado (formato inválido ou intervalos demais:
+    responde-se o arquivo inteiro). Intervalos sobrepostos ou contíguos são unidos. Levanta
+    ValueError se nenhum intervalo puder ser atendido.
+    """
+    spec = range_header.strip().lower()
+    if not spec.startswith("bytes="):
+        return None
+    specs = [item.strip() for item in spec[6:].split(",")]
+    if len(specs) > MAX_RANGES:
+        return None
+
+    ranges: List[ByteRange] = []
+    for item in specs:
+        first, sep, last = item.partition("-")
+        first, last = first.strip(), last.strip()
+        if not sep or (first and not first.isdigit()) or (last and not last.isdigit()) or not (first or last):
+            return None
+        if first:
+            start = int(first)
+            if last and int(last) < start:
+                return None
+            if start >= file_size:
+                continue
+            end = min(int(last), file_size - 1) if last else file_size - 1
+            ranges.append((start, end))
+        else:
+            # Sufixo: os últimos N bytes
+            length = int(last)
+            if length == 0 or file_size == 0:
+                continue
+            ranges.append((max(0, file_size - length), file_size - 1))
+
+    if not ranges:
+        raise ValueError(f"No satisfiable range for file size {file_size}")
+
+    merged: List[ByteRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class FileRangeResponse(Response):
+    """Arquivo inteiro, um intervalo (206) ou vários intervalos (206 multipart/byteranges)."""
+
+    def __init__(
+        self,
+        path: Path,
+        file_size: int,
+        media_type: str,
+        ranges: Optional[List[ByteRange]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.path = path
+        self.chunk_size = FILE_CHUNK_SIZE
+        response_headers = dict(headers or {})
+        # Segmentos do corpo: bytes fixos (cabeçalhos das partes) ou trechos do arquivo
+        self.segments: List[object] = []
+
+        if ranges is None:
+            status_code = status.HTTP_200_OK
+            content_type = media_type
+            self.segments.append((0, file_size - 1))
+        elif len(ranges) == 1:
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            content_type = media_type
+            start, end = ranges[0]
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            self.segments.append((start, end))
+        else:
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            boundary = secrets.token_hex(16)
+            content_type = f"multipart/byteranges; boundary={boundary}"
+            for start, end in ranges:
+                self.segments.append((
+                    f"--{boundary}\r\n"
+                    f"Content-Type: {media_type}\r\n"
+                    f"Content-Range: bytes {start}-{end}/{file_size}\r\n\r\n"
+                ).encode("latin-1"))
+                self.segments.append((start, end))
+                self.segments.append(b"\r\n")
+            self.segments.append(f"--{boundary}--\r\n".encode("latin-1"))
+
+        response_headers["Content-Length"] = str(sum(
+            len(segment) if isinstance(segment, bytes) else segment[1] - segment[0] + 1
+            for segment in self.segments
+        ))
+        super().__init__(status_code=status_code, headers=response_headers, media_type=content_type)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            file = await anyio.open_file(self.path, mode="rb")
+        except FileNotFoundError:
+            # Tamanho vindo de metadados gravados: o arquivo pode ter sumido do disco
+            await Response(status_code=status.HTTP_404_NOT_FOUND)(scope, receive, send)
+            return
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        zero_copy = "http.response.zerocopysend" in scope.get("extensions", {})
+        async with file:
+            for segment in self.segments:
+                if isinstance(segment, bytes):
+                    await send({"type": "http.response.body", "body": segment, "more_body": True})
+                    continue
+                start, end = segment
+                if zero_copy:
+                    await send({
+                        "type": "http.response.zerocopysend",
+                        "file": file.wrapped.fileno(),
+                        "offset": start,
+                        "count": end - start + 1,
+                        "more_body": True,
+                    })
+                    continue
+                await file.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def ranged_file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    headers: Optional[Dict[str, str]] = None,
+    etag: Optional[str] = None,
+    file_size: Optional[int] = None,
+    modified_at: Optional[datetime] = None,
+) -> Response:
+    """Serve o arquivo em blocos: 200 inteiro, 206 com o(s) intervalo(s) pedido(s) ou 416.
+
+    If-Range (ETag ou a data de Last-Modified) diferente da versão atual faz o Range ser
+    ignorado: o arquivo mudou e o cliente recebe o arquivo inteiro. file_size e modified_at
+    (UTC), quando já conhecidos, dispensam o stat do arquivo.
+    """
+    if file_size is None or modified_at is None:
+        stat = os.stat(path)
+        file_size, mtime = stat.st_size, stat.st_mtime
+    else:
+        mtime = (modified_at if modified_at.tzinfo else modified_at.replace(tzinfo=timezone.utc)).timestamp()
+    last_modified = formatdate(mtime, usegmt=True)
+    response_headers = {"Accept-Ranges": "bytes", "Last-Modified": last_modified, **(headers or {})}
+    if etag:
+        response_headers["ETag"] = etag
+
+    byte_ranges = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (not if_range or if_range in (etag, last_modified)):
+        try:
+            byte_ranges = parse_byte_ranges(range_header, file_size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**response_headers, "Content-Range": f"bytes */{file_size}"},
+            )
+
+    return FileRangeResponse(path, file_size, media_type, ranges=byte_ranges, headers=response_headers)
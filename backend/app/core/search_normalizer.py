@@ -21,6 +21,18 @@ def _remove_accents(text: str) -> str:
     return "".join(c for c in nfd if unicodedata.category(c) != "Mn")
 
 
+def fold_search_text(text: Optional[str]) -> Optional[str]:
+    """
+    Dobra um texto para comparação sem acento e sem caixa (sem remover stop words).
+    Usado em campos curtos como tom, ritmo e categoria, onde "E" ou "A" são valores válidos.
+    """
+    if not text or not isinstance(text, str):
+        return None
+    words = _remove_accents(text.strip().lower()).split()
+    result = " ".join(words)
+    return result if result else None
+
+
 def normalize_search_query(text: Optional[str]) -> Optional[str]:
     """
     Normaliza um termo de busca para uso em queries:
@@ -28,15 +40,14 @@ def normalize_search_query(text: Optional[str]) -> Optional[str]:
     - Aplica lower e strip
     - Remove stop words em português
     - Retorna None ou string vazia quando não sobra termo relevante.
+
+    A coluna praises.name_search é gravada com as mesmas regras, então o
+    termo normalizado pode ser comparado diretamente com ela.
     """
-    if not text or not isinstance(text, str):
-        return None
-    raw = text.strip()
-    if not raw:
+    folded = fold_search_text(text)
+    if not folded:
         return None
-    lower = raw.lower()
-    unaccented = _remove_accents(lower)
-    words = unaccented.split()
+    words = folded.split()
     # Remover stop words (já sem acento)
     kept = [w for w in words if w and w not in _STOP_WORDS]
     result = " ".join(kept).strip()
@@ -56,6 +56,26 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
+def create_archive_part_token(archive_id: str) -> str:
+    """Token de curta duração (ARCHIVE_PART_URL_TTL_SECONDS) que autoriza baixar as partes do lote.
+
+    Vai na URL da parte (?token=), para o navegador baixar direto, com Range e retomada.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(seconds=settings.ARCHIVE_PART_URL_TTL_SECONDS)
+    to_encode = {"archive_id": archive_id, "type": "archive_part", "exp": expire}
+    return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+def verify_archive_part_token(token: str, archive_id: str) -> bool:
+    payload = decode_access_token(token)
+    return (
+        payload is not None
+        and payload.get("type") == "archive_part"
+        and payload.get("archive_id") == archive_id
+    )
+
+
+
 
 
 
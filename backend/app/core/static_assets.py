@@ -0,0 +1,30 @@
+"""Arquivos de /assets servidos pela API (sem nginx na frente, ex.: desenvolvimento)."""
+import os
+from urllib.parse import parse_qs
+
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
+
+from app.core.conditional_get import FILE_CACHE_CONTROL, IMMUTABLE_CACHE_CONTROL
+
+
+class VersionedStaticFiles(StaticFiles):
+    """StaticFiles com Cache-Control conforme a URL seja versionada (?v=) ou não.
+
+    O Starlette já envia ETag e Last-Modified a partir do stat e responde 304 a
+    If-None-Match / If-Modified-Since sem abrir o arquivo. URLs geradas pela API trazem
+    ?v=file_version e mudam quando o arquivo é substituído: podem ser guardadas como immutable.
+    """
+
+    def file_response(
+        self,
+        full_path: "os.PathLike[str]",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL if query.get("v") else FILE_CACHE_CONTROL
+        return response
@@ -0,0 +1,216 @@
+"""
+Leitura antecipada e concorrente dos arquivos do storage na montagem de ZIPs.
+
+Ler os materiais um a um (existe? tamanho? conteúdo?) deixa a montagem limitada pela latência:
+com o Wasabi cada arquivo custa várias idas e voltas HTTP antes do primeiro byte. Aqui um pool
+de STORAGE_PREFETCH_WORKERS threads consulta os metadados e baixa os próximos arquivos enquanto
+o ZIP grava o atual, e os resultados são entregues na ordem original.
+
+A memória é limitada por STORAGE_PREFETCH_MAX_BYTES, um orçamento único do processo dividido
+entre todas as montagens simultâneas (downloads de ZIP e jobs de lote): um download só começa
+se o seu tamanho couber no que resta (reservado na ordem dos arquivos, então o próximo da fila
+nunca espera por um posterior) e o espaço volta quando o consumidor passa ao arquivo seguinte.
+Nada espera pelo orçamento: o arquivo que chega à vez sem ter sido antecipado (maior que o
+orçamento ou orçamento ocupado por outras montagens) é lido em blocos (iter_chunks).
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from app.core.config import settings
+from app.infrastructure.storage.storage_client import StorageClient
+
+T = TypeVar("T")
+
+# Blocos entregues a partir de um arquivo já baixado
+_DATA_CHUNK_SIZE = 1024 * 1024
+_END = object()
+
+
+class ByteBudget:
+    """Bytes reservados por downloads antecipados, compartilhados pelas threads do processo."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.reserved = 0
+        self._lock = threading.Lock()
+
+    def try_reserve(self, size: int) -> bool:
+        with self._lock:
+            if self.reserved + size > self.capacity:
+                return False
+            self.reserved += size
+            return True
+
+    def release(self, size: int) -> None:
+        if size:
+            with self._lock:
+                self.reserved -= size
+
+
+# Orçamento único por processo (worker)
+prefetch_budget = ByteBudget(settings.STORAGE_PREFETCH_MAX_BYTES)
+
+
+@dataclass
+class FileStat:
+    """Metadados de um arquivo do storage (size e mtime só quando ele existe)."""
+    exists: bool
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+
+
+def stat_file(storage: StorageClient, path: str, with_mtime: bool = False) -> FileStat:
+    if not storage.file_exists(path):
+        return FileStat(exists=False)
+    return FileStat(
+        exists=True,
+        size=storage.get_file_size(path),
+        mtime=storage.get_file_mtime(path) if with_mtime else None,
+    )
+
+
+def stat_files(
+    storage: StorageClient,
+    paths: Sequence[str],
+    with_mtime: bool = False,
+    workers: Optional[int] = None,
+) -> List[FileStat]:
+    """Metadados de vários arquivos consultados em paralelo, na ordem de paths."""
+    if len(paths) <= 1:
+        return [stat_file(storage, path, with_mtime) for path in paths]
+    workers = min(workers or settings.STORAGE_PREFETCH_WORKERS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="storage-stat") as executor:
+        return list(executor.map(lambda path: stat_file(storage, path, with_mtime), paths))
+
+
+class PrefetchedFile:
+    """Arquivo entregue pelo prefetch: metadados e conteúdo (já baixado ou lido em blocos)."""
+
+    def __init__(
+        self,
+        storage: StorageClient,
+        path: str,
+        stat: Optional[FileStat],
+        data: Optional[bytes] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.storage = storage
+        self.path = path
+        self.stat = stat
+        self.data = data
+        self.error = error
+
+    def chunks(self) -> Iterator[bytes]:
+        """Conteúdo em blocos; levanta o erro da consulta ou do download, se houve."""
+        if self.error is not None:
+            raise self.error
+        if self.data is None:
+            return self.storage.iter_chunks(self.path)
+        data = self.data
+        return (data[start:start + _DATA_CHUNK_SIZE] for start in range(0, len(data), _DATA_CHUNK_SIZE))
+
+
+class _Slot:
+    __slots__ = ("item", "path", "stat", "fetch", "size")
+
+    def __init__(self, item, path: str, stat: Future):
+        self.item = item
+        self.path = path
+        self.stat = stat
+        self.fetch: Optional[Future] = None
+        # Bytes reservados no orçamento (0 enquanto não há download antecipado)
+        self.size = 0
+
+
+def prefetch_files(
+    storage: StorageClient,
+    items: Iterable[T],
+    path_of: Callable[[T], str],
+    stats: Optional[Sequence[Optional[FileStat]]] = None,
+    workers: Optional[int] = None,
+    budget: Optional[ByteBudget] = None,
+) -> Iterator[Tuple[T, PrefetchedFile]]:
+    """Gera (item, arquivo) na ordem de items, com metadados e conteúdo buscados à frente.
+
+    stats, se informado (alinhado com items), dispensa a consulta de metadados dos itens com
+    FileStat (os None são consultados no storage). Arquivos
+    inexistentes vêm com stat.exists False; falhas na consulta ou no download vêm em error
+    (e são levantadas por chunks()). O orçamento (prefetch_budget, salvo budget) do arquivo é
+    liberado quando o consumidor pede o próximo.
+    """
+    workers = workers or settings.STORAGE_PREFETCH_WORKERS
+    budget = prefetch_budget if budget is None else budget
+    # Metadados consultados à frente: bastante para manter o pool de downloads ocupado
+    lookahead = workers * 4
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="storage-prefetch")
+    known_stats = iter(stats) if stats is not None else None
+    pending = iter(items)
+    window: Deque[_Slot] = deque()
+
+    def fill() -> None:
+        while len(window) < lookahead:
+            item = next(pending, _END)
+            if item is _END:
+                return
+            path = path_of(item)
+            known = next(known_stats) if known_stats is not None else None
+            if known is not None:
+                stat_future: Future = Future()
+                stat_future.set_result(known)
+            else:
+                stat_future = executor.submit(stat_file, storage, path)
+            window.append(_Slot(item, path, stat_future))
+
+    def schedule() -> None:
+        """Inicia downloads na ordem enquanto couberem no orçamento."""
+        for slot in window:
+            if slot.fetch is not None:
+                continue
+            if not slot.stat.done():
+                return
+            if slot.stat.exception() is not None:
+                continue
+            stat = slot.stat.result()
+            if not stat.exists or not stat.size or stat.size > budget.capacity:
+                continue
+            if not budget.try_reserve(stat.size):
+                return
+            slot.size = stat.size
+            slot.fetch = executor.submit(storage.download_file, slot.path)
+
+    try:
+        fill()
+        while window:
+            schedule()
+            slot = window[0]
+            try:
+                stat = slot.stat.result()
+            except Exception as e:
+                result = PrefetchedFile(storage, slot.path, None, error=e)
+            else:
+                schedule()
+                if slot.fetch is None:
+                    result = PrefetchedFile(storage, slot.path, stat)
+                else:
+                    try:
+                        result = PrefetchedFile(storage, slot.path, stat, data=slot.fetch.result())
+                    except Exception as e:
+                        result = PrefetchedFile(storage, slot.path, stat, error=e)
+
+            yield slot.item, result
+
+            window.popleft()
+            budget.release(slot.size)
+            fill()
+    finally:
+        # Consumidor parou antes do fim: downloads em andamento devolvem o orçamento ao terminar
+        for slot in window:
+            if slot.fetch is None or slot.fetch.cancel():
+                budget.release(slot.size)
+            else:
+                slot.fetch.add_done_callback(lambda _, size=slot.size: budget.release(size))
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,91 @@
+"""
+ZIP em streaming: gera o arquivo à medida que as entradas são lidas, sem montá-lo em memória.
+
+Usa o ArchiveBuilder (mesma política de compressão dos lotes) sobre uma saída não posicionável
+(sem seek): cada entrada recebe o cabeçalho local e, ao final dos dados, um data descriptor com
+CRC e tamanhos, e o diretório central vai no fim. Os bytes produzidos são repassados em blocos
+para o StreamingResponse, então o primeiro byte sai logo e a saída em memória fica limitada a
+um bloco por conexão. Os arquivos antecipados pelo prefetch (storage_prefetch) ocupam, somados
+entre todas as conexões, no máximo STORAGE_PREFETCH_MAX_BYTES por processo.
+"""
+
+import io
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+from app.core.archive_builder import ArchiveBuilder, peek_chunks
+
+# Tamanho dos blocos entregues ao cliente
+ZIP_STREAM_FLUSH_BYTES = 256 * 1024
+
+
+@dataclass
+class ZipStreamEntry:
+    """Entrada do ZIP: nome no arquivo e função que devolve os blocos do conteúdo."""
+    name: str
+    open_chunks: Callable[[], Iterable[bytes]]
+    # Tamanho esperado (quando conhecido): decide se a entrada precisa de ZIP64
+    size: Optional[int] = None
+    # None: STORED/DEFLATED pela política do ArchiveBuilder (extensão ou entropia)
+    compress_type: Optional[int] = None
+
+
+class _ZipSink(io.RawIOBase):
+    """Saída sem seek que só acumula os bytes escritos pelo zipfile até serem drenados."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._pending = 0
+        self._offset = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._pending += len(data)
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self._pending = 0
+        return data
+
+
+def stream_zip(
+    entries: Iterable[ZipStreamEntry],
+    on_error: Optional[Callable[[ZipStreamEntry, Exception], None]] = None,
+) -> Iterator[bytes]:
+    """Gera os bytes do ZIP com as entradas, na ordem.
+
+    O primeiro bloco de cada entrada é lido antes de escrever o cabeçalho: se a leitura
+    falhar aí (arquivo ausente, erro do storage), a entrada é pulada e on_error é chamado;
+    as entradas seguintes continuam. Falhas no meio de um arquivo interrompem o ZIP.
+    """
+    sink = _ZipSink()
+    with ArchiveBuilder(sink) as builder:
+        for entry in entries:
+            try:
+                _, chunks = peek_chunks(entry.open_chunks())
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(entry, e)
+                continue
+
+            for _ in builder.write_entry(entry.name, chunks, size=entry.size, compress_type=entry.compress_type):
+                if sink.pending >= ZIP_STREAM_FLUSH_BYTES:
+                    yield sink.drain()
+            if sink.pending >= ZIP_STREAM_FLUSH_BYTES:
+                yield sink.drain()
+    yield sink.drain()
@@ -3,6 +3,7 @@ from app.domain.models.material_kind import MaterialKind
 from app.domain.models.material_type import MaterialType as MaterialTypeModel
 from app.domain.models.praise_material import PraiseMaterial, MaterialType
 from app.domain.models.praise import Praise
+from app.domain.models.praise_catalog_entry import PraiseCatalogEntry
 from app.domain.models.user import User
 from app.domain.models.language import Language
 from app.domain.models.material_kind_translation import MaterialKindTranslation
@@ -10,6 +11,7 @@ from app.domain.models.praise_tag_translation import PraiseTagTranslation
 from app.domain.models.material_type_translation import MaterialTypeTranslation
 from app.domain.models.audit_log import AuditLog, AuditActionType
 from app.domain.models.consent import UserConsent
+from app.domain.models.table_version import TableVersion
 
 __all__ = [
     "PraiseTag",
@@ -18,6 +20,7 @@ __all__ = [
     "PraiseMaterial",
     "MaterialType",  # Enum temporário para compatibilidade
     "Praise",
+    "PraiseCatalogEntry",
     "User",
     "Language",
     "MaterialKindTranslation",
@@ -26,6 +29,7 @@ __all__ = [
     "AuditLog",
     "AuditActionType",
     "UserConsent",
+    "TableVersion",
 ]
 
 
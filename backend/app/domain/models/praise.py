@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Table, ForeignKey, Boolean, text
+from sqlalchemy import Column, String, Integer, DateTime, Table, ForeignKey, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -33,6 +33,13 @@ class Praise(Base):
     tonality = Column(String(50), nullable=True)
     category = Column(String(255), nullable=True)
 
+    # Colunas de busca normalizadas (sem acento, minúsculas), mantidas pelo PraiseService
+    # e indexadas com pg_trgm para buscas por substring (ver migração 015)
+    name_search = Column(String, nullable=True)
+    tonality_search = Column(String(50), nullable=True)
+    rhythm_search = Column(String(100), nullable=True)
+    category_search = Column(String(255), nullable=True)
+
     # Many-to-many relationship with PraiseTag
     tags = relationship(
         "PraiseTag",
@@ -43,6 +50,13 @@ class Praise(Base):
     # One-to-many relationship with PraiseMaterial
     materials = relationship("PraiseMaterial", back_populates="praise", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_praises_name_search_trgm", "name_search", postgresql_using="gin", postgresql_ops={"name_search": "gin_trgm_ops"}),
+        Index("ix_praises_tonality_search_trgm", "tonality_search", postgresql_using="gin", postgresql_ops={"tonality_search": "gin_trgm_ops"}),
+        Index("ix_praises_rhythm_search_trgm", "rhythm_search", postgresql_using="gin", postgresql_ops={"rhythm_search": "gin_trgm_ops"}),
+        Index("ix_praises_category_search_trgm", "category_search", postgresql_using="gin", postgresql_ops={"category_search": "gin_trgm_ops"}),
+    )
+
     def __repr__(self):
         return f"<Praise(id={self.id}, name='{self.name}', number={self.number})>"
 
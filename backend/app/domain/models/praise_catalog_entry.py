@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+from app.infrastructure.database.database import Base
+
+
+class PraiseCatalogEntry(Base):
+    """Modelo de leitura desnormalizado: uma linha por praise com o PraiseResponse pronto.
+
+    document guarda o praise já serializado (campos, tags {id, name} e materiais com
+    kind/type), mantido pelo PraiseCatalogService a cada escrita. A linha é removida em
+    cascata junto com o praise; linhas ausentes são recriadas na próxima leitura.
+    """
+    __tablename__ = "praise_catalog_entries"
+
+    praise_id = Column(UUID(as_uuid=True), ForeignKey("praises.id", ondelete="CASCADE"), primary_key=True)
+    document = Column(JSONB, nullable=False)
+    refreshed_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<PraiseCatalogEntry(praise_id={self.praise_id})>"
@@ -1,6 +1,6 @@
-from sqlalchemy import Boolean, Column, String, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Integer, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 import uuid
 from app.infrastructure.database.database import Base
 
@@ -26,12 +26,28 @@ class PraiseMaterial(Base):
     praise_id = Column(UUID(as_uuid=True), ForeignKey("praises.id"), nullable=False)
     is_old = Column(Boolean, nullable=False, default=False, server_default='false')
     old_description = Column(String(2000), nullable=True)
+    # Incrementado quando o arquivo é substituído: versiona a URL de download (cache immutable)
+    file_version = Column(Integer, nullable=False, default=1, server_default='1')
+    # Metadados do arquivo (PDF/áudio), gravados no upload/importação e reparados por
+    # scripts/reconcile_material_files.py; vazios em links/texto ou enquanto desconhecidos
+    file_size = Column(BigInteger, nullable=True)
+    content_type = Column(String(255), nullable=True)
+    checksum = Column(String(64), nullable=True)  # sha256 (hex) do conteúdo
+    resolved_path = Column(String, nullable=True)  # caminho absoluto no storage local
+    file_modified_at = Column(DateTime, nullable=True)  # UTC
+    # Vetor de busca da letra (config pt_unaccent); preenchido apenas para materiais Lyrics/text.
+    # deferred: não é carregado nas consultas normais, só usado em filtros/ranking no banco.
+    lyrics_tsv = deferred(Column(TSVECTOR, nullable=True))
 
     # Relationships
     material_kind = relationship("MaterialKind", back_populates="materials")
     material_type = relationship("MaterialType", back_populates="materials")
     praise = relationship("Praise", back_populates="materials")
 
+    __table_args__ = (
+        Index("ix_praise_materials_lyrics_tsv", "lyrics_tsv", postgresql_using="gin"),
+    )
+
     def __repr__(self):
         return f"<PraiseMaterial(id={self.id}, material_type_id='{self.material_type_id}', path='{self.path}')>"
 
@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Column, String, text
+from app.infrastructure.database.database import Base
+
+
+class TableVersion(Base):
+    """Contador de alterações por tabela (view sobre as sequences table_version_<tabela>_seq).
+
+    Incrementado por trigger a cada INSERT/UPDATE/DELETE e após o commit das sessões da
+    aplicação (app/infrastructure/database/table_versions.py). Usado para gerar ETags das
+    leituras do catálogo sem carregar os dados (ver migrações 019 e 023). Somente leitura.
+    """
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(63), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default=text("0"))
+
+    def __repr__(self):
+        return f"<TableVersion(table_name='{self.table_name}', version={self.version})>"
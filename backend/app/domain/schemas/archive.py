@@ -0,0 +1,53 @@
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from uuid import UUID
+from datetime import datetime
+
+
+class ArchivePart(BaseModel):
+    filename: str
+    size: int
+    file_count: int
+    url: str
+
+
+class ArchiveSkippedMaterial(BaseModel):
+    material_id: UUID
+    praise_name: str
+    path: str
+    reason: str
+
+
+class ArchiveManifest(BaseModel):
+    """Lote de download gravado em disco: partes (ZIP) baixáveis com Range até expires_at."""
+    archive_id: str
+    created_at: datetime
+    expires_at: datetime
+    total_files: int
+    parts: List[ArchivePart] = []
+    skipped: List[ArchiveSkippedMaterial] = []
+
+
+class ArchiveJobCreate(BaseModel):
+    """Pedido de lote em segundo plano: materiais dos material kinds nos praises das tags.
+
+    Com um material kind e uma tag equivale a GET /praises/download-by-material-kind.
+    """
+    material_kind_ids: List[UUID] = Field(default_factory=list, max_length=100)
+    tag_ids: List[UUID] = Field(default_factory=list, max_length=100)
+    operation: Literal["union", "intersection"] = "union"
+    max_zip_size_mb: int = Field(100, ge=10, le=10000)
+
+
+class ArchiveJob(BaseModel):
+    """Estado de um job de lote; archive só vem preenchido com status completed."""
+    job_id: str
+    status: Literal["queued", "running", "completed", "failed", "expired"]
+    created_at: datetime
+    updated_at: datetime
+    files_total: int
+    files_done: int
+    bytes_written: int
+    skipped: List[ArchiveSkippedMaterial] = []
+    error: Optional[str] = None
+    archive: Optional[ArchiveManifest] = None
@@ -0,0 +1,131 @@
+"""
+Serialização rápida das listagens (FAST_JSON_RESPONSES=true).
+
+Monta dicts só com tipos JSON a partir do resultado da consulta (documentos do modelo de
+leitura, linhas de resumo, entidades ORM), sem validação Pydantic por objeto, para serem
+codificados com ORJSONResponse. A saída tem que ser idêntica, byte a byte, à do caminho
+padrão (response_model + JSONResponse): mesmas chaves, na ordem dos campos dos schemas,
+e mesmos formatos de UUID e datetime. scripts/check_fast_serialization_contract.py compara
+os dois caminhos; ao mudar PraiseResponse, PraiseSummaryResponse ou PraiseMaterialResponse,
+atualize também as funções abaixo.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def _uuid(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def _datetime(value: Any) -> Optional[str]:
+    """Mesmo formato do Pydantic em mode="json" (ISO 8601; UTC como "Z")."""
+    if value is None or isinstance(value, str):
+        return value
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _named(value: Any) -> Optional[Dict[str, Any]]:
+    """MaterialKindResponse / MaterialTypeResponse (ORM ou dict): {name, id}."""
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return {"name": value["name"], "id": _uuid(value["id"])}
+    return {"name": value.name, "id": _uuid(value.id)}
+
+
+def _tag(tag: Dict[str, Any]) -> Dict[str, Any]:
+    """PraiseTagSimple: {id, name}."""
+    return {"id": _uuid(tag["id"]), "name": tag["name"]}
+
+
+def praise_document_to_dict(document: Dict[str, Any]) -> Dict[str, Any]:
+    """PraiseResponse a partir do documento de praise_catalog_entries.
+
+    O documento já está em formato JSON, mas o JSONB não preserva a ordem das chaves:
+    aqui elas voltam para a ordem dos campos do schema.
+    """
+    return {
+        "name": document["name"],
+        "number": document.get("number"),
+        "author": document.get("author"),
+        "rhythm": document.get("rhythm"),
+        "tonality": document.get("tonality"),
+        "category": document.get("category"),
+        "id": document["id"],
+        "created_at": document["created_at"],
+        "updated_at": document["updated_at"],
+        "tags": [_tag(tag) for tag in document.get("tags") or []],
+        "materials": [
+            {
+                "id": material["id"],
+                "material_kind_id": material["material_kind_id"],
+                "material_type_id": material["material_type_id"],
+                "path": material["path"],
+                "is_old": material.get("is_old", False),
+                "old_description": material.get("old_description"),
+                "file_version": material.get("file_version", 1),
+                "material_kind": _named(material.get("material_kind")),
+                "material_type": _named(material.get("material_type")),
+            }
+            for material in document.get("materials") or []
+        ],
+        "in_review": document.get("in_review", False),
+        "in_review_description": document.get("in_review_description"),
+        "review_history": [
+            {"type": event["type"], "date": event["date"]}
+            for event in document.get("review_history") or []
+        ],
+    }
+
+
+def praise_documents_to_dicts(documents: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [praise_document_to_dict(document) for document in documents]
+
+
+# Conversão por campo de PraiseSummaryResponse (ordem = ordem dos campos do schema)
+_SUMMARY_CONVERTERS = {
+    "id": _uuid,
+    "name": None,
+    "number": None,
+    "author": None,
+    "rhythm": None,
+    "tonality": None,
+    "category": None,
+    "in_review": None,
+    "created_at": _datetime,
+    "updated_at": _datetime,
+    "tags": lambda tags: [_tag(tag) for tag in tags] if tags is not None else None,
+}
+
+
+def praise_summary_to_dict(item: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """PraiseSummaryResponse (só os campos pedidos) a partir de uma linha de get_summaries."""
+    wanted = set(fields)
+    result: Dict[str, Any] = {}
+    for field, convert in _SUMMARY_CONVERTERS.items():
+        if field not in wanted:
+            continue
+        value = item.get(field)
+        result[field] = convert(value) if convert is not None else value
+    return result
+
+
+def praise_material_to_dict(material: Any) -> Dict[str, Any]:
+    """PraiseMaterialResponse a partir da entidade PraiseMaterial (kind/type já carregados)."""
+    return {
+        "material_kind_id": _uuid(material.material_kind_id),
+        "material_type_id": _uuid(material.material_type_id),
+        "path": material.path,
+        "is_old": bool(material.is_old),
+        "old_description": material.old_description,
+        "id": _uuid(material.id),
+        "praise_id": _uuid(material.praise_id),
+        "file_version": material.file_version,
+        "material_kind": _named(material.material_kind),
+        "material_type": _named(material.material_type),
+    }
+
+
+def praise_materials_to_dicts(materials: Iterable[Any]) -> List[Dict[str, Any]]:
+    return [praise_material_to_dict(material) for material in materials]
@@ -60,6 +60,7 @@ class PraiseMaterialSimple(BaseModel):
     path: str
     is_old: bool = False
     old_description: Optional[str] = None
+    file_version: int = 1
     material_kind: Optional["MaterialKindResponse"] = None
     material_type: Optional["MaterialTypeResponse"] = None
 
@@ -88,6 +89,68 @@ class PraiseResponse(PraiseBase):
         extra = 'forbid'
 
 
+class PraiseSummaryResponse(BaseModel):
+    """Projeção leve de praise para listagens (view=summary / fields=): sem materiais nem histórico."""
+    id: UUID
+    name: Optional[str] = None
+    number: Optional[int] = None
+    author: Optional[str] = None
+    rhythm: Optional[str] = None
+    tonality: Optional[str] = None
+    category: Optional[str] = None
+    in_review: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    tags: Optional[List[PraiseTagSimple]] = None
+
+    model_config = ConfigDict(extra='forbid')
+
+
+# Campos aceitos em fields= e os usados por padrão em view=summary
+PRAISE_SUMMARY_FIELDS = tuple(PraiseSummaryResponse.model_fields.keys())
+PRAISE_SUMMARY_DEFAULT_FIELDS = ("id", "name", "number", "tonality", "tags")
+
+
+class FacetValueCount(BaseModel):
+    value: str
+    count: int
+
+
+class TagFacetCount(BaseModel):
+    id: UUID
+    name: str
+    count: int
+
+
+class PraiseFacetsResponse(BaseModel):
+    """Total de praises para os filtros atuais e contagens por valor de cada faceta."""
+    total: int
+    tonality: List[FacetValueCount] = []
+    rhythm: List[FacetValueCount] = []
+    category: List[FacetValueCount] = []
+    tags: List[TagFacetCount] = []
+
+
+class PraiseSuggestion(BaseModel):
+    """Sugestão do índice de busca em memória (typeahead)."""
+    id: UUID
+    name: str
+    number: Optional[int] = None
+    matched_in: Literal["number", "name", "lyrics"]
+
+
+class PraiseByIdsRequest(BaseModel):
+    """IDs pedidos de uma vez (ex.: repertório); a resposta segue esta ordem."""
+    ids: List[UUID] = Field(..., min_length=1, max_length=100)
+
+    model_config = ConfigDict(extra='forbid')
+
+
+class PraiseByIdsResponse(BaseModel):
+    items: List[PraiseResponse] = []
+    missing_ids: List[UUID] = []
+
+
 class ReviewActionRequest(BaseModel):
     action: Literal["start", "cancel", "finish"]
     in_review_description: Optional[str] = None  # used only for "start"
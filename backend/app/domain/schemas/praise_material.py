@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
 from uuid import UUID
 from app.domain.schemas.material_type import MaterialTypeResponse
 
@@ -29,6 +29,7 @@ class PraiseMaterialResponse(PraiseMaterialBase):
     praise_id: UUID
     is_old: bool = False
     old_description: Optional[str] = None
+    file_version: int = 1
     material_kind: Optional["MaterialKindResponse"] = None
     material_type: Optional[MaterialTypeResponse] = None
 
@@ -36,9 +37,22 @@ class PraiseMaterialResponse(PraiseMaterialBase):
         from_attributes = True
 
 
+class PraiseMaterialByIdsRequest(BaseModel):
+    """IDs pedidos de uma vez; a resposta segue esta ordem."""
+    ids: List[UUID] = Field(..., min_length=1, max_length=100)
+
+    model_config = ConfigDict(extra='forbid')
+
+
+class PraiseMaterialByIdsResponse(BaseModel):
+    items: List[PraiseMaterialResponse] = []
+    missing_ids: List[UUID] = []
+
+
 # Forward reference resolution
 from app.domain.schemas.material_kind import MaterialKindResponse
 PraiseMaterialResponse.model_rebuild()
+PraiseMaterialByIdsResponse.model_rebuild()
 
 
 
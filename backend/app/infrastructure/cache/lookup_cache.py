@@ -0,0 +1,265 @@
+"""
+Cache de tabelas de referência (material kinds/types, tags, linguagens e traduções).
+
+Cada processo (worker) mantém mapas por tabela com snapshots das colunas das linhas, nunca
+instâncias ORM: num acerto, o repositório recria a instância e a anexa à sessão atual com
+Session.merge(load=False), sem SQL. Assim as entidades retornadas continuam utilizáveis
+normalmente (relacionamentos, atualização, associação a praises).
+
+Invalidação:
+- escrita no próprio processo: os repositórios chamam invalidate() após o commit;
+- escritas de outros workers/scripts: o backend de versões compartilhado é consultado no
+  máximo a cada LOOKUP_CACHE_CHECK_SECONDS; versão diferente da vista descarta o mapa.
+
+Backends de versão: LocalVersionBackend (um processo; substituto em testes) e
+TableVersionBackend (contadores de table_versions, incrementados por trigger e após o commit,
+ver migrações 019, 020 e 023).
+
+Os contadores (stats) vão para o log a cada LOOKUP_CACHE_STATS_LOG_SECONDS e no encerramento
+do worker; não há endpoint público com eles.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Type, TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Marca de "consultado e não encontrado" (também fica em cache até a próxima invalidação)
+_MISSING = object()
+
+
+class LookupVersionBackend(Protocol):
+    """Versão atual de cada namespace (tabela), compartilhada entre processos ou não."""
+
+    def get_versions(self, namespaces: Iterable[str]) -> Dict[str, int]:
+        ...
+
+    def bump(self, namespace: str) -> None:
+        ...
+
+
+class LocalVersionBackend:
+    """Versões só em memória: para um único worker ou como substituto em testes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+
+    def get_versions(self, namespaces: Iterable[str]) -> Dict[str, int]:
+        with self._lock:
+            return {namespace: self._versions.get(namespace, 0) for namespace in namespaces}
+
+    def bump(self, namespace: str) -> None:
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+
+class TableVersionBackend:
+    """Versões de table_versions (incrementadas a cada escrita, de qualquer processo)."""
+
+    def get_versions(self, namespaces: Iterable[str]) -> Dict[str, int]:
+        from app.infrastructure.database.database import SessionLocal
+        from app.infrastructure.database.repositories.table_version_repository import TableVersionRepository
+
+        db = SessionLocal()
+        try:
+            return TableVersionRepository(db).get_versions(namespaces)
+        finally:
+            db.close()
+
+    def bump(self, namespace: str) -> None:
+        # O trigger e o hook após commit (table_versions.py) já incrementaram a versão
+        pass
+
+
+class LookupCache:
+    def __init__(self, backend: LookupVersionBackend, check_seconds: float = 5.0, enabled: bool = True):
+        self.backend = backend
+        self.check_seconds = check_seconds
+        self.enabled = enabled
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[Any, Any]] = {}
+        self._seen_versions: Dict[str, int] = {}
+        self._checked_at: Dict[str, float] = {}
+        # Geração local: impede gravar no cache um valor lido antes de uma invalidação
+        self._generations: Dict[str, int] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def get(self, namespace: str, key: Any, load: Callable[[], Any]) -> Any:
+        """Valor em cache para (namespace, key) ou o resultado de load(), que passa a ficar em cache."""
+        if not self.enabled:
+            return load()
+        self._sync(namespace)
+        with self._lock:
+            entries = self._entries.setdefault(namespace, {})
+            stats = self._stats_for(namespace)
+            if key in entries:
+                stats["hits"] += 1
+                value = entries[key]
+                return None if value is _MISSING else value
+            stats["misses"] += 1
+            generation = self._generations.get(namespace, 0)
+
+        value = load()
+        with self._lock:
+            if self._generations.get(namespace, 0) == generation:
+                self._entries.setdefault(namespace, {})[key] = _MISSING if value is None else value
+        return value
+
+    def invalidate(self, namespace: str) -> None:
+        """Descarta o mapa do namespace neste processo e avisa o backend (write-through)."""
+        with self._lock:
+            self._entries.pop(namespace, None)
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            self._stats_for(namespace)["invalidations"] += 1
+        try:
+            self.backend.bump(namespace)
+            version = self.backend.get_versions([namespace])[namespace]
+        except Exception as e:
+            logger.warning("Falha ao atualizar versão do cache %s: %s", namespace, e)
+            with self._lock:
+                self._checked_at.pop(namespace, None)
+            return
+        with self._lock:
+            self._seen_versions[namespace] = version
+            self._checked_at[namespace] = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            for namespace in list(self._entries):
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            self._entries.clear()
+            self._seen_versions.clear()
+            self._checked_at.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores por namespace (hits, misses, invalidations, entries) e hit ratio."""
+        with self._lock:
+            namespaces = {}
+            for namespace, counters in self._stats.items():
+                lookups = counters["hits"] + counters["misses"]
+                namespaces[namespace] = {
+                    **counters,
+                    "entries": len(self._entries.get(namespace, {})),
+                    "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else None,
+                }
+            return {
+                "enabled": self.enabled,
+                "backend": type(self.backend).__name__,
+                "check_seconds": self.check_seconds,
+                "namespaces": namespaces,
+            }
+
+    def _stats_for(self, namespace: str) -> Dict[str, int]:
+        return self._stats.setdefault(
+            namespace, {"hits": 0, "misses": 0, "invalidations": 0, "version_changes": 0}
+        )
+
+    def _sync(self, namespace: str) -> None:
+        """Consulta a versão compartilhada (com intervalo mínimo) e descarta o mapa se mudou."""
+        now = time.monotonic()
+        checked_at = self._checked_at.get(namespace)
+        if checked_at is not None and now - checked_at < self.check_seconds:
+            return
+        try:
+            version = self.backend.get_versions([namespace])[namespace]
+        except Exception as e:
+            # Sem backend não dá para confiar no mapa: descarta e lê do banco
+            logger.warning("Falha ao consultar versão do cache %s: %s", namespace, e)
+            with self._lock:
+                self._entries.pop(namespace, None)
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            return
+        with self._lock:
+            if self._seen_versions.get(namespace) != version:
+                if namespace in self._seen_versions:
+                    self._stats_for(namespace)["version_changes"] += 1
+                self._entries.pop(namespace, None)
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+                self._seen_versions[namespace] = version
+            self._checked_at[namespace] = now
+
+
+def _create_lookup_cache() -> LookupCache:
+    backend: LookupVersionBackend
+    if settings.LOOKUP_CACHE_BACKEND == "local":
+        backend = LocalVersionBackend()
+    else:
+        backend = TableVersionBackend()
+    return LookupCache(
+        backend,
+        check_seconds=settings.LOOKUP_CACHE_CHECK_SECONDS,
+        enabled=settings.LOOKUP_CACHE_ENABLED,
+    )
+
+
+# Instância única por processo (worker)
+lookup_cache = _create_lookup_cache()
+
+
+def log_lookup_cache_stats() -> None:
+    logger.info("Cache de referência: %s", json.dumps(lookup_cache.stats(), sort_keys=True))
+
+
+def start_lookup_cache_stats_logger() -> None:
+    """Registra os contadores no log a cada LOOKUP_CACHE_STATS_LOG_SECONDS (0 = desligado)."""
+    if not settings.LOOKUP_CACHE_ENABLED or settings.LOOKUP_CACHE_STATS_LOG_SECONDS <= 0:
+        return
+
+    def _loop():
+        while True:
+            time.sleep(settings.LOOKUP_CACHE_STATS_LOG_SECONDS)
+            try:
+                log_lookup_cache_stats()
+            except Exception as e:
+                logger.warning("Erro ao registrar estatísticas do cache de referência: %s", e)
+
+    threading.Thread(target=_loop, name="lookup-cache-stats", daemon=True).start()
+
+
+def _snapshot(instance: Any) -> Optional[Dict[str, Any]]:
+    if instance is None:
+        return None
+    return {attr.key: getattr(instance, attr.key) for attr in inspect(instance).mapper.column_attrs}
+
+
+def _attach(db: Session, model: Type[T], values: Dict[str, Any]) -> T:
+    """Recria a instância a partir do snapshot e a anexa à sessão sem consultar o banco."""
+    mapper = inspect(model)
+    identity_key = mapper.identity_key_from_primary_key(
+        [values[mapper.get_property_by_column(column).key] for column in mapper.primary_key]
+    )
+    existing = db.identity_map.get(identity_key)
+    if existing is not None:
+        # Já está na sessão (talvez com alterações ainda não gravadas): não sobrescrever
+        return existing
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return db.merge(instance, load=False)
+
+
+def cached_one(db: Session, model: Type[T], key: Any, load: Callable[[], Optional[T]]) -> Optional[T]:
+    """Busca de uma linha de tabela de referência via cache (namespace = nome da tabela)."""
+    values = lookup_cache.get(model.__tablename__, key, lambda: _snapshot(load()))
+    return _attach(db, model, values) if values is not None else None
+
+
+def cached_all(db: Session, model: Type[T], key: Any, load: Callable[[], List[T]]) -> List[T]:
+    """Busca de várias linhas de tabela de referência via cache (namespace = nome da tabela)."""
+    rows = lookup_cache.get(model.__tablename__, key, lambda: [_snapshot(item) for item in load()])
+    return [_attach(db, model, values) for values in rows]
+
+
+def invalidate_lookup(model: Type[Any]) -> None:
+    """Invalidação write-through, chamada pelos repositórios após commit de create/update/delete."""
+    lookup_cache.invalidate(model.__tablename__)
@@ -2,6 +2,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.infrastructure.database.table_versions import register_table_version_events
 
 engine = create_engine(
     settings.DATABASE_URL,
@@ -11,6 +12,8 @@ engine = create_engine(
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Versões de table_versions incrementadas também após o commit (ETags e cache de referência)
+register_table_version_events(SessionLocal, engine)
 
 Base = declarative_base()
 
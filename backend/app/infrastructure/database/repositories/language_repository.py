@@ -1,6 +1,7 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.domain.models.language import Language
+from app.infrastructure.cache.lookup_cache import cached_all, cached_one, invalidate_lookup
 from app.application.repositories import BaseRepository
 
 
@@ -13,22 +14,30 @@ class LanguageRepository(BaseRepository):
         return self.get_by_code(id)
 
     def get_by_code(self, code: str) -> Optional[Language]:
-        return self.db.query(Language).filter(Language.code == code).first()
+        return cached_one(
+            self.db, Language, ("get_by_code", code),
+            lambda: self.db.query(Language).filter(Language.code == code).first(),
+        )
 
     def get_all(self, skip: int = 0, limit: int = 100, active_only: bool = False) -> List[Language]:
-        query = self.db.query(Language)
-        if active_only:
-            query = query.filter(Language.is_active == True)
-        return query.offset(skip).limit(limit).all()
+        def load() -> List[Language]:
+            query = self.db.query(Language)
+            if active_only:
+                query = query.filter(Language.is_active == True)
+            return query.offset(skip).limit(limit).all()
+
+        return cached_all(self.db, Language, ("get_all", skip, limit, active_only), load)
 
     def create(self, language: Language) -> Language:
         self.db.add(language)
         self.db.commit()
+        invalidate_lookup(Language)
         self.db.refresh(language)
         return language
 
     def update(self, language: Language) -> Language:
         self.db.commit()
+        invalidate_lookup(Language)
         self.db.refresh(language)
         return language
 
@@ -37,5 +46,6 @@ class LanguageRepository(BaseRepository):
         if language:
             self.db.delete(language)
             self.db.commit()
+            invalidate_lookup(Language)
             return True
         return False
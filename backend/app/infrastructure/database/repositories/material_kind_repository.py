@@ -2,6 +2,8 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from app.domain.models.material_kind import MaterialKind
+from app.domain.models.material_kind_translation import MaterialKindTranslation
+from app.infrastructure.cache.lookup_cache import cached_all, cached_one, invalidate_lookup
 from app.application.repositories import BaseRepository
 
 
@@ -10,22 +12,33 @@ class MaterialKindRepository(BaseRepository):
         self.db = db
 
     def get_by_id(self, id: UUID) -> Optional[MaterialKind]:
-        return self.db.query(MaterialKind).filter(MaterialKind.id == id).first()
+        return cached_one(
+            self.db, MaterialKind, ("get_by_id", id),
+            lambda: self.db.query(MaterialKind).filter(MaterialKind.id == id).first(),
+        )
 
     def get_by_name(self, name: str) -> Optional[MaterialKind]:
-        return self.db.query(MaterialKind).filter(MaterialKind.name == name).first()
+        return cached_one(
+            self.db, MaterialKind, ("get_by_name", name),
+            lambda: self.db.query(MaterialKind).filter(MaterialKind.name == name).first(),
+        )
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[MaterialKind]:
-        return self.db.query(MaterialKind).offset(skip).limit(limit).all()
+        return cached_all(
+            self.db, MaterialKind, ("get_all", skip, limit),
+            lambda: self.db.query(MaterialKind).offset(skip).limit(limit).all(),
+        )
 
     def create(self, material_kind: MaterialKind) -> MaterialKind:
         self.db.add(material_kind)
         self.db.commit()
+        invalidate_lookup(MaterialKind)
         self.db.refresh(material_kind)
         return material_kind
 
     def update(self, material_kind: MaterialKind) -> MaterialKind:
         self.db.commit()
+        invalidate_lookup(MaterialKind)
         self.db.refresh(material_kind)
         return material_kind
 
@@ -34,6 +47,9 @@ class MaterialKindRepository(BaseRepository):
         if material_kind:
             self.db.delete(material_kind)
             self.db.commit()
+            invalidate_lookup(MaterialKind)
+            # Traduções removidas em cascata (delete-orphan)
+            invalidate_lookup(MaterialKindTranslation)
             return True
         return False
 
@@ -2,6 +2,7 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from app.domain.models.material_kind_translation import MaterialKindTranslation
+from app.infrastructure.cache.lookup_cache import cached_all, cached_one, invalidate_lookup
 
 
 class MaterialKindTranslationRepository:
@@ -9,32 +10,46 @@ class MaterialKindTranslationRepository:
         self.db = db
 
     def get_by_id(self, id: UUID) -> Optional[MaterialKindTranslation]:
-        return self.db.query(MaterialKindTranslation).filter(MaterialKindTranslation.id == id).first()
+        return cached_one(
+            self.db, MaterialKindTranslation, ("get_by_id", id),
+            lambda: self.db.query(MaterialKindTranslation).filter(MaterialKindTranslation.id == id).first(),
+        )
 
     def get_by_entity_and_language(self, material_kind_id: UUID, language_code: str) -> Optional[MaterialKindTranslation]:
-        return self.db.query(MaterialKindTranslation).filter(
-            MaterialKindTranslation.material_kind_id == material_kind_id,
-            MaterialKindTranslation.language_code == language_code
-        ).first()
+        return cached_one(
+            self.db, MaterialKindTranslation, ("get_by_entity_and_language", material_kind_id, language_code),
+            lambda: self.db.query(MaterialKindTranslation).filter(
+                MaterialKindTranslation.material_kind_id == material_kind_id,
+                MaterialKindTranslation.language_code == language_code
+            ).first(),
+        )
 
     def get_by_entity(self, material_kind_id: UUID) -> List[MaterialKindTranslation]:
-        return self.db.query(MaterialKindTranslation).filter(
-            MaterialKindTranslation.material_kind_id == material_kind_id
-        ).all()
+        return cached_all(
+            self.db, MaterialKindTranslation, ("get_by_entity", material_kind_id),
+            lambda: self.db.query(MaterialKindTranslation).filter(
+                MaterialKindTranslation.material_kind_id == material_kind_id
+            ).all(),
+        )
 
     def get_by_language(self, language_code: str) -> List[MaterialKindTranslation]:
-        return self.db.query(MaterialKindTranslation).filter(
-            MaterialKindTranslation.language_code == language_code
-        ).all()
+        return cached_all(
+            self.db, MaterialKindTranslation, ("get_by_language", language_code),
+            lambda: self.db.query(MaterialKindTranslation).filter(
+                MaterialKindTranslation.language_code == language_code
+            ).all(),
+        )
 
     def create(self, translation: MaterialKindTranslation) -> MaterialKindTranslation:
         self.db.add(translation)
         self.db.commit()
+        invalidate_lookup(MaterialKindTranslation)
         self.db.refresh(translation)
         return translation
 
     def update(self, translation: MaterialKindTranslation) -> MaterialKindTranslation:
         self.db.commit()
+        invalidate_lookup(MaterialKindTranslation)
         self.db.refresh(translation)
         return translation
 
@@ -43,5 +58,6 @@ class MaterialKindTranslationRepository:
         if translation:
             self.db.delete(translation)
             self.db.commit()
+            invalidate_lookup(MaterialKindTranslation)
             return True
         return False
@@ -2,6 +2,8 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from app.domain.models.material_type import MaterialType
+from app.domain.models.material_type_translation import MaterialTypeTranslation
+from app.infrastructure.cache.lookup_cache import cached_all, cached_one, invalidate_lookup
 from app.application.repositories import BaseRepository
 
 
@@ -10,22 +12,33 @@ class MaterialTypeRepository(BaseRepository):
         self.db = db
 
     def get_by_id(self, id: UUID) -> Optional[MaterialType]:
-        return self.db.query(MaterialType).filter(MaterialType.id == id).first()
+        return cached_one(
+            self.db, MaterialType, ("get_by_id", id),
+            lambda: self.db.query(MaterialType).filter(MaterialType.id == id).first(),
+        )
 
     def get_by_name(self, name: str) -> Optional[MaterialType]:
-        return self.db.query(MaterialType).filter(MaterialType.name == name).first()
+        return cached_one(
+            self.db, MaterialType, ("get_by_name", name),
+            lambda: self.db.query(MaterialType).filter(MaterialType.name == name).first(),
+        )
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[MaterialType]:
-        return self.db.query(MaterialType).offset(skip).limit(limit).all()
+        return cached_all(
+            self.db, MaterialType, ("get_all", skip, limit),
+            lambda: self.db.query(MaterialType).offset(skip).limit(limit).all(),
+        )
 
     def create(self, material_type: MaterialType) -> MaterialType:
         self.db.add(material_type)
         self.db.commit()
+        invalidate_lookup(MaterialType)
         self.db.refresh(material_type)
         return material_type
 
     def update(self, material_type: MaterialType) -> MaterialType:
         self.db.commit()
+        invalidate_lookup(MaterialType)
         self.db.refresh(material_type)
         return material_type
 
@@ -34,5 +47,8 @@ class MaterialTypeRepository(BaseRepository):
         if material_type:
             self.db.delete(material_type)
             self.db.commit()
+            invalidate_lookup(MaterialType)
+            # Traduções removidas em cascata (delete-orphan)
+            invalidate_lookup(MaterialTypeTranslation)
             return True
         return False
@@ -2,6 +2,7 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from app.domain.models.material_type_translation import MaterialTypeTranslation
+from app.infrastructure.cache.lookup_cache import cached_all, cached_one, invalidate_lookup
 
 
 class MaterialTypeTranslationRepository:
@@ -9,32 +10,46 @@ class MaterialTypeTranslationRepository:
         self.db = db
 
     def get_by_id(self, id: UUID) -> Optional[MaterialTypeTranslation]:
-        return self.db.query(MaterialTypeTranslation).filter(MaterialTypeTranslation.id == id).first()
+        return cached_one(
+            self.db, MaterialTypeTranslation, ("get_by_id", id),
+            lambda: self.db.query(MaterialTypeTranslation).filter(MaterialTypeTranslation.id == id).first(),
+        )
 
     def get_by_entity_and_language(self, material_type_id: UUID, language_code: str) -> Optional[MaterialTypeTranslation]:
-        return self.db.query(MaterialTypeTranslation).filter(
-            MaterialTypeTranslation.material_type_id == material_type_id,
-            MaterialTypeTranslation.language_code == language_code
-        ).first()
+        return cached_one(
+            self.db, MaterialTypeTranslation, ("get_by_entity_and_language", material_type_id, language_code),
+            lambda: self.db.query(MaterialTypeTranslation).filter(
+                MaterialTypeTranslation.material_type_id == material_type_id,
+                MaterialTypeTranslation.language_code == language_code
+            ).first(),
+        )
 
     def get_by_entity(self, material_type_id: UUID) -> List[MaterialTypeTranslation]:
-        return self.db.query(MaterialTypeTranslation).filter(
-            MaterialTypeTranslation.material_type_id == material_type_id
-        ).all()
+        return cached_all(
+            self.db, MaterialTypeTranslation, ("get_by_entity", material_type_id),
+            lambda: self.db.query(MaterialTypeTranslation).filter(
+                MaterialTypeTranslation.material_type_id == material_type_id
+            ).all(),
+        )
 
     def get_by_language(self, language_code: str) -> List[MaterialTypeTranslation]:
-        return self.db.query(MaterialTypeTranslation).filter(
-            MaterialTypeTranslation.language_code == language_code
-        ).all()
+        return cached_all(
+            self.db, MaterialTypeTranslation, ("get_by_language", language_code),
+            lambda: self.db.query(MaterialTypeTranslation).filter(
+                MaterialTypeTranslation.language_code == language_code
+            ).all(),
+        )
 
     def create(self, translation: MaterialTypeTranslation) -> MaterialTypeTranslation:
         self.db.add(translation)
         self.db.commit()
+        invalidate_lookup(MaterialTypeTranslation)
         self.db.refresh(translation)
         return translation
 
     def update(self, translation: MaterialTypeTranslation) -> MaterialTypeTranslation:
         self.db.commit()
+        invalidate_lookup(MaterialTypeTranslation)
         self.db.refresh(translation)
         return translation
 
@@ -43,5 +58,6 @@ class MaterialTypeTranslationRepository:
         if translation:
             self.db.delete(translation)
             self.db.commit()
+            invalidate_lookup(MaterialTypeTranslation)
             return True
         return False
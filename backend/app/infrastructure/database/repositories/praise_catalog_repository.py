@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from app.domain.models.praise import Praise, praise_tag_association
+from app.domain.models.praise_catalog_entry import PraiseCatalogEntry
+from app.domain.models.praise_material import PraiseMaterial
+
+
+class PraiseCatalogRepository:
+    """Acesso à tabela praise_catalog_entries (modelo de leitura, busca só por chave primária)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_document(self, praise_id: UUID) -> Optional[Dict[str, Any]]:
+        row = (
+            self.db.query(PraiseCatalogEntry.document)
+            .filter(PraiseCatalogEntry.praise_id == praise_id)
+            .first()
+        )
+        return row.document if row else None
+
+    def get_refreshed_at(self, praise_id: UUID) -> Optional[datetime]:
+        """Quando o documento foi gravado pela última vez (validador do GET condicional)."""
+        return (
+            self.db.query(PraiseCatalogEntry.refreshed_at)
+            .filter(PraiseCatalogEntry.praise_id == praise_id)
+            .scalar()
+        )
+
+    def get_documents(self, praise_ids: List[UUID]) -> Dict[UUID, Dict[str, Any]]:
+        if not praise_ids:
+            return {}
+        rows = (
+            self.db.query(PraiseCatalogEntry.praise_id, PraiseCatalogEntry.document)
+            .filter(PraiseCatalogEntry.praise_id.in_(praise_ids))
+            .all()
+        )
+        return {praise_id: document for praise_id, document in rows}
+
+    def upsert_many(self, documents: Dict[UUID, Dict[str, Any]]) -> None:
+        if not documents:
+            return
+        now = datetime.utcnow()
+        stmt = insert(PraiseCatalogEntry).values([
+            {"praise_id": praise_id, "document": document, "refreshed_at": now}
+            for praise_id, document in documents.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PraiseCatalogEntry.praise_id],
+            set_={"document": stmt.excluded.document, "refreshed_at": stmt.excluded.refreshed_at},
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+
+    def insert_missing(self, documents: Dict[UUID, Dict[str, Any]]) -> None:
+        """Grava só as linhas que ainda não existem (não sobrescreve um refresh mais novo)."""
+        if not documents:
+            return
+        now = datetime.utcnow()
+        stmt = insert(PraiseCatalogEntry).values([
+            {"praise_id": praise_id, "document": document, "refreshed_at": now}
+            for praise_id, document in documents.items()
+        ])
+        self.db.execute(stmt.on_conflict_do_nothing(index_elements=[PraiseCatalogEntry.praise_id]))
+        self.db.commit()
+
+    def get_missing_praise_ids(self) -> List[UUID]:
+        """IDs dos praises sem linha no modelo de leitura."""
+        rows = (
+            self.db.query(Praise.id)
+            .outerjoin(PraiseCatalogEntry, PraiseCatalogEntry.praise_id == Praise.id)
+            .filter(PraiseCatalogEntry.praise_id.is_(None))
+            .order_by(Praise.id)
+        )
+        return [row.id for row in rows]
+
+    def delete_many(self, praise_ids: List[UUID]) -> int:
+        if not praise_ids:
+            return 0
+        deleted = (
+            self.db.query(PraiseCatalogEntry)
+            .filter(PraiseCatalogEntry.praise_id.in_(praise_ids))
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
+
+    def delete_by_tag(self, tag_id: UUID) -> int:
+        """Invalida as linhas dos praises com a tag (ex.: tag renomeada ou removida)."""
+        praise_ids = self.db.query(praise_tag_association.c.praise_id).filter(
+            praise_tag_association.c.tag_id == tag_id
+        )
+        return self._delete_where_praise_in(praise_ids)
+
+    def delete_by_material_kind(self, material_kind_id: UUID) -> int:
+        praise_ids = self.db.query(PraiseMaterial.praise_id).filter(
+            PraiseMaterial.material_kind_id == material_kind_id
+        )
+        return self._delete_where_praise_in(praise_ids)
+
+    def delete_by_material_type(self, material_type_id: UUID) -> int:
+        praise_ids = self.db.query(PraiseMaterial.praise_id).filter(
+            PraiseMaterial.material_type_id == material_type_id
+        )
+        return self._delete_where_praise_in(praise_ids)
+
+    def _delete_where_praise_in(self, praise_id_query) -> int:
+        deleted = (
+            self.db.query(PraiseCatalogEntry)
+            .filter(PraiseCatalogEntry.praise_id.in_(praise_id_query))
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
@@ -1,9 +1,13 @@
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import text
 from app.domain.models.praise_material import PraiseMaterial
 from app.application.repositories import BaseRepository
 
+# Configuração de text search criada na migração 016 (portuguese + unaccent)
+LYRICS_TS_CONFIG = "pt_unaccent"
+
 
 class PraiseMaterialRepository(BaseRepository):
     def __init__(self, db: Session):
@@ -17,20 +21,51 @@ class PraiseMaterialRepository(BaseRepository):
             .first()
         )
 
+    def get_by_ids(self, ids: List[UUID]) -> List[PraiseMaterial]:
+        """Materiais (com kind/type) numa consulta só, na ordem dos IDs; inexistentes são omitidos."""
+        if not ids:
+            return []
+        materials = (
+            self.db.query(PraiseMaterial)
+            .options(
+                joinedload(PraiseMaterial.material_kind),
+                joinedload(PraiseMaterial.material_type),
+            )
+            .filter(PraiseMaterial.id.in_(ids))
+            .all()
+        )
+        by_id = {material.id: material for material in materials}
+        return [by_id[material_id] for material_id in ids if material_id in by_id]
+
     def get_by_praise_id(self, praise_id: UUID, is_old: Optional[bool] = None) -> List[PraiseMaterial]:
         query = (
             self.db.query(PraiseMaterial)
-            .options(joinedload(PraiseMaterial.material_kind))
+            .options(
+                joinedload(PraiseMaterial.material_kind),
+                joinedload(PraiseMaterial.material_type),
+            )
             .filter(PraiseMaterial.praise_id == praise_id)
         )
         if is_old is not None:
             query = query.filter(PraiseMaterial.is_old == is_old)
         return query.all()
 
+    def get_praise_ids_by_material_kind(self, material_kind_id: UUID) -> List[UUID]:
+        """IDs dos praises com algum material do kind."""
+        return [
+            praise_id
+            for (praise_id,) in self.db.query(PraiseMaterial.praise_id)
+            .filter(PraiseMaterial.material_kind_id == material_kind_id)
+            .distinct()
+        ]
+
     def get_all(self, skip: int = 0, limit: int = 100) -> List[PraiseMaterial]:
         return (
             self.db.query(PraiseMaterial)
-            .options(joinedload(PraiseMaterial.material_kind))
+            .options(
+                joinedload(PraiseMaterial.material_kind),
+                joinedload(PraiseMaterial.material_type),
+            )
             .offset(skip)
             .limit(limit)
             .all()
@@ -47,6 +82,27 @@ class PraiseMaterialRepository(BaseRepository):
         self.db.refresh(material)
         return material
 
+    def refresh_lyrics_search_vector(self, material_id: UUID) -> None:
+        """Recalcula lyrics_tsv do material: vetor da letra se for Lyrics/text, NULL caso contrário."""
+        self.db.execute(
+            text(
+                f"""
+                UPDATE praise_materials pm
+                SET lyrics_tsv = CASE
+                    WHEN mt.name ILIKE 'text' AND mk.name ILIKE 'lyrics'
+                    THEN to_tsvector('{LYRICS_TS_CONFIG}', pm.path)
+                    ELSE NULL
+                END
+                FROM material_types mt, material_kinds mk
+                WHERE pm.id = :material_id
+                  AND mt.id = pm.material_type_id
+                  AND mk.id = pm.material_kind_id
+                """
+            ),
+            {"material_id": material_id},
+        )
+        self.db.commit()
+
     def delete(self, id: UUID) -> bool:
         material = self.get_by_id(id)
         if material:
@@ -76,6 +132,7 @@ class PraiseMaterialRepository(BaseRepository):
             self.db.query(PraiseMaterial)
             .options(
                 joinedload(PraiseMaterial.material_kind),
+                joinedload(PraiseMaterial.material_type),
                 joinedload(PraiseMaterial.praise),
             )
             .join(Praise, PraiseMaterial.praise_id == Praise.id)
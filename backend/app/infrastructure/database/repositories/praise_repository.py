@@ -1,27 +1,192 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, case, func
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import or_, case, distinct, func, literal, literal_column, select, tuple_, union_all
 from app.core.search_normalizer import normalize_search_query
 from app.domain.models.praise import Praise
 from app.domain.models.praise_material import PraiseMaterial
 from app.domain.models.material_type import MaterialType
-from app.domain.models.material_kind import MaterialKind
 from app.application.repositories import BaseRepository
+from app.infrastructure.database.repositories.praise_material_repository import LYRICS_TS_CONFIG
+
+# Colunas que a projeção resumida (view=summary / fields=) pode selecionar diretamente
+PRAISE_SUMMARY_COLUMNS = {
+    "id": Praise.id,
+    "name": Praise.name,
+    "number": Praise.number,
+    "author": Praise.author,
+    "rhythm": Praise.rhythm,
+    "tonality": Praise.tonality,
+    "category": Praise.category,
+    "in_review": Praise.in_review,
+    "created_at": Praise.created_at,
+    "updated_at": Praise.updated_at,
+}
+
+# Chave de nome do cursor: lower(name) calculado pelo banco, a mesma expressão comparada no keyset
+# (str.lower do Python difere do lower do Postgres em alguns caracteres, ex.: 'İ')
+CURSOR_NAME_COLUMN = func.lower(Praise.name).label("cursor_name")
 
 
 class PraiseRepository(BaseRepository):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, id: UUID) -> Optional[Praise]:
+    @staticmethod
+    def _graph_options():
+        """Carrega tags e materiais (com kind/type) em consultas IN separadas, sem multiplicar linhas."""
         return (
+            selectinload(Praise.tags),
+            selectinload(Praise.materials).joinedload(PraiseMaterial.material_kind),
+            selectinload(Praise.materials).joinedload(PraiseMaterial.material_type),
+        )
+
+    def _hydrate(self, ids: List[UUID]) -> List[Praise]:
+        """Segunda fase das listagens: carrega os praises da página preservando a ordem dos IDs."""
+        if not ids:
+            return []
+        praises = (
             self.db.query(Praise)
-            .options(
-                joinedload(Praise.tags),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_kind),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_type)
+            .options(*self._graph_options())
+            .filter(Praise.id.in_(ids))
+            .all()
+        )
+        by_id = {praise.id: praise for praise in praises}
+        return [by_id[praise_id] for praise_id in ids if praise_id in by_id]
+
+    def get_by_ids(self, ids: List[UUID]) -> List[Praise]:
+        """Praises com tags e materiais carregados, na ordem dos IDs (IDs inexistentes são omitidos)."""
+        return self._hydrate(ids)
+
+    def iter_all(self, batch_size: int = 500, tag_id: Optional[UUID] = None) -> Iterator[Praise]:
+        """Todos os praises (com tags e materiais) por ordem de nome, lidos em lotes.
+
+        yield_per usa cursor do servidor (stream_results): só um lote fica em memória, e
+        tags/materiais são carregados por lote (selectinload), não por praise.
+        """
+        query = self.db.query(Praise).options(*self._graph_options())
+        if tag_id:
+            from app.domain.models.praise_tag import PraiseTag
+            query = query.filter(Praise.tags.any(PraiseTag.id == tag_id))
+        return iter(query.order_by(Praise.name, Praise.id).yield_per(batch_size))
+
+    def _load_page(self, id_query) -> List[Praise]:
+        """Executa a consulta de IDs já paginada (primeira fase) e hidrata o resultado."""
+        return self._hydrate([row.id for row in id_query.all()])
+
+    def _lyrics_match_subquery(self, lyrics_query: str):
+        """IDs de praises cuja letra (lyrics_tsv) casa com a busca (sintaxe websearch: aspas = frase)."""
+        tsquery = func.websearch_to_tsquery(LYRICS_TS_CONFIG, lyrics_query)
+        return (
+            self.db.query(PraiseMaterial.praise_id)
+            .filter(PraiseMaterial.lyrics_tsv.op("@@")(tsquery))
+        )
+
+    def _lyrics_rank(self, lyrics_query: str):
+        """Maior ts_rank da letra do praise; frase exata (palavras adjacentes) soma um bônus."""
+        tsquery = func.websearch_to_tsquery(LYRICS_TS_CONFIG, lyrics_query)
+        phrase_query = func.phraseto_tsquery(LYRICS_TS_CONFIG, lyrics_query)
+        return (
+            select(
+                func.max(
+                    func.ts_rank(PraiseMaterial.lyrics_tsv, tsquery)
+                    + func.ts_rank(PraiseMaterial.lyrics_tsv, phrase_query)
+                )
             )
+            .where(
+                PraiseMaterial.praise_id == Praise.id,
+                PraiseMaterial.lyrics_tsv.op("@@")(tsquery),
+            )
+            .correlate(Praise)
+            .scalar_subquery()
+        )
+
+    def _apply_fuzzy_threshold(self, threshold: float) -> None:
+        """Define o limiar de word_similarity (operador %>) só para a transação atual."""
+        self.db.execute(
+            select(func.set_config("pg_trgm.word_similarity_threshold", str(threshold), True))
+        )
+
+    def _fuzzy_name_condition(self, term: str, threshold: float):
+        """Casamento tolerante a erros de digitação no nome (pg_trgm).
+
+        name_search %> termo equivale a word_similarity(termo, name_search) >= limiar e usa o
+        índice GIN trigram de name_search (o operador word_similarity() sozinho não usa índice).
+        """
+        self._apply_fuzzy_threshold(threshold)
+        return or_(
+            Praise.name_search.like(f"%{term}%"),
+            Praise.name_search.op("%>")(term),
+        )
+
+    def _fuzzy_similarity(self, term: str):
+        return func.word_similarity(term, Praise.name_search)
+
+    @staticmethod
+    def _name_id_after(after_key: Dict[str, Any]):
+        """(lower(name), id) > chave do cursor: comparação de linha, um único range no índice."""
+        last_name_id = tuple_(literal(after_key["name"]), literal(after_key["id"], type_=Praise.id.type))
+        return tuple_(func.lower(Praise.name), Praise.id) > last_name_id
+
+    def _keyset_condition(self, after_key: Dict[str, Any], asc: bool):
+        """Linhas posteriores à chave after_key na ordenação por nome (sort_by=number usa _number_keyset_page)."""
+        if asc:
+            return self._name_id_after(after_key)
+        last_name_id = tuple_(literal(after_key["name"]), literal(after_key["id"], type_=Praise.id.type))
+        return tuple_(func.lower(Praise.name), Praise.id) < last_name_id
+
+    def _number_keyset_page(self, query, after_key: Dict[str, Any], asc: bool, no_number: str, limit: int):
+        """Página após o cursor na ordenação por número, como UNION ALL de faixas contíguas.
+
+        Um OR entre "mesmo número, nome/id maior", "número maior" e "sem número" não vira um
+        único range de índice (o Postgres cai em BitmapOr + Sort ou varre o índice do início).
+        Cada faixa aqui é um range simples nos índices da migração 017, com seu próprio LIMIT;
+        a consulta externa só ordena as até 3 * limit linhas resultantes.
+        """
+        lower_name = func.lower(Praise.name)
+        number_order = Praise.number.asc() if asc else Praise.number.desc()
+        number = after_key.get("number")
+
+        # (condição, ordenação) de cada faixa, na ordem em que aparecem na listagem
+        parts = []
+        if number is not None:
+            parts.append(((Praise.number == number, self._name_id_after(after_key)), (lower_name, Praise.id)))
+            number_after = Praise.number > number if asc else Praise.number < number
+            parts.append(((number_after,), (number_order, lower_name, Praise.id)))
+            if no_number == "last":
+                parts.append(((Praise.number.is_(None),), (lower_name, Praise.id)))
+        else:
+            # Cursor dentro do grupo sem número
+            parts.append(((Praise.number.is_(None), self._name_id_after(after_key)), (lower_name, Praise.id)))
+            if no_number == "first":
+                parts.append(((Praise.number.isnot(None),), (number_order, lower_name, Praise.id)))
+
+        column_names = [description["name"] for description in query.column_descriptions]
+        selects = [
+            query.filter(*conditions)
+            .add_columns(
+                literal_column(str(position)).label("keyset_part"),
+                Praise.number.label("keyset_number"),
+                lower_name.label("keyset_name"),
+                Praise.id.label("keyset_id"),
+            )
+            .order_by(*order)
+            .limit(limit)
+            .statement
+            for position, (conditions, order) in enumerate(parts)
+        ]
+        pages = union_all(*selects).subquery("keyset_pages")
+        outer_number = pages.c.keyset_number.asc() if asc else pages.c.keyset_number.desc()
+        return (
+            self.db.query(*[pages.c[name] for name in column_names])
+            .order_by(pages.c.keyset_part, outer_number, pages.c.keyset_name, pages.c.keyset_id)
+            .limit(limit)
+        )
+
+    def get_by_id(self, id: UUID) -> Optional[Praise]:
+        return (
+            self.db.query(Praise)
+            .options(*self._graph_options())
             .filter(Praise.id == id)
             .first()
         )
@@ -29,108 +194,88 @@ class PraiseRepository(BaseRepository):
     def get_by_number(self, number: int) -> Optional[Praise]:
         return (
             self.db.query(Praise)
-            .options(
-                joinedload(Praise.tags),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_kind),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_type)
-            )
+            .options(*self._graph_options())
             .filter(Praise.number == number)
             .first()
         )
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Praise]:
-        return (
-            self.db.query(Praise)
-            .options(
-                joinedload(Praise.tags),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_kind),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_type)
-            )
+        return self._load_page(
+            self.db.query(Praise.id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
 
-    def search_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Praise]:
+    def search_by_name(
+        self, name: str, skip: int = 0, limit: int = 100, fuzzy_threshold: Optional[float] = None
+    ) -> List[Praise]:
+        """Busca por nome; com fuzzy_threshold, tolera erros de digitação e ordena por similaridade."""
         term = normalize_search_query(name) if name else None
         if not term:
             return self.get_all(skip=skip, limit=limit)
-        return (
-            self.db.query(Praise)
-            .options(
-                joinedload(Praise.tags),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_kind),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_type)
+        if fuzzy_threshold is None:
+            return self._load_page(
+                self.db.query(Praise.id)
+                .filter(Praise.name_search.like(f"%{term}%"))
+                .offset(skip)
+                .limit(limit)
             )
-            .filter(func.unaccent(Praise.name).ilike(f"%{term}%"))
+        return self._load_page(
+            self.db.query(Praise.id)
+            .filter(self._fuzzy_name_condition(term, fuzzy_threshold))
+            .order_by(self._fuzzy_similarity(term).desc(), func.lower(Praise.name), Praise.id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
 
     def search_by_name_or_number_or_lyrics(
-        self, query: str, skip: int = 0, limit: int = 100
+        self, query: str, skip: int = 0, limit: int = 100, fuzzy_threshold: Optional[float] = None
     ) -> List[Praise]:
-        """Search praises by name, number, or lyrics content."""
+        """Search praises by name, number, or lyrics content.
+
+        Com fuzzy_threshold, o nome também casa por similaridade de trigramas e o resultado
+        é ordenado pela similaridade do nome.
+        """
         raw = (query or "").strip()
         term = normalize_search_query(query) if query else None
         if not term and not raw.isdigit():
             return self.get_all(skip=skip, limit=limit)
         search_term = term or raw
 
-        conditions = [func.unaccent(Praise.name).ilike(f"%{search_term}%")]
+        if fuzzy_threshold is not None and term:
+            conditions = [self._fuzzy_name_condition(search_term, fuzzy_threshold)]
+        else:
+            conditions = [Praise.name_search.like(f"%{search_term}%")]
 
         # Match number if query is numeric
         if raw.isdigit():
             conditions.append(Praise.number == int(raw))
 
-        # Match lyrics in text materials (Material Type 'text', Material Kind 'Lyrics')
-        lyrics_subq = (
-            self.db.query(PraiseMaterial.praise_id)
-            .join(MaterialType, PraiseMaterial.material_type_id == MaterialType.id)
-            .join(MaterialKind, PraiseMaterial.material_kind_id == MaterialKind.id)
-            .filter(
-                MaterialType.name.ilike("text"),
-                MaterialKind.name.ilike("Lyrics"),
-                func.unaccent(PraiseMaterial.path).ilike(f"%{search_term}%"),
-            )
-        )
-        conditions.append(Praise.id.in_(lyrics_subq))
+        # Match lyrics (full-text em lyrics_tsv, só preenchido para materiais Lyrics/text)
+        if raw:
+            conditions.append(Praise.id.in_(self._lyrics_match_subquery(raw)))
 
-        return (
-            self.db.query(Praise)
-            .options(
-                joinedload(Praise.tags),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_kind),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_type)
+        # Condições só por IN/igualdade em praises: não há linhas duplicadas, dispensa DISTINCT
+        id_query = self.db.query(Praise.id).filter(or_(*conditions))
+        if fuzzy_threshold is not None and term:
+            id_query = id_query.order_by(
+                self._fuzzy_similarity(search_term).desc(), func.lower(Praise.name), Praise.id
             )
-            .filter(or_(*conditions))
-            .distinct()
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        return self._load_page(id_query.offset(skip).limit(limit))
 
     def get_by_tag_id(self, tag_id: UUID, skip: int = 0, limit: int = 100) -> List[Praise]:
         from app.domain.models.praise import praise_tag_association
-        return (
-            self.db.query(Praise)
+        return self._load_page(
+            self.db.query(Praise.id)
             .join(praise_tag_association)
-            .options(
-                joinedload(Praise.tags),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_kind),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_type)
-            )
             .filter(praise_tag_association.c.tag_id == tag_id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
 
-    def get_all_filtered_sorted(
+    def _filtered_query(
         self,
-        skip: int = 0,
-        limit: int = 100,
+        query,
         name: Optional[str] = None,
         tag_id: Optional[UUID] = None,
         tonality: Optional[str] = None,
@@ -139,21 +284,13 @@ class PraiseRepository(BaseRepository):
         youtube_video_id: Optional[str] = None,
         search_in_lyrics: bool = False,
         sort_by: str = "name",
-        sort_direction: str = "asc",
         no_number: str = "last",
-    ) -> List[Praise]:
-        """Query unificada com filtros e ordenação no banco."""
+        lyrics_query: Optional[str] = None,
+        fuzzy_threshold: Optional[float] = None,
+    ):
+        """Aplica os filtros da listagem de praises a uma query sobre a tabela praises."""
         from app.domain.models.praise import praise_tag_association
 
-        query = (
-            self.db.query(Praise)
-            .options(
-                joinedload(Praise.tags),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_kind),
-                joinedload(Praise.materials).joinedload(PraiseMaterial.material_type)
-            )
-        )
-
         # Filtro por tag
         if tag_id:
             query = query.join(praise_tag_association).filter(
@@ -162,40 +299,35 @@ class PraiseRepository(BaseRepository):
 
         # Filtro por nome/número (e opcionalmente lyrics quando search_in_lyrics)
         if name and name.strip():
-            term = name.strip()
-            # Comparação sem acentos via extensão unaccent (case insensitive com ilike)
-            name_cond = func.unaccent(Praise.name).ilike(f"%{term}%")
+            name_term = name.strip()
+            # name já chega normalizado (normalize_search_query), igual à coluna name_search (índice trigram)
+            if fuzzy_threshold is not None:
+                name_cond = self._fuzzy_name_condition(name_term, fuzzy_threshold)
+            else:
+                name_cond = Praise.name_search.like(f"%{name_term}%")
             conditions = [name_cond]
-            if term.isdigit():
-                conditions.append(Praise.number == int(term))
+            if name_term.isdigit():
+                conditions.append(Praise.number == int(name_term))
             if search_in_lyrics:
-                lyrics_subq = (
-                    self.db.query(PraiseMaterial.praise_id)
-                    .join(MaterialType, PraiseMaterial.material_type_id == MaterialType.id)
-                    .join(MaterialKind, PraiseMaterial.material_kind_id == MaterialKind.id)
-                    .filter(
-                        MaterialType.name.ilike("text"),
-                        MaterialKind.name.ilike("Lyrics"),
-                        func.unaccent(PraiseMaterial.path).ilike(f"%{term}%"),
-                    )
-                )
-                conditions.append(Praise.id.in_(lyrics_subq))
-            query = query.filter(or_(*conditions)).distinct()
+                lyrics_term = (lyrics_query or "").strip() or name_term
+                conditions.append(Praise.id.in_(self._lyrics_match_subquery(lyrics_term)))
+            query = query.filter(or_(*conditions))
 
+        # Filtros de tom/ritmo/categoria: termos já chegam sem acento e em minúsculas (fold_search_text)
         # Filtro por tom (tonality); vazio = todos
         if tonality and tonality.strip():
             term = tonality.strip()
-            query = query.filter(func.coalesce(func.unaccent(Praise.tonality), "").ilike(f"%{term}%"))
+            query = query.filter(Praise.tonality_search.like(f"%{term}%"))
 
         # Filtro por ritmo (rhythm); vazio = todos
         if rhythm and rhythm.strip():
             term = rhythm.strip()
-            query = query.filter(func.coalesce(func.unaccent(Praise.rhythm), "").ilike(f"%{term}%"))
+            query = query.filter(Praise.rhythm_search.like(f"%{term}%"))
 
         # Filtro por categoria (category); vazio = todos
         if category and category.strip():
             term = category.strip()
-            query = query.filter(func.coalesce(func.unaccent(Praise.category), "").ilike(f"%{term}%"))
+            query = query.filter(Praise.category_search.like(f"%{term}%"))
 
         # Filtro por link/ID do YouTube: praises que tenham material tipo youtube com path contendo o ID
         if youtube_video_id and youtube_video_id.strip():
@@ -208,35 +340,258 @@ class PraiseRepository(BaseRepository):
                     func.coalesce(PraiseMaterial.path, "").ilike(f"%{vid}%"),
                 )
             )
-            query = query.filter(Praise.id.in_(youtube_subq)).distinct()
+            query = query.filter(Praise.id.in_(youtube_subq))
 
         # Filtro por number IS NOT NULL quando no_number=hide e sort_by=number
         if sort_by == "number" and no_number == "hide":
             query = query.filter(Praise.number.isnot(None))
 
-        # Ordenação
+        return query
+
+    def _ordered_query(
+        self,
+        query,
+        name: Optional[str] = None,
+        search_in_lyrics: bool = False,
+        sort_by: str = "name",
+        sort_direction: str = "asc",
+        no_number: str = "last",
+        lyrics_query: Optional[str] = None,
+        after_key: Optional[Dict[str, Any]] = None,
+        fuzzy: bool = False,
+    ):
+        """Aplica a ordenação da listagem (e a condição keyset do cursor, se houver)."""
         asc = sort_direction.lower() != "desc"
+
+        # Paginação keyset (cursor) por nome: continua após a última chave vista
+        if after_key is not None and sort_by != "number":
+            query = query.filter(self._keyset_condition(after_key, asc))
+
+        # Ordenação (índices de suporte na migração 017)
+        if sort_by == "relevance" and name and name.strip():
+            name_term = name.strip()
+            # Prefixo no nome > substring no nome > só letra; depois maior rank da letra
+            name_rank = case(
+                (Praise.name_search.like(f"{name_term}%"), 0),
+                (Praise.name_search.like(f"%{name_term}%"), 1),
+                else_=2,
+            )
+            order = [name_rank.asc()]
+            if fuzzy:
+                # Busca fuzzy: entre os que não contêm o termo, mais parecidos primeiro
+                order.append(self._fuzzy_similarity(name_term).desc())
+            if search_in_lyrics:
+                lyrics_term = (lyrics_query or "").strip() or name_term
+                order.append(func.coalesce(self._lyrics_rank(lyrics_term), 0).desc())
+            order.append(func.lower(Praise.name))
+            order.append(Praise.id)
+            return query.order_by(*order)
         if sort_by == "number":
+            num_order = Praise.number.asc() if asc else Praise.number.desc()
             if no_number == "first":
-                # NULLs primeiro: 0 para NULL, 1 para não-NULL
-                null_order = case((Praise.number.is_(None), 0), else_=1).asc()
-                num_order = Praise.number.asc() if asc else Praise.number.desc()
-                query = query.order_by(null_order, num_order, func.lower(Praise.name))
+                num_order = num_order.nulls_first()
             elif no_number == "last":
-                # NULLs por último: 0 para não-NULL, 1 para NULL
-                null_order = case((Praise.number.is_(None), 1), else_=0).asc()
-                num_order = Praise.number.asc() if asc else Praise.number.desc()
-                query = query.order_by(null_order, num_order, func.lower(Praise.name))
+                num_order = num_order.nulls_last()
+            # hide: já filtrado, só ordenar por number
+            return query.order_by(num_order, func.lower(Praise.name), Praise.id)
+        # ordenar por nome (case-insensitive)
+        if asc:
+            return query.order_by(func.lower(Praise.name).asc(), Praise.id.asc())
+        return query.order_by(func.lower(Praise.name).desc(), Praise.id.desc())
+
+    def _filtered_sorted_page(self, query, skip: int, limit: int, **filters):
+        """Filtros + ordenação + página (offset ou keyset) sobre a query informada."""
+        after_key = filters.pop("after_key", None)
+        sort_direction = filters.pop("sort_direction", "asc")
+        query = self._filtered_query(query, **filters)
+        if after_key is not None and filters.get("sort_by") == "number":
+            return self._number_keyset_page(
+                query,
+                after_key,
+                sort_direction.lower() != "desc",
+                filters.get("no_number", "last"),
+                limit,
+            )
+        query = self._ordered_query(
+            query,
+            name=filters.get("name"),
+            search_in_lyrics=filters.get("search_in_lyrics", False),
+            sort_by=filters.get("sort_by", "name"),
+            sort_direction=sort_direction,
+            no_number=filters.get("no_number", "last"),
+            lyrics_query=filters.get("lyrics_query"),
+            after_key=after_key,
+            fuzzy=filters.get("fuzzy_threshold") is not None,
+        )
+        if after_key is not None:
+            skip = 0
+        return query.offset(skip).limit(limit)
+
+    def get_all_filtered_sorted(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        name: Optional[str] = None,
+        tag_id: Optional[UUID] = None,
+        tonality: Optional[str] = None,
+        rhythm: Optional[str] = None,
+        category: Optional[str] = None,
+        youtube_video_id: Optional[str] = None,
+        search_in_lyrics: bool = False,
+        sort_by: str = "name",
+        sort_direction: str = "asc",
+        no_number: str = "last",
+        lyrics_query: Optional[str] = None,
+        after_key: Optional[Dict[str, Any]] = None,
+        fuzzy_threshold: Optional[float] = None,
+    ) -> List[Praise]:
+        """Query unificada com filtros e ordenação no banco.
+
+        lyrics_query é o termo original (sem remover stop words) usado na busca full-text
+        da letra; quando ausente, usa-se name. sort_by=relevance ordena pelo casamento
+        no nome e pelo ts_rank da letra.
+
+        after_key (name em minúsculas pelo banco, ver CURSOR_NAME_COLUMN; number; id) ativa a
+        paginação keyset: retorna as linhas após essa chave e ignora skip. Toda ordenação termina
+        em id para ser estável.
+
+        fuzzy_threshold ativa a busca tolerante a erros de digitação no nome (word_similarity
+        do pg_trgm >= limiar); com sort_by=relevance, ordena também pela similaridade.
+        """
+        # Primeira fase: só os IDs da página, na ordem pedida; relacionamentos vêm em _hydrate
+        query = self._filtered_sorted_page(
+            self.db.query(Praise.id),
+            skip,
+            limit,
+            name=name,
+            tag_id=tag_id,
+            tonality=tonality,
+            rhythm=rhythm,
+            category=category,
+            youtube_video_id=youtube_video_id,
+            search_in_lyrics=search_in_lyrics,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            no_number=no_number,
+            lyrics_query=lyrics_query,
+            after_key=after_key,
+            fuzzy_threshold=fuzzy_threshold,
+        )
+        return self._load_page(query)
+
+    def get_page_keys_filtered_sorted(self, skip: int = 0, limit: int = 100, **filters: Any) -> List[Tuple[UUID, str]]:
+        """IDs da página, na ordem pedida, com a chave de nome do cursor (CURSOR_NAME_COLUMN)."""
+        query = self._filtered_sorted_page(self.db.query(Praise.id, CURSOR_NAME_COLUMN), skip, limit, **filters)
+        return [(row.id, row.cursor_name) for row in query.all()]
+
+    def get_ids_filtered_sorted(self, skip: int = 0, limit: int = 100, **filters: Any) -> List[UUID]:
+        """Só a primeira fase de get_all_filtered_sorted: IDs da página, na ordem pedida."""
+        query = self._filtered_sorted_page(self.db.query(Praise.id), skip, limit, **filters)
+        return [row.id for row in query.all()]
+
+    def get_summaries_filtered_sorted(
+        self,
+        fields: List[str],
+        skip: int = 0,
+        limit: int = 100,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Mesma listagem de get_all_filtered_sorted, mas só com as colunas pedidas (sem ORM).
+
+        Retorna dicts com id, name, number e cursor_name (sempre, usados pelo cursor) mais os
+        campos em fields; "tags" vira uma lista de {id, name} carregada numa única consulta extra.
+        """
+        column_fields = [f for f in fields if f in PRAISE_SUMMARY_COLUMNS]
+        columns = [PRAISE_SUMMARY_COLUMNS[f] for f in ("id", "name", "number")] + [CURSOR_NAME_COLUMN]
+        columns += [PRAISE_SUMMARY_COLUMNS[f] for f in column_fields if f not in ("id", "name", "number")]
+        query = self._filtered_sorted_page(self.db.query(*columns), skip, limit, **filters)
+        items = [dict(row._mapping) for row in query.all()]
+
+        if "tags" in fields:
+            tags_by_praise = self.get_tags_by_praise_ids([item["id"] for item in items])
+            for item in items:
+                item["tags"] = tags_by_praise.get(item["id"], [])
+        return items
+
+    def get_facet_counts(self, **filters: Any) -> Dict[str, Any]:
+        """Total e contagens por tom, ritmo, categoria e tag para os filtros de get_all_filtered_sorted.
+
+        Uma única consulta: CTE com os praises filtrados + GROUPING SETS ((), tom, ritmo,
+        categoria, tag). count(DISTINCT id) evita que o join com tags infle as demais contagens.
+        """
+        from app.domain.models.praise import praise_tag_association
+        from app.domain.models.praise_tag import PraiseTag
+
+        matched = self._filtered_query(
+            self.db.query(Praise.id, Praise.tonality, Praise.rhythm, Praise.category),
+            **filters,
+        ).cte("matched_praises")
+
+        dimensions = {
+            "tonality": matched.c.tonality,
+            "rhythm": matched.c.rhythm,
+            "category": matched.c.category,
+            "tag_id": praise_tag_association.c.tag_id,
+        }
+        stmt = (
+            select(
+                *dimensions.values(),
+                PraiseTag.name.label("tag_name"),
+                *[func.grouping(column).label(f"grouping_{key}") for key, column in dimensions.items()],
+                func.count(distinct(matched.c.id)).label("count"),
+            )
+            .select_from(
+                matched
+                .outerjoin(praise_tag_association, praise_tag_association.c.praise_id == matched.c.id)
+                .outerjoin(PraiseTag, PraiseTag.id == praise_tag_association.c.tag_id)
+            )
+            .group_by(
+                func.grouping_sets(
+                    literal_column("()"),
+                    tuple_(matched.c.tonality),
+                    tuple_(matched.c.rhythm),
+                    tuple_(matched.c.category),
+                    tuple_(praise_tag_association.c.tag_id, PraiseTag.name),
+                )
+            )
+        )
+
+        result: Dict[str, Any] = {"total": 0, "tonality": [], "rhythm": [], "category": [], "tags": []}
+        for row in self.db.execute(stmt):
+            grouped = {key: row._mapping[f"grouping_{key}"] == 0 for key in dimensions}
+            if not any(grouped.values()):
+                result["total"] = row.count
+            elif grouped["tag_id"]:
+                if row.tag_id is not None:
+                    result["tags"].append({"id": row.tag_id, "name": row.tag_name, "count": row.count})
             else:
-                # hide: já filtrado, só ordenar por number
-                num_order = Praise.number.asc() if asc else Praise.number.desc()
-                query = query.order_by(num_order, func.lower(Praise.name))
-        else:
-            # ordenar por nome (case-insensitive)
-            name_order = func.lower(Praise.name).asc() if asc else func.lower(Praise.name).desc()
-            query = query.order_by(name_order)
+                key = next(k for k, is_grouped in grouped.items() if is_grouped)
+                value = row._mapping[key]
+                if value is not None:
+                    result[key].append({"value": value, "count": row.count})
+
+        for key in ("tonality", "rhythm", "category", "tags"):
+            result[key].sort(key=lambda item: (-item["count"], str(item.get("value", item.get("name")))))
+        return result
 
-        return query.offset(skip).limit(limit).all()
+    def get_tags_by_praise_ids(self, praise_ids: List[UUID]) -> Dict[UUID, List[Dict[str, Any]]]:
+        """Tags (id, name) de vários praises numa consulta só, agrupadas por praise_id."""
+        from app.domain.models.praise import praise_tag_association
+        from app.domain.models.praise_tag import PraiseTag
+
+        if not praise_ids:
+            return {}
+        rows = (
+            self.db.query(praise_tag_association.c.praise_id, PraiseTag.id, PraiseTag.name)
+            .join(PraiseTag, PraiseTag.id == praise_tag_association.c.tag_id)
+            .filter(praise_tag_association.c.praise_id.in_(praise_ids))
+            .order_by(PraiseTag.name)
+            .all()
+        )
+        tags_by_praise: Dict[UUID, List[Dict[str, Any]]] = {}
+        for praise_id, tag_id, tag_name in rows:
+            tags_by_praise.setdefault(praise_id, []).append({"id": tag_id, "name": tag_name})
+        return tags_by_praise
 
     def create(self, praise: Praise) -> Praise:
         self.db.add(praise)
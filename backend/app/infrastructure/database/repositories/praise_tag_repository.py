@@ -2,6 +2,8 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from app.domain.models.praise_tag import PraiseTag
+from app.domain.models.praise_tag_translation import PraiseTagTranslation
+from app.infrastructure.cache.lookup_cache import cached_all, cached_one, invalidate_lookup
 from app.application.repositories import BaseRepository
 
 
@@ -10,22 +12,33 @@ class PraiseTagRepository(BaseRepository):
         self.db = db
 
     def get_by_id(self, id: UUID) -> Optional[PraiseTag]:
-        return self.db.query(PraiseTag).filter(PraiseTag.id == id).first()
+        return cached_one(
+            self.db, PraiseTag, ("get_by_id", id),
+            lambda: self.db.query(PraiseTag).filter(PraiseTag.id == id).first(),
+        )
 
     def get_by_name(self, name: str) -> Optional[PraiseTag]:
-        return self.db.query(PraiseTag).filter(PraiseTag.name == name).first()
+        return cached_one(
+            self.db, PraiseTag, ("get_by_name", name),
+            lambda: self.db.query(PraiseTag).filter(PraiseTag.name == name).first(),
+        )
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[PraiseTag]:
-        return self.db.query(PraiseTag).offset(skip).limit(limit).all()
+        return cached_all(
+            self.db, PraiseTag, ("get_all", skip, limit),
+            lambda: self.db.query(PraiseTag).offset(skip).limit(limit).all(),
+        )
 
     def create(self, tag: PraiseTag) -> PraiseTag:
         self.db.add(tag)
         self.db.commit()
+        invalidate_lookup(PraiseTag)
         self.db.refresh(tag)
         return tag
 
     def update(self, tag: PraiseTag) -> PraiseTag:
         self.db.commit()
+        invalidate_lookup(PraiseTag)
         self.db.refresh(tag)
         return tag
 
@@ -34,6 +47,9 @@ class PraiseTagRepository(BaseRepository):
         if tag:
             self.db.delete(tag)
             self.db.commit()
+            invalidate_lookup(PraiseTag)
+            # Traduções removidas em cascata (delete-orphan)
+            invalidate_lookup(PraiseTagTranslation)
             return True
         return False
 
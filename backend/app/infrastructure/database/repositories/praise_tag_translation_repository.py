@@ -2,6 +2,7 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from app.domain.models.praise_tag_translation import PraiseTagTranslation
+from app.infrastructure.cache.lookup_cache import cached_all, cached_one, invalidate_lookup
 
 
 class PraiseTagTranslationRepository:
@@ -9,32 +10,46 @@ class PraiseTagTranslationRepository:
         self.db = db
 
     def get_by_id(self, id: UUID) -> Optional[PraiseTagTranslation]:
-        return self.db.query(PraiseTagTranslation).filter(PraiseTagTranslation.id == id).first()
+        return cached_one(
+            self.db, PraiseTagTranslation, ("get_by_id", id),
+            lambda: self.db.query(PraiseTagTranslation).filter(PraiseTagTranslation.id == id).first(),
+        )
 
     def get_by_entity_and_language(self, praise_tag_id: UUID, language_code: str) -> Optional[PraiseTagTranslation]:
-        return self.db.query(PraiseTagTranslation).filter(
-            PraiseTagTranslation.praise_tag_id == praise_tag_id,
-            PraiseTagTranslation.language_code == language_code
-        ).first()
+        return cached_one(
+            self.db, PraiseTagTranslation, ("get_by_entity_and_language", praise_tag_id, language_code),
+            lambda: self.db.query(PraiseTagTranslation).filter(
+                PraiseTagTranslation.praise_tag_id == praise_tag_id,
+                PraiseTagTranslation.language_code == language_code
+            ).first(),
+        )
 
     def get_by_entity(self, praise_tag_id: UUID) -> List[PraiseTagTranslation]:
-        return self.db.query(PraiseTagTranslation).filter(
-            PraiseTagTranslation.praise_tag_id == praise_tag_id
-        ).all()
+        return cached_all(
+            self.db, PraiseTagTranslation, ("get_by_entity", praise_tag_id),
+            lambda: self.db.query(PraiseTagTranslation).filter(
+                PraiseTagTranslation.praise_tag_id == praise_tag_id
+            ).all(),
+        )
 
     def get_by_language(self, language_code: str) -> List[PraiseTagTranslation]:
-        return self.db.query(PraiseTagTranslation).filter(
-            PraiseTagTranslation.language_code == language_code
-        ).all()
+        return cached_all(
+            self.db, PraiseTagTranslation, ("get_by_language", language_code),
+            lambda: self.db.query(PraiseTagTranslation).filter(
+                PraiseTagTranslation.language_code == language_code
+            ).all(),
+        )
 
     def create(self, translation: PraiseTagTranslation) -> PraiseTagTranslation:
         self.db.add(translation)
         self.db.commit()
+        invalidate_lookup(PraiseTagTranslation)
         self.db.refresh(translation)
         return translation
 
     def update(self, translation: PraiseTagTranslation) -> PraiseTagTranslation:
         self.db.commit()
+        invalidate_lookup(PraiseTagTranslation)
         self.db.refresh(translation)
         return translation
 
@@ -43,5 +58,6 @@ class PraiseTagTranslationRepository:
         if translation:
             self.db.delete(translation)
             self.db.commit()
+            invalidate_lookup(PraiseTagTranslation)
             return True
         return False
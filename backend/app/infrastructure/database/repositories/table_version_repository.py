@@ -0,0 +1,20 @@
+from typing import Dict, Iterable
+from sqlalchemy.orm import Session
+from app.domain.models.table_version import TableVersion
+
+
+class TableVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_versions(self, table_names: Iterable[str]) -> Dict[str, int]:
+        """Versões atuais das tabelas pedidas numa única consulta (tabelas sem linha ficam com 0)."""
+        names = list(table_names)
+        rows = (
+            self.db.query(TableVersion.table_name, TableVersion.version)
+            .filter(TableVersion.table_name.in_(names))
+            .all()
+        )
+        versions = {name: 0 for name in names}
+        versions.update({name: version for name, version in rows})
+        return versions
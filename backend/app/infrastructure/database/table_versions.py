@@ -0,0 +1,102 @@
+"""
+Contadores de alteração por tabela (view table_versions) usados nas ETags e no cache de referência.
+
+Cada tabela versionada tem uma sequence table_version_<tabela>_seq (migração 023). nextval não
+bloqueia nem espera o commit de ninguém: escritores concorrentes (uploads, revisões,
+importações) não disputam o lock de uma linha compartilhada.
+
+Duas fontes de incremento:
+- trigger por comando no banco (qualquer escritor: API, scripts, SQL manual), ainda dentro da
+  transação da escrita;
+- após o commit das sessões da aplicação, para as tabelas que a sessão alterou. Como a
+  sequence não é transacional, um leitor pode ver o incremento do trigger antes do commit e
+  guardar os dados antigos sob a versão nova; o incremento após o commit invalida esse estado.
+"""
+
+import logging
+from itertools import chain
+from typing import Iterable, Set
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+logger = logging.getLogger(__name__)
+
+# Tabelas com trigger de versão (migrações 019 e 020)
+VERSIONED_TABLES = frozenset({
+    "praises",
+    "praise_materials",
+    "praise_tag_association",
+    "praise_tags",
+    "material_kinds",
+    "material_types",
+    "languages",
+    "material_kind_translations",
+    "material_type_translations",
+    "praise_tag_translations",
+})
+
+_CHANGED_KEY = "changed_versioned_tables"
+
+
+def sequence_name(table_name: str) -> str:
+    return f"table_version_{table_name}_seq"
+
+
+def bump_table_versions(engine: Engine, table_names: Iterable[str]) -> None:
+    """Incrementa as versões das tabelas (fora de qualquer transação de escrita)."""
+    names = sorted(set(table_names) & VERSIONED_TABLES)
+    if not names:
+        return
+    calls = ", ".join(f"nextval('{sequence_name(name)}')" for name in names)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text(f"SELECT {calls}"))
+            connection.commit()
+    except Exception as e:
+        # Fail-safe: o trigger já incrementou as versões na transação da escrita
+        logger.warning("Erro ao incrementar table_versions após commit (%s): %s", ", ".join(names), e)
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    return session.info.setdefault(_CHANGED_KEY, set())
+
+
+def _collect_flushed_tables(session: Session, flush_context) -> None:
+    # Em after_flush, new/dirty/deleted ainda refletem o que foi gravado
+    changed = _changed_tables(session)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        state = inspect(obj)
+        changed.update(table.name for table in state.mapper.tables)
+        for relationship in state.mapper.relationships:
+            if relationship.secondary is None:
+                continue
+            if obj in session.deleted or state.attrs[relationship.key].history.has_changes():
+                changed.add(relationship.secondary.name)
+
+
+def _collect_executed_tables(orm_execute_state: ORMExecuteState) -> None:
+    # INSERT/UPDATE/DELETE em massa (query.update/delete, insert(...)) não passam pelo flush
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and getattr(table, "name", None):
+        _changed_tables(orm_execute_state.session).add(table.name)
+
+
+def register_table_version_events(session_factory, engine: Engine) -> None:
+    """Liga o incremento após commit às sessões criadas por session_factory."""
+
+    def after_commit(session: Session) -> None:
+        changed = session.info.pop(_CHANGED_KEY, None)
+        if changed:
+            bump_table_versions(engine, changed)
+
+    def after_rollback(session: Session) -> None:
+        session.info.pop(_CHANGED_KEY, None)
+
+    event.listen(session_factory, "after_flush", _collect_flushed_tables)
+    event.listen(session_factory, "do_orm_execute", _collect_executed_tables)
+    event.listen(session_factory, "after_commit", after_commit)
+    event.listen(session_factory, "after_rollback", after_rollback)
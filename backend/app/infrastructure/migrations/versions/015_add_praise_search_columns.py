@@ -0,0 +1,61 @@
+"""Add normalized search columns to praises with pg_trgm GIN indexes
+
+Revision ID: 015_praise_search_columns
+Revises: 014_unaccent
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "015_praise_search_columns"
+down_revision = "014_unaccent"
+branch_labels = None
+depends_on = None
+
+_SEARCH_COLUMNS = ("name_search", "tonality_search", "rhythm_search", "category_search")
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    op.add_column("praises", sa.Column("name_search", sa.String(), nullable=True))
+    op.add_column("praises", sa.Column("tonality_search", sa.String(length=50), nullable=True))
+    op.add_column("praises", sa.Column("rhythm_search", sa.String(length=100), nullable=True))
+    op.add_column("praises", sa.Column("category_search", sa.String(length=255), nullable=True))
+
+    # Preencher com as mesmas regras usadas pelo PraiseService (stop words só no nome)
+    from app.core.search_normalizer import fold_search_text, normalize_search_query
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, name, tonality, rhythm, category FROM praises")).fetchall()
+    for row in rows:
+        bind.execute(
+            sa.text(
+                "UPDATE praises SET name_search = :name_search, tonality_search = :tonality_search, "
+                "rhythm_search = :rhythm_search, category_search = :category_search WHERE id = :id"
+            ),
+            {
+                "id": row.id,
+                "name_search": normalize_search_query(row.name),
+                "tonality_search": fold_search_text(row.tonality),
+                "rhythm_search": fold_search_text(row.rhythm),
+                "category_search": fold_search_text(row.category),
+            },
+        )
+
+    for column in _SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_praises_{column}_trgm",
+            "praises",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade():
+    for column in reversed(_SEARCH_COLUMNS):
+        op.drop_index(f"ix_praises_{column}_trgm", table_name="praises")
+        op.drop_column("praises", column)
+    # pg_trgm é mantida: pode estar em uso por outros objetos do banco
@@ -0,0 +1,53 @@
+"""Add full-text lyrics search vector to praise_materials
+
+Revision ID: 016_lyrics_tsvector
+Revises: 015_praise_search_columns
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "016_lyrics_tsvector"
+down_revision = "015_praise_search_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Configuração de busca em português sem acentos (unaccent antes do stemmer)
+    op.execute("""
+        DO $$ BEGIN
+            CREATE TEXT SEARCH CONFIGURATION pt_unaccent (COPY = portuguese);
+            ALTER TEXT SEARCH CONFIGURATION pt_unaccent
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+        EXCEPTION
+            WHEN duplicate_object THEN null;
+        END $$;
+    """)
+
+    op.add_column("praise_materials", sa.Column("lyrics_tsv", postgresql.TSVECTOR(), nullable=True))
+
+    op.execute("""
+        UPDATE praise_materials pm
+        SET lyrics_tsv = to_tsvector('pt_unaccent', pm.path)
+        FROM material_types mt, material_kinds mk
+        WHERE mt.id = pm.material_type_id
+          AND mk.id = pm.material_kind_id
+          AND mt.name ILIKE 'text'
+          AND mk.name ILIKE 'lyrics'
+    """)
+
+    op.create_index(
+        "ix_praise_materials_lyrics_tsv",
+        "praise_materials",
+        ["lyrics_tsv"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade():
+    op.drop_index("ix_praise_materials_lyrics_tsv", table_name="praise_materials")
+    op.drop_column("praise_materials", "lyrics_tsv")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS pt_unaccent;")
@@ -0,0 +1,33 @@
+"""Add composite expression indexes for keyset pagination of praises
+
+Revision ID: 017_praise_keyset_indexes
+Revises: 016_lyrics_tsvector
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+revision = "017_praise_keyset_indexes"
+down_revision = "016_lyrics_tsvector"
+branch_labels = None
+depends_on = None
+
+# Um índice por ordenação de GET /api/v1/praises (sort_by/sort_direction/no_number),
+# todos terminando em (lower(name), id), que é o desempate usado pelo cursor.
+_INDEXES = {
+    "ix_praises_lower_name_id": "(lower(name), id)",
+    "ix_praises_number_asc_nulls_last": "(number ASC NULLS LAST, lower(name), id)",
+    "ix_praises_number_asc_nulls_first": "(number ASC NULLS FIRST, lower(name), id)",
+    "ix_praises_number_desc_nulls_last": "(number DESC NULLS LAST, lower(name), id)",
+    "ix_praises_number_desc_nulls_first": "(number DESC NULLS FIRST, lower(name), id)",
+}
+
+
+def upgrade():
+    for index_name, columns in _INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON praises {columns};")
+
+
+def downgrade():
+    for index_name in reversed(list(_INDEXES)):
+        op.execute(f"DROP INDEX IF EXISTS {index_name};")
@@ -0,0 +1,32 @@
+"""Add praise_catalog_entries denormalized read model
+
+Revision ID: 018_praise_catalog_entries
+Revises: 017_praise_keyset_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "018_praise_catalog_entries"
+down_revision = "017_praise_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Backfill no deploy: scripts/rebuild_praise_catalog.py --missing roda após alembic upgrade
+    # (o documento é o PraiseResponse serializado pela aplicação, não dá para montá-lo em SQL)
+    op.create_table(
+        "praise_catalog_entries",
+        sa.Column("praise_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("document", postgresql.JSONB(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["praise_id"], ["praises.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("praise_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("praise_catalog_entries")
@@ -0,0 +1,59 @@
+"""Add table_versions change counters for conditional GET (ETag)
+
+Revision ID: 019_table_versions
+Revises: 018_praise_catalog_entries
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+revision = "019_table_versions"
+down_revision = "018_praise_catalog_entries"
+branch_labels = None
+depends_on = None
+
+# Tabelas cujas escritas mudam as respostas de leitura do catálogo (ETags das listagens)
+_TABLES = (
+    "praises",
+    "praise_materials",
+    "praise_tag_association",
+    "praise_tags",
+    "material_kinds",
+    "material_types",
+    "languages",
+)
+
+
+def upgrade():
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name VARCHAR(63) PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        );
+    """)
+    values = ", ".join(f"('{table}', 0)" for table in _TABLES)
+    op.execute(f"INSERT INTO table_versions (table_name, version) VALUES {values} ON CONFLICT DO NOTHING;")
+
+    # Trigger por comando (não por linha): um UPDATE em massa incrementa a versão uma vez só
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table};")
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+        """)
+
+
+def downgrade():
+    for table in reversed(_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS bump_table_version();")
+    op.execute("DROP TABLE IF EXISTS table_versions;")
@@ -0,0 +1,40 @@
+"""Add table_versions triggers for translation tables (lookup cache invalidation)
+
+Revision ID: 020_translation_table_versions
+Revises: 019_table_versions
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+revision = "020_translation_table_versions"
+down_revision = "019_table_versions"
+branch_labels = None
+depends_on = None
+
+# Tabelas de tradução também ficam no cache de referência (LookupCache); as demais
+# tabelas de referência já têm contador desde a 019
+_TABLES = (
+    "material_kind_translations",
+    "material_type_translations",
+    "praise_tag_translations",
+)
+
+
+def upgrade():
+    values = ", ".join(f"('{table}', 0)" for table in _TABLES)
+    op.execute(f"INSERT INTO table_versions (table_name, version) VALUES {values} ON CONFLICT DO NOTHING;")
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table};")
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+        """)
+
+
+def downgrade():
+    for table in reversed(_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table};")
+    names = ", ".join(f"'{table}'" for table in _TABLES)
+    op.execute(f"DELETE FROM table_versions WHERE table_name IN ({names});")
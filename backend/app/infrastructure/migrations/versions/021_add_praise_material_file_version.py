@@ -0,0 +1,25 @@
+"""Add file_version to praise_materials (versioned download URLs)
+
+Revision ID: 021_material_file_version
+Revises: 020_translation_table_versions
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "021_material_file_version"
+down_revision = "020_translation_table_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "praise_materials",
+        sa.Column("file_version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade():
+    op.drop_column("praise_materials", "file_version")
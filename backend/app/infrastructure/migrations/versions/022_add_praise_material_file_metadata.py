@@ -0,0 +1,32 @@
+"""Add file metadata to praise_materials (size, content type, checksum, resolved path)
+
+Revision ID: 022_material_file_metadata
+Revises: 021_material_file_version
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "022_material_file_metadata"
+down_revision = "021_material_file_version"
+branch_labels = None
+depends_on = None
+
+# Preenchidas no upload/importação; materiais existentes: python scripts/reconcile_material_files.py
+
+
+def upgrade():
+    op.add_column("praise_materials", sa.Column("file_size", sa.BigInteger(), nullable=True))
+    op.add_column("praise_materials", sa.Column("content_type", sa.String(255), nullable=True))
+    op.add_column("praise_materials", sa.Column("checksum", sa.String(64), nullable=True))
+    op.add_column("praise_materials", sa.Column("resolved_path", sa.String(), nullable=True))
+    op.add_column("praise_materials", sa.Column("file_modified_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("praise_materials", "file_modified_at")
+    op.drop_column("praise_materials", "resolved_path")
+    op.drop_column("praise_materials", "checksum")
+    op.drop_column("praise_materials", "content_type")
+    op.drop_column("praise_materials", "file_size")
@@ -0,0 +1,81 @@
+"""Move table_versions counters to sequences (no row lock shared by writers)
+
+Revision ID: 023_table_version_sequences
+Revises: 022_material_file_metadata
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "023_table_version_sequences"
+down_revision = "022_material_file_metadata"
+branch_labels = None
+depends_on = None
+
+# Sequence de cada tabela versionada: table_version_<tabela>_seq
+_PREFIX = "table_version_"
+_SUFFIX = "_seq"
+
+# Só o nome da sequence muda por tabela (TG_TABLE_NAME); nextval não bloqueia outras transações
+_SEQUENCE_FUNCTION = f"""
+    CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+    BEGIN
+        PERFORM nextval(format('%I', '{_PREFIX}' || TG_TABLE_NAME || '{_SUFFIX}')::regclass);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+_ROW_FUNCTION = """
+    CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+    BEGIN
+        UPDATE table_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade():
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT table_name, version FROM table_versions")).fetchall()
+    for table_name, version in rows:
+        sequence = f"{_PREFIX}{table_name}{_SUFFIX}"
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {sequence};")
+        # +1: as ETags e o cache de referência veem uma versão nova uma única vez, na troca
+        op.execute(f"SELECT setval('{sequence}', {int(version) + 1});")
+
+    # Os triggers das migrações 019 e 020 continuam os mesmos; só a função muda
+    op.execute(_SEQUENCE_FUNCTION)
+    op.execute("DROP TABLE table_versions;")
+    # Mesma leitura de antes (table_name, version), agora a partir das sequences
+    # Novas tabelas versionadas só precisam da sequence e do trigger, a view já as inclui
+    op.execute(r"""
+        CREATE VIEW table_versions AS
+        SELECT
+            substr(sequencename, 15, length(sequencename) - 18)::varchar(63) AS table_name,
+            coalesce(last_value, 0)::bigint AS version
+        FROM pg_sequences
+        WHERE schemaname = current_schema()
+          AND sequencename LIKE 'table\_version\_%\_seq';
+    """)
+
+
+def downgrade():
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT table_name, version FROM table_versions")).fetchall()
+    op.execute("DROP VIEW table_versions;")
+    op.execute("""
+        CREATE TABLE table_versions (
+            table_name VARCHAR(63) PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        );
+    """)
+    for table_name, version in rows:
+        bind.execute(
+            sa.text("INSERT INTO table_versions (table_name, version) VALUES (:table_name, :version)"),
+            {"table_name": table_name, "version": version},
+        )
+        op.execute(f"DROP SEQUENCE IF EXISTS {_PREFIX}{table_name}{_SUFFIX};")
+    op.execute(_ROW_FUNCTION)
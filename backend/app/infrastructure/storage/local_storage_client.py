@@ -1,9 +1,12 @@
-from typing import Optional, BinaryIO
+from typing import Iterator, Optional, BinaryIO
 from uuid import UUID
 from pathlib import Path
+import io
 import os
 import shutil
+import uuid
 from app.core.config import settings
+from app.infrastructure.storage.streams import BoundedReader, StreamSource, as_reader, iter_reader
 
 
 class LocalStorageClient:
@@ -162,30 +165,68 @@ class LocalStorageClient:
         except Exception:
             return None
     
-    def download_file(self, file_path: str) -> bytes:
+    def get_file_mtime(self, file_path: str) -> Optional[float]:
         """
-        Baixa um arquivo do armazenamento local e retorna seu conteúdo binário
+        Obtém a data da última modificação de um arquivo no armazenamento local
         
         Args:
             file_path: Path relativo do arquivo no storage
         
         Returns:
-            Conteúdo binário do arquivo
+            Timestamp (segundos desde a época) ou None se não existir
+        """
+        full_path = self.storage_path / file_path
         
-        Raises:
-            Exception: Se o arquivo não existir ou houver erro ao ler
+        try:
+            if full_path.exists() and full_path.is_file():
+                return full_path.stat().st_mtime
+            return None
+        except Exception:
+            return None
+    
+    def local_path(self, file_path: str) -> Optional[str]:
+        """
+        Obtém o caminho absoluto do arquivo (configurado ou padrão do container)
+        
+        Args:
+            file_path: Path relativo do arquivo no storage
+        
+        Returns:
+            Caminho absoluto do arquivo ou None se não existir
         """
+        try:
+            return str(self._resolve_existing_path(file_path).resolve())
+        except Exception:
+            return None
+    
+    def _resolve_existing_path(self, file_path: str) -> Path:
+        """Caminho absoluto do arquivo (configurado ou padrão do container); erro se não existir."""
         # Tentar múltiplos caminhos, igual ao endpoint de download
         # Primeiro tenta o caminho configurado
         full_path = self.storage_path / file_path
+        if full_path.exists() and full_path.is_file():
+            return full_path
         
         # Se o caminho configurado não existir, tenta o caminho padrão do container
-        if not full_path.exists() or not full_path.is_file():
-            container_path = Path("/storage/assets") / file_path
-            if container_path.exists() and container_path.is_file():
-                full_path = container_path
-            else:
-                raise Exception(f"File not found: {file_path} (tried {self.storage_path / file_path} and {container_path})")
+        container_path = Path("/storage/assets") / file_path
+        if container_path.exists() and container_path.is_file():
+            return container_path
+        raise Exception(f"File not found: {file_path} (tried {full_path} and {container_path})")
+    
+    def download_file(self, file_path: str) -> bytes:
+        """
+        Baixa um arquivo do armazenamento local e retorna seu conteúdo binário
+        
+        Args:
+            file_path: Path relativo do arquivo no storage
+        
+        Returns:
+            Conteúdo binário do arquivo
+        
+        Raises:
+            Exception: Se o arquivo não existir ou houver erro ao ler
+        """
+        full_path = self._resolve_existing_path(file_path)
         
         try:
             with open(full_path, 'rb') as f:
@@ -193,4 +234,83 @@ class LocalStorageClient:
         except FileNotFoundError:
             raise Exception(f"File not found: {file_path} (tried {self.storage_path / file_path} and {Path('/storage/assets') / file_path})")
         except Exception as e:
-            raise Exception(f"Error downloading file from local storage: {str(e)} (path: {full_path})")
\ No newline at end of file
+            raise Exception(f"Error downloading file from local storage: {str(e)} (path: {full_path})")
+    
+    def open_read(self, file_path: str, start: int = 0, length: Optional[int] = None) -> BinaryIO:
+        """
+        Abre um arquivo do armazenamento local para leitura
+        
+        Args:
+            file_path: Path relativo do arquivo no storage
+            start: Posição inicial em bytes
+            length: Quantidade máxima de bytes a ler (None: até o fim)
+        
+        Returns:
+            Objeto de arquivo somente leitura
+        
+        Raises:
+            Exception: Se o arquivo não existir
+        """
+        handle = open(self._resolve_existing_path(file_path), 'rb')
+        if start:
+            handle.seek(start)
+        if length is None:
+            return handle
+        return io.BufferedReader(BoundedReader(handle, length))
+    
+    def iter_chunks(
+        self,
+        file_path: str,
+        chunk_size: int = 1024 * 1024,
+        start: int = 0,
+        length: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Lê um arquivo (ou um intervalo dele) do armazenamento local em blocos
+        
+        Args:
+            file_path: Path relativo do arquivo no storage
+            chunk_size: Tamanho máximo de cada bloco em bytes
+            start: Posição inicial em bytes
+            length: Quantidade máxima de bytes a ler (None: até o fim)
+        
+        Returns:
+            Iterador com o conteúdo do arquivo em blocos
+        
+        Raises:
+            Exception: Se o arquivo não existir
+        """
+        # Resolvido (e aberto) já na chamada, para que arquivo ausente falhe antes da iteração
+        return iter_reader(self.open_read(file_path, start, length), chunk_size)
+    
+    def write_stream(
+        self,
+        file_path: str,
+        source: StreamSource,
+        content_type: Optional[str] = None
+    ) -> str:
+        """
+        Grava um arquivo no armazenamento local a partir de um stream
+        
+        O conteúdo vai para um arquivo temporário na mesma pasta, renomeado sobre o destino
+        ao final: leitores nunca veem o arquivo pela metade.
+        
+        Args:
+            file_path: Path relativo de destino no storage
+            source: Objeto de arquivo (BinaryIO) ou iterável de blocos de bytes
+            content_type: Tipo MIME do arquivo (ignorado no armazenamento local)
+        
+        Returns:
+            Path relativo do arquivo no storage
+        """
+        full_path = self.storage_path / file_path
+        temp_path = full_path.with_name(f".{full_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                shutil.copyfileobj(as_reader(source), f, 1024 * 1024)
+            os.replace(temp_path, full_path)
+            return file_path
+        except Exception as e:
+            temp_path.unlink(missing_ok=True)
+            raise Exception(f"Error writing file to local storage: {str(e)}")
@@ -1,4 +1,5 @@
-from typing import Protocol, Optional, BinaryIO
+from typing import Iterator, Protocol, Optional, BinaryIO
+from app.infrastructure.storage.streams import StreamSource
 from uuid import UUID
 
 
@@ -80,6 +81,30 @@ class StorageClient(Protocol):
         """
         ...
     
+    def get_file_mtime(self, file_path: str) -> Optional[float]:
+        """
+        Obtém a data da última modificação de um arquivo no storage
+        
+        Args:
+            file_path: Path do arquivo no storage
+        
+        Returns:
+            Timestamp (segundos desde a época, UTC) ou None se não existir
+        """
+        ...
+    
+    def local_path(self, file_path: str) -> Optional[str]:
+        """
+        Obtém o caminho absoluto do arquivo no disco
+        
+        Args:
+            file_path: Path do arquivo no storage
+        
+        Returns:
+            Caminho absoluto, ou None se não existir ou se o storage for remoto
+        """
+        ...
+    
     def download_file(self, file_path: str) -> bytes:
         """
         Baixa um arquivo do storage e retorna seu conteúdo binário
@@ -93,4 +118,70 @@ class StorageClient(Protocol):
         Raises:
             Exception: Se o arquivo não existir ou houver erro ao baixar
         """
-        ...
\ No newline at end of file
+        ...
+    
+    def open_read(self, file_path: str, start: int = 0, length: Optional[int] = None) -> BinaryIO:
+        """
+        Abre um arquivo do storage para leitura em streaming (memória constante)
+        
+        Args:
+            file_path: Path do arquivo no storage
+            start: Posição inicial em bytes (padrão: início do arquivo)
+            length: Quantidade máxima de bytes a ler (padrão: até o fim)
+        
+        Returns:
+            Objeto de arquivo somente leitura (usar com `with` ou fechar ao final)
+        
+        Raises:
+            Exception: Se o arquivo não existir ou houver erro ao abrir
+        """
+        ...
+    
+    def iter_chunks(
+        self,
+        file_path: str,
+        chunk_size: int = 1024 * 1024,
+        start: int = 0,
+        length: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Lê um arquivo do storage em blocos, sem carregá-lo inteiro em memória
+        
+        Args:
+            file_path: Path do arquivo no storage
+            chunk_size: Tamanho máximo de cada bloco em bytes (padrão: 1 MB)
+            start: Posição inicial em bytes (padrão: início do arquivo)
+            length: Quantidade máxima de bytes a ler (padrão: até o fim)
+        
+        Returns:
+            Iterador com o conteúdo do arquivo (ou do intervalo) em blocos
+        
+        Raises:
+            Exception: Se o arquivo não existir ou houver erro ao abrir
+        """
+        ...
+    
+    def write_stream(
+        self,
+        file_path: str,
+        source: StreamSource,
+        content_type: Optional[str] = None
+    ) -> str:
+        """
+        Grava um arquivo no storage a partir de um stream, sem carregá-lo inteiro em memória
+        
+        Diferente de upload_file, grava exatamente em file_path (substituindo o arquivo
+        existente); o arquivo só aparece no storage depois de gravado por completo.
+        
+        Args:
+            file_path: Path de destino no storage
+            source: Objeto de arquivo (BinaryIO) ou iterável de blocos de bytes
+            content_type: Tipo MIME do arquivo
+        
+        Returns:
+            Path do arquivo no storage
+        
+        Raises:
+            Exception: Se houver erro ao gravar
+        """
+        ...
@@ -0,0 +1,84 @@
+"""
+Adaptadores de stream usados pelos clientes de storage.
+
+Permitem ler (open_read) e gravar (write_stream) arquivos de qualquer tamanho com memória
+constante, qualquer que seja a origem: arquivo local, corpo de resposta do S3 ou gerador de blocos.
+"""
+
+import io
+from typing import BinaryIO, Iterable, Iterator, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+StreamSource = Union[BinaryIO, Iterable[bytes]]
+
+
+class BoundedReader(io.RawIOBase):
+    """Arquivo somente leitura sobre outro objeto com read(), limitado a `length` bytes (None: até o fim).
+
+    Fecha o objeto de origem ao ser fechado.
+    """
+
+    def __init__(self, source, length: Optional[int] = None):
+        self._source = source
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = len(buffer)
+        if self._remaining is not None:
+            size = min(size, self._remaining)
+        if size <= 0:
+            return 0
+        data = self._source.read(size)
+        count = len(data)
+        buffer[:count] = data
+        if self._remaining is not None:
+            self._remaining -= count
+        return count
+
+    def close(self) -> None:
+        if not self.closed:
+            self._source.close()
+        super().close()
+
+
+class IterableReader(io.RawIOBase):
+    """Arquivo somente leitura sobre um iterável de blocos de bytes."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+
+def as_reader(source: StreamSource) -> BinaryIO:
+    """Objeto com read() a partir de um arquivo (devolvido como está) ou de um iterável de blocos."""
+    if hasattr(source, "read"):
+        return source
+    return io.BufferedReader(IterableReader(source), buffer_size=DEFAULT_CHUNK_SIZE)
+
+
+def iter_reader(reader: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Blocos de até chunk_size bytes lidos de reader, que é fechado ao final."""
+    with reader:
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
@@ -1,12 +1,22 @@
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
-from typing import Optional, BinaryIO
+from typing import Iterator, Optional, BinaryIO
 from datetime import timedelta
 from uuid import UUID
 from app.core.config import settings
+from app.infrastructure.storage.streams import BoundedReader, StreamSource, as_reader, iter_reader
+import io
 import uuid
 import os
 
+# Uploads em partes de 8 MB (multipart acima disso): memória limitada a poucas partes em voo
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
 
 class WasabiClient:
     def __init__(self):
@@ -61,7 +71,8 @@ class WasabiClient:
                 file_obj,
                 self.bucket_name,
                 key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=TRANSFER_CONFIG
             )
             return key
         except ClientError as e:
@@ -146,6 +157,32 @@ class WasabiClient:
         except ClientError:
             return None
     
+    def get_file_mtime(self, file_path: str) -> Optional[float]:
+        """
+        Obtém a data da última modificação de um arquivo no Wasabi
+        
+        Args:
+            file_path: Path do arquivo no Wasabi
+        
+        Returns:
+            Timestamp (segundos desde a época, UTC) ou None se não existir
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=file_path)
+            last_modified = response.get('LastModified')
+            return last_modified.timestamp() if last_modified else None
+        except ClientError:
+            return None
+    
+    def local_path(self, file_path: str) -> Optional[str]:
+        """
+        Arquivos do Wasabi não estão no disco local
+        
+        Returns:
+            Sempre None
+        """
+        return None
+    
     def download_file(self, file_path: str) -> bytes:
         """
         Baixa um arquivo do Wasabi e retorna seu conteúdo binário
@@ -159,22 +196,90 @@ class WasabiClient:
         Raises:
             Exception: Se o arquivo não existir ou houver erro ao baixar
         """
-        from io import BytesIO
+        # Lido direto do corpo do GetObject (sem BytesIO intermediário e a cópia do .read())
+        with self.open_read(file_path) as body:
+            return body.read()
+
+    def open_read(self, file_path: str, start: int = 0, length: Optional[int] = None) -> BinaryIO:
+        """
+        Abre um arquivo do Wasabi para leitura em streaming (GetObject com Range quando parcial)
+        
+        Args:
+            file_path: Path do arquivo no Wasabi
+            start: Posição inicial em bytes
+            length: Quantidade máxima de bytes a ler (None: até o fim)
         
+        Returns:
+            Objeto de arquivo somente leitura sobre o corpo da resposta
+        
+        Raises:
+            Exception: Se o arquivo não existir ou houver erro ao abrir
+        """
+        if length == 0:
+            return io.BytesIO()
+        params = {'Bucket': self.bucket_name, 'Key': file_path}
+        if start or length is not None:
+            end = str(start + length - 1) if length is not None else ''
+            params['Range'] = f"bytes={start}-{end}"
         try:
-            buffer = BytesIO()
-            self.s3_client.download_fileobj(
-                Bucket=self.bucket_name,
-                Key=file_path,
-                Fileobj=buffer
-            )
-            buffer.seek(0)
-            return buffer.read()
+            response = self.s3_client.get_object(**params)
         except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'InvalidRange':
+                # Início além do fim do arquivo: nada a ler, como no armazenamento local
+                return io.BytesIO()
             raise Exception(f"Error downloading file from Wasabi: {str(e)}")
+        return io.BufferedReader(BoundedReader(response['Body']), buffer_size=1024 * 1024)
 
+    def iter_chunks(
+        self,
+        file_path: str,
+        chunk_size: int = 1024 * 1024,
+        start: int = 0,
+        length: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Lê um arquivo (ou um intervalo dele) do Wasabi em blocos (corpo do GetObject em streaming)
+        
+        Args:
+            file_path: Path do arquivo no Wasabi
+            chunk_size: Tamanho máximo de cada bloco em bytes
+            start: Posição inicial em bytes
+            length: Quantidade máxima de bytes a ler (None: até o fim)
+        
+        Returns:
+            Iterador com o conteúdo do arquivo em blocos
+        
+        Raises:
+            Exception: Se o arquivo não existir ou houver erro ao abrir
+        """
+        return iter_reader(self.open_read(file_path, start, length), chunk_size)
 
-
-
-
-
+    def write_stream(
+        self,
+        file_path: str,
+        source: StreamSource,
+        content_type: Optional[str] = None
+    ) -> str:
+        """
+        Grava um arquivo no Wasabi a partir de um stream (upload multipart em partes de 8 MB)
+        
+        Args:
+            file_path: Key de destino no Wasabi
+            source: Objeto de arquivo (BinaryIO) ou iterável de blocos de bytes
+            content_type: Tipo MIME do arquivo
+        
+        Returns:
+            Key do arquivo no Wasabi
+        """
+        extra_args = {'ContentType': content_type} if content_type else {}
+        try:
+            self.s3_client.upload_fileobj(
+                as_reader(source),
+                self.bucket_name,
+                file_path,
+                ExtraArgs=extra_args,
+                Config=TRANSFER_CONFIG
+            )
+            return file_path
+        except ClientError as e:
+            raise Exception(f"Error uploading file to Wasabi: {str(e)}")
@@ -6,13 +6,13 @@ from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.v1.routes import (
+    archives,
     audit,
     auth,
     data_protection,
@@ -25,8 +25,13 @@ from app.api.v1.routes import (
     snapshots,
     translations,
 )
+from app.application.services.archive_spool_service import start_archive_spool_cleaner
+from app.application.services.archive_job_service import archive_jobs
+from app.application.services.praise_search_index import start_search_index_refresher
 from app.core.config import settings
 from app.core.middleware.audit_middleware import AuditMiddleware
+from app.core.static_assets import VersionedStaticFiles
+from app.infrastructure.cache.lookup_cache import log_lookup_cache_stats, start_lookup_cache_stats_logger
 from app.infrastructure.database.database import Base, engine
 
 def _rate_limit_key(request: Request) -> str:
@@ -74,8 +79,8 @@ if use_wildcard and settings.DEPLOYMENT_ENV == "dev":
         allow_origins=["*"],
         allow_credentials=False,  # Desabilitado para permitir wildcard
         allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-        allow_headers=["Authorization", "Content-Type", "Accept", "Range", "Access-Control-Request-Method", "Access-Control-Request-Headers"],
-        expose_headers=["Content-Disposition", "Content-Range", "Accept-Ranges", "Content-Length"],
+        allow_headers=["Authorization", "Content-Type", "Accept", "Range", "If-None-Match", "If-Modified-Since", "Access-Control-Request-Method", "Access-Control-Request-Headers"],
+        expose_headers=["Content-Disposition", "Content-Range", "Accept-Ranges", "Content-Length", "X-Next-Cursor", "ETag", "Last-Modified"],
         max_age=600,
     )
 else:
@@ -85,8 +90,8 @@ else:
         allow_origins=settings.CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-        allow_headers=["Authorization", "Content-Type", "Accept", "Range", "Access-Control-Request-Method", "Access-Control-Request-Headers"],
-        expose_headers=["Content-Disposition", "Content-Range", "Accept-Ranges", "Content-Length"],
+        allow_headers=["Authorization", "Content-Type", "Accept", "Range", "If-None-Match", "If-Modified-Since", "Access-Control-Request-Method", "Access-Control-Request-Headers"],
+        expose_headers=["Content-Disposition", "Content-Range", "Accept-Ranges", "Content-Length", "X-Next-Cursor", "ETag", "Last-Modified"],
         max_age=600,
     )
 
@@ -98,7 +103,7 @@ app.add_middleware(AuditMiddleware)
 storage_path = Path(settings.STORAGE_LOCAL_PATH)
 storage_path.mkdir(parents=True, exist_ok=True)
 try:
-    app.mount("/assets", StaticFiles(directory=str(storage_path)), name="assets")
+    app.mount("/assets", VersionedStaticFiles(directory=str(storage_path)), name="assets")
     print(f"Static files mounted at /assets from {storage_path}")
 except Exception as e:
     # Se o diretório não existir ou houver erro, apenas loga mas não quebra a aplicação
@@ -116,6 +121,7 @@ app.include_router(translations.router, prefix="/api/v1/translations", tags=["Tr
 # Snapshot endpoint (UC-143) - ainda não implementado completamente
 app.include_router(snapshots.router, prefix="/api/v1/snapshots", tags=["Snapshots"])
 app.include_router(audit.router, prefix="/api/v1/audit-logs", tags=["Audit"])
+app.include_router(archives.router, prefix="/api/v1/archives", tags=["Archives"])
 app.include_router(data_protection.router, prefix="/api/v1/data-protection", tags=["Data Protection"])
 
 
@@ -200,7 +206,17 @@ async def general_exception_handler(request: Request, exc: Exception):
 @app.on_event("startup")
 async def startup_event():
     # Create tables (migrations should handle this, but this is a fallback)
-    pass
+    # Índice de busca das sugestões: construído em background para não atrasar o boot
+    start_search_index_refresher()
+    # Lotes de download vencidos (partes ZIP em disco) e estados de jobs terminados
+    start_archive_spool_cleaner(extra_cleanups=[archive_jobs.cleanup_expired])
+    # Contadores do cache de referência: só no log (não expostos por HTTP)
+    start_lookup_cache_stats_logger()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    log_lookup_cache_stats()
 
 
 @app.get("/")
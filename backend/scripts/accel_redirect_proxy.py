@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Proxy de teste para ACCEL_REDIRECT_ENABLED=true sem nginx.
+
+Repassa as requisições para a API (--backend) e, quando a resposta traz X-Accel-Redirect,
+faz o papel do nginx: encontra o arquivo pelas mesmas locations internal da API
+(app.core.accel_redirect.accel_locations) e o envia do disco, com Range de um intervalo.
+Content-Type, Content-Disposition e Cache-Control da API são mantidos, como no nginx.
+Os prefixos internal (ex.: /_protected/) não são acessíveis diretamente: respondem 404.
+
+Com --self-test não precisa de banco nem da API rodando: sobe uma API mínima que responde
+com accel_file_response para um arquivo temporário, passa por este proxy e confere o
+arquivo inteiro, um intervalo e o bloqueio do acesso direto (código 1 se algo falhar).
+"""
+
+import argparse
+import http.client
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.accel_redirect import accel_locations
+from app.core.config import settings
+from app.core.range_requests import FILE_CHUNK_SIZE, parse_byte_ranges
+
+# Headers que o nginx preserva da resposta da API ao seguir o X-Accel-Redirect
+KEPT_HEADERS = ("Content-Type", "Content-Disposition", "Cache-Control", "Expires", "Set-Cookie")
+HOP_BY_HOP = {"connection", "keep-alive", "transfer-encoding", "te", "trailer", "upgrade", "proxy-connection"}
+
+
+def resolve_internal(uri: str) -> Optional[Path]:
+    """Arquivo da URI interna, pelas locations da API (None se não casa ou sai do diretório)."""
+    path = unquote(urlsplit(uri).path)
+    for location, root in accel_locations():
+        if path.startswith(location):
+            root = root.resolve()
+            target = (root / path[len(location):]).resolve()
+            if target != root and root in target.parents:
+                return target
+    return None
+
+
+def make_handler(backend: str):
+    backend_url = urlsplit(backend)
+    internal_prefixes = tuple(location for location, _ in accel_locations())
+
+    class ProxyHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.proxy()
+
+        def do_HEAD(self):
+            self.proxy()
+
+        def do_POST(self):
+            self.proxy()
+
+        def do_PUT(self):
+            self.proxy()
+
+        def do_PATCH(self):
+            self.proxy()
+
+        def do_DELETE(self):
+            self.proxy()
+
+        def do_OPTIONS(self):
+            self.proxy()
+
+        def proxy(self):
+            if self.path.startswith(internal_prefixes):
+                self.send_error(404)
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else None
+            headers = {key: value for key, value in self.headers.items() if key.lower() not in HOP_BY_HOP}
+            headers["X-Forwarded-For"] = self.client_address[0]
+
+            connection = http.client.HTTPConnection(backend_url.hostname, backend_url.port or 80, timeout=300)
+            try:
+                connection.request(self.command, self.path, body=body, headers=headers)
+                response = connection.getresponse()
+                accel = response.getheader("X-Accel-Redirect")
+                if accel:
+                    response.read()
+                    self.send_internal(accel, response)
+                else:
+                    self.relay(response)
+            finally:
+                connection.close()
+
+        def relay(self, response):
+            self.send_response(response.status, response.reason)
+            for key, value in response.getheaders():
+                if key.lower() not in HOP_BY_HOP and key.lower() != "content-length":
+                    self.send_header(key, value)
+            chunked = self.command != "HEAD" and response.status not in (204, 304)
+            if chunked:
+                self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            if not chunked:
+                return
+            while True:
+                chunk = response.read(FILE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+
+        def send_internal(self, uri: str, response):
+            path = resolve_internal(uri)
+            if path is None or not path.is_file():
+                self.send_error(404)
+                return
+            size = path.stat().st_size
+            start, end, status = 0, size - 1, 200
+            range_header = self.headers.get("Range")
+            if range_header:
+                try:
+                    ranges = parse_byte_ranges(range_header, size)
+                except ValueError:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                # Vários intervalos: o stub responde o arquivo inteiro
+                if ranges and len(ranges) == 1:
+                    (start, end), status = ranges[0], 206
+
+            self.send_response(status)
+            for key in KEPT_HEADERS:
+                value = response.getheader(key)
+                if value:
+                    self.send_header(key, value)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(end - start + 1))
+            if status == 206:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.end_headers()
+            if self.command == "HEAD":
+                return
+            with open(path, "rb") as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(FILE_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+
+    return ProxyHandler
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def self_test() -> int:
+    import uvicorn
+    from fastapi import FastAPI
+    from app.core.accel_redirect import accel_file_response
+
+    storage_dir = Path(tempfile.mkdtemp(prefix="accel-test-"))
+    try:
+        settings.STORAGE_LOCAL_PATH = str(storage_dir)
+        settings.ACCEL_REDIRECT_ENABLED = True
+        content = os.urandom(3 * FILE_CHUNK_SIZE + 123)
+        file_path = storage_dir / "praise 1" / "partitura ç.pdf"
+        file_path.parent.mkdir()
+        file_path.write_bytes(content)
+
+        api = FastAPI()
+
+        @api.get("/download")
+        def download():
+            response = accel_file_response(
+                file_path,
+                "application/pdf",
+                {"Content-Disposition": 'inline; filename="partitura.pdf"'},
+            )
+            assert response is not None and not response.body, "API deveria responder sem corpo"
+            return response
+
+        api_port, proxy_port = free_port(), free_port()
+        server = uvicorn.Server(uvicorn.Config(api, host="127.0.0.1", port=api_port, log_level="warning"))
+        threading.Thread(target=server.run, daemon=True).start()
+        proxy = ThreadingHTTPServer(("127.0.0.1", proxy_port), make_handler(f"http://127.0.0.1:{api_port}"))
+        threading.Thread(target=proxy.serve_forever, daemon=True).start()
+        while not server.started:
+            time.sleep(0.05)
+
+        base = f"http://127.0.0.1:{proxy_port}"
+        failures = []
+        with urllib.request.urlopen(f"{base}/download") as response:
+            if response.read() != content or response.headers["Content-Type"] != "application/pdf":
+                failures.append("arquivo inteiro")
+        request = urllib.request.Request(f"{base}/download", headers={"Range": "bytes=-100"})
+        with urllib.request.urlopen(request) as response:
+            if response.status != 206 or response.read() != content[-100:]:
+                failures.append("Range")
+        location = settings.ACCEL_REDIRECT_STORAGE_LOCATION
+        try:
+            urllib.request.urlopen(f"{base}{location}praise%201/partitura%20%C3%A7.pdf")
+            failures.append("acesso direto à location internal")
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                failures.append(f"acesso direto respondeu {e.code}")
+
+        server.should_exit = True
+        proxy.shutdown()
+    finally:
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+    if failures:
+        print("Falhas: " + ", ".join(failures))
+        return 1
+    print("OK: arquivo inteiro, Range e bloqueio da location internal")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Proxy de teste para downloads com X-Accel-Redirect")
+    parser.add_argument("--backend", default="http://127.0.0.1:8000", help="URL da API (padrão: http://127.0.0.1:8000)")
+    parser.add_argument("--port", type=int, default=8080, help="Porta do proxy (padrão: 8080)")
+    parser.add_argument("--self-test", action="store_true", help="Testar com uma API mínima e arquivo temporário")
+    args = parser.parse_args()
+
+    if args.self_test:
+        return self_test()
+
+    for location, root in accel_locations():
+        print(f"{location} -> {root}")
+    print(f"Proxy em http://127.0.0.1:{args.port} -> {args.backend}")
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.backend))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
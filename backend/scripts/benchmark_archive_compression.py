@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da compressão dos ZIPs de download (app.core.archive_builder).
+
+Monta o mesmo ZIP com cada política e mostra tempo de CPU, tempo total e tamanho final:
+- deflate: tudo com DEFLATE (comportamento anterior ao ArchiveBuilder);
+- stored: nada comprimido;
+- auto: política do ArchiveBuilder (extensão ou entropia do primeiro bloco).
+
+Os arquivos vêm de um diretório (--dir, ex.: o STORAGE_LOCAL_PATH, só .pdf e áudio) ou, por
+padrão, são gerados em memória imitando o acervo: MP3 (dados comprimidos com cabeçalho ID3),
+PDFs de partitura com streams já comprimidos (FlateDecode e imagens) e PDFs com streams de
+texto sem compressão. O ZIP é gravado numa saída que só conta bytes (sem disco).
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+import zipfile
+import zlib
+from pathlib import Path
+from typing import List, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.archive_builder import ArchiveBuilder, choose_compress_type
+
+CHUNK_SIZE = 1024 * 1024
+FILE_EXTENSIONS = {".pdf", ".mp3", ".m4a", ".wav", ".ogg", ".flac", ".wma"}
+
+
+class CountingSink(io.RawIOBase):
+    """Saída sem seek que só conta os bytes do ZIP."""
+
+    def __init__(self):
+        super().__init__()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.size += len(data)
+        return len(data)
+
+
+def synthetic_mp3(rng: random.Random, size: int) -> bytes:
+    return b"ID3\x03\x00\x00\x00\x00\x0f\x76" + b"\x00" * 200 + rng.randbytes(size - 210)
+
+
+def _pdf_operators(rng: random.Random, size: int) -> bytes:
+    """Comandos de desenho de partitura (linhas, curvas, glifos): texto repetitivo."""
+    lines = []
+    total = 0
+    while total < size:
+        x, y = rng.randint(0, 600), rng.randint(0, 800)
+        line = rng.choice([
+            f"{x} {y} m {x + 40} {y} l S\n",
+            f"{x} {y} {x + 3} {y + 5} {x + 8} {y + 2} c f\n",
+            f"BT /F1 12 Tf {x} {y} Td (Gloria ao Rei) Tj ET\n",
+            f"q 1 0 0 1 {x} {y} cm /Note{rng.randint(1, 9)} Do Q\n",
+        ])
+        lines.append(line)
+        total += len(line)
+    return "".join(lines).encode("ascii")
+
+
+def synthetic_pdf(rng: random.Random, size: int, compressed_streams: bool) -> bytes:
+    parts = [b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"]
+    written = len(parts[0])
+    number = 3
+    while written < size:
+        if compressed_streams:
+            # Streams FlateDecode e imagens JPEG embutidas: alta entropia
+            body = zlib.compress(_pdf_operators(rng, 64 * 1024), 6) if rng.random() < 0.6 else rng.randbytes(48 * 1024)
+            header = f"{number} 0 obj << /Length {len(body)} /Filter /FlateDecode >> stream\n".encode("ascii")
+        else:
+            body = _pdf_operators(rng, 32 * 1024)
+            header = f"{number} 0 obj << /Length {len(body)} >> stream\n".encode("ascii")
+        chunk = header + body + b"\nendstream endobj\n"
+        parts.append(chunk)
+        written += len(chunk)
+        number += 1
+    parts.append(b"trailer << /Root 1 0 R >>\n%%EOF\n")
+    return b"".join(parts)
+
+
+def synthetic_files(pdfs: int, audios: int, seed: int) -> List[Tuple[str, bytes]]:
+    rng = random.Random(seed)
+    files = []
+    for i in range(pdfs):
+        size = rng.randint(80, 1500) * 1024
+        # Maioria dos PDFs exportados por editores de partitura já vem com streams comprimidos
+        compressed = i % 4 != 0
+        files.append((f"partitura_{i}.pdf", synthetic_pdf(rng, size, compressed)))
+    for i in range(audios):
+        files.append((f"audio_{i}.mp3", synthetic_mp3(rng, rng.randint(3, 8) * 1024 * 1024)))
+    return files
+
+
+def directory_files(directory: Path, limit: int) -> List[Tuple[str, bytes]]:
+    files = []
+    for path in sorted(directory.rglob("*")):
+        if path.is_file() and path.suffix.lower() in FILE_EXTENSIONS:
+            files.append((str(path.relative_to(directory)), path.read_bytes()))
+            if len(files) >= limit:
+                break
+    return files
+
+
+def chunks_of(data: bytes):
+    for start in range(0, len(data), CHUNK_SIZE):
+        yield data[start:start + CHUNK_SIZE]
+
+
+def build(files: List[Tuple[str, bytes]], policy: str, level: int) -> Tuple[float, float, int]:
+    forced = {"deflate": zipfile.ZIP_DEFLATED, "stored": zipfile.ZIP_STORED, "auto": None}[policy]
+    sink = CountingSink()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    with ArchiveBuilder(sink, compresslevel=level) as builder:
+        for name, data in files:
+            builder.add(name, chunks_of(data), size=len(data), compress_type=forced)
+    return time.process_time() - cpu_start, time.perf_counter() - wall_start, sink.size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compara políticas de compressão dos ZIPs de download")
+    parser.add_argument("--dir", type=Path, help="Usar arquivos reais deste diretório (.pdf e áudio)")
+    parser.add_argument("--limit", type=int, default=200, help="Máximo de arquivos lidos de --dir (padrão: 200)")
+    parser.add_argument("--pdfs", type=int, default=40, help="PDFs sintéticos (padrão: 40)")
+    parser.add_argument("--audios", type=int, default=10, help="MP3 sintéticos (padrão: 10)")
+    parser.add_argument("--levels", default="1,6,9", help="Níveis de DEFLATE, separados por vírgula (padrão: 1,6,9)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    files = directory_files(args.dir, args.limit) if args.dir else synthetic_files(args.pdfs, args.audios, args.seed)
+    if not files:
+        print("Nenhum arquivo para o benchmark")
+        return 1
+
+    total_input = sum(len(data) for _, data in files)
+    stored_by_policy = sum(
+        1 for name, data in files if choose_compress_type(name, data[:CHUNK_SIZE]) == zipfile.ZIP_STORED
+    )
+    print(f"Arquivos: {len(files)} ({total_input / 1024 / 1024:.1f} MB)")
+    print(f"Política auto: {stored_by_policy} sem compressão, {len(files) - stored_by_policy} com DEFLATE\n")
+
+    print(f"{'política':<10}{'nível':>6}{'CPU (s)':>10}{'total (s)':>11}{'ZIP (MB)':>11}{'% original':>12}")
+    rows = [("stored", 0)]
+    for level in (int(value) for value in args.levels.split(",")):
+        rows += [("deflate", level), ("auto", level)]
+    for policy, level in rows:
+        cpu, wall, size = build(files, policy, level)
+        print(
+            f"{policy:<10}{level if policy != 'stored' else '-':>6}{cpu:>10.2f}{wall:>11.2f}"
+            f"{size / 1024 / 1024:>11.1f}{size / total_input * 100:>11.1f}%"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
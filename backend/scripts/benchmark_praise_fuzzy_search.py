@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da busca fuzzy de nomes de praises (fuzzy=true).
+
+Para cada termo (com erros de digitação), executa a mesma consulta de IDs usada pelo
+PraiseRepository com EXPLAIN (ANALYZE, FORMAT JSON) e verifica no plano que a tabela
+praises é lida pelo índice GIN trigram de name_search (Bitmap Index Scan em
+ix_praises_name_search_trgm), e não por Seq Scan. Também mede a latência da consulta
+completa e mostra os primeiros resultados com a similaridade.
+
+Com --seed N, cria N praises sintéticos dentro de uma transação que é desfeita
+(rollback) no final; o banco não é alterado. Em tabelas muito pequenas o planner
+prefere Seq Scan mesmo com o índice disponível, por isso use --seed em bancos de teste.
+
+Retorna código 1 se algum termo cair em Seq Scan sobre praises.
+"""
+
+import sys
+import os
+import time
+import random
+import statistics
+from uuid import uuid4
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.search_normalizer import normalize_search_query
+from app.infrastructure.database.database import SessionLocal
+from app.domain.models.praise import Praise
+from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+
+DEFAULT_TERMS = ["glorya", "santo santo", "grandi e o senhr", "aleluya", "maravilhozo"]
+
+SEED_WORDS = [
+    "gloria", "santo", "senhor", "aleluia", "grande", "maravilhoso", "jesus", "deus", "rei",
+    "cordeiro", "amor", "graca", "louvor", "fiel", "poder", "nome", "vida", "luz", "cruz",
+    "eterno", "espirito", "gracas", "alto", "trono", "salvador", "coracao", "adorar", "celeste",
+]
+
+
+def seed_praises(db: Session, count: int) -> None:
+    """Cria praises sintéticos com nomes combinando palavras comuns (sem commit)."""
+    rng = random.Random(42)
+    suffix = uuid4().hex[:6]
+    for i in range(count):
+        name = " ".join(rng.choice(SEED_WORDS) for _ in range(rng.randint(2, 5))).capitalize()
+        name = f"{name} {suffix}{i}"
+        db.add(Praise(name=name, name_search=normalize_search_query(name)))
+        if i % 1000 == 0:
+            db.flush()
+    db.flush()
+    # Estatísticas para o planner (transacional: desfeitas junto com o rollback)
+    db.execute(text("ANALYZE praises"))
+
+
+def id_query(repo: PraiseRepository, term: str, threshold: float, limit: int):
+    """Mesma consulta de IDs de get_all_filtered_sorted(name=..., fuzzy, sort_by=relevance)."""
+    return repo._filtered_sorted_page(
+        repo.db.query(Praise.id),
+        0,
+        limit,
+        name=term,
+        sort_by="relevance",
+        fuzzy_threshold=threshold,
+    )
+
+
+def plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain(db: Session, query) -> dict:
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    row = db.connection().exec_driver_sql(
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + str(compiled), compiled.params
+    ).fetchone()
+    return row[0][0]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark da busca fuzzy de praises')
+    parser.add_argument('terms', nargs='*', help=f'Termos a buscar (padrão: {", ".join(DEFAULT_TERMS)})')
+    parser.add_argument('--seed', type=int, default=0, help='Criar N praises sintéticos (desfeito no final)')
+    parser.add_argument('--threshold', type=float, default=settings.FUZZY_SEARCH_THRESHOLD,
+                        help=f'Limiar de similaridade (padrão: FUZZY_SEARCH_THRESHOLD={settings.FUZZY_SEARCH_THRESHOLD})')
+    parser.add_argument('--limit', type=int, default=20, help='Tamanho da página (padrão: 20)')
+    parser.add_argument('--repeat', type=int, default=20, help='Repetições por termo (padrão: 20)')
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    repo = PraiseRepository(db)
+    seq_scans = 0
+
+    try:
+        if args.seed:
+            print(f"🌱 Criando {args.seed} praises sintéticos")
+            seed_praises(db, args.seed)
+
+        total = db.query(func.count(Praise.id)).scalar()
+        print(f"📊 Praises no catálogo: {total} | limiar: {args.threshold} | limit: {args.limit}")
+        print()
+
+        for raw_term in args.terms or DEFAULT_TERMS:
+            term = normalize_search_query(raw_term)
+            if not term:
+                continue
+            query = id_query(repo, term, args.threshold, args.limit)
+            plan = explain(db, query)
+            nodes = list(plan_nodes(plan["Plan"]))
+            seq = [n for n in nodes if n["Node Type"] == "Seq Scan" and n.get("Relation Name") == "praises"]
+            indexes = sorted({n["Index Name"] for n in nodes if n.get("Index Name")})
+            seq_scans += bool(seq)
+
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                ids = [row.id for row in id_query(repo, term, args.threshold, args.limit).all()]
+                timings.append((time.perf_counter() - start) * 1000)
+
+            status = "❌ Seq Scan em praises" if seq else "✅ índice"
+            print(f"🔎 '{raw_term}' -> '{term}': {len(ids)} resultado(s), {status} ({', '.join(indexes) or '-'})")
+            print(f"   execução (EXPLAIN): {plan['Execution Time']:.2f} ms | mediana: {statistics.median(timings):.2f} ms")
+            if ids:
+                top = (
+                    db.query(Praise.name, func.word_similarity(term, Praise.name_search))
+                    .filter(Praise.id.in_(ids[:3]))
+                    .all()
+                )
+                for name, similarity in sorted(top, key=lambda r: -r[1]):
+                    print(f"   {similarity:.2f}  {name}")
+    finally:
+        # Nunca persistir os praises sintéticos
+        db.rollback()
+        db.close()
+
+    print()
+    if seq_scans:
+        print(f"❌ {seq_scans} termo(s) sem uso do índice trigram")
+        return 1
+    print("✅ Todas as buscas usaram índice")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
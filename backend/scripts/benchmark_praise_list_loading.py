@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do carregamento das listagens de praises.
+
+Compara a estratégia antiga (joinedload de tags + materials->kind/type com DISTINCT,
+offset e limit numa única consulta) com a atual do PraiseRepository (primeiro os IDs
+da página, depois selectinload em consultas IN).
+
+Mede, por página: consultas executadas, linhas transferidas pelo Postgres e latência.
+
+Também confere com EXPLAIN (ANALYZE, FORMAT JSON) a paginação por cursor: para cada
+ordenação, a página no fim do catálogo (cursor em ~90%) deve ler de praises só as linhas
+da página (range de índice com LIMIT), sem Seq Scan nem BitmapOr, como a primeira página.
+Retorna código 1 se alguma ordenação falhar.
+
+Com --seed N, cria um catálogo sintético de N praises dentro de uma transação que é
+desfeita (rollback) no final; o banco não é alterado.
+"""
+
+import sys
+import os
+import time
+import statistics
+from uuid import uuid4
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, func, text
+from sqlalchemy.orm import Session, joinedload
+from app.infrastructure.database.database import SessionLocal, engine
+from app.domain.models.praise import Praise
+from app.domain.models.praise_tag import PraiseTag
+from app.domain.models.praise_material import PraiseMaterial
+from app.domain.models.material_kind import MaterialKind
+from app.domain.models.material_type import MaterialType
+from app.infrastructure.database.repositories.praise_repository import CURSOR_NAME_COLUMN, PraiseRepository
+from app.application.services.praise_service import refresh_praise_search_columns
+
+
+class QueryStats:
+    """Conta consultas e linhas retornadas pelo cursor do driver."""
+
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+
+    def reset(self):
+        self.queries = 0
+        self.rows = 0
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.queries += 1
+            self.rows += max(cursor.rowcount, 0)
+
+
+def seed_catalog(db: Session, praise_count: int, tags_per_praise: int, materials_per_praise: int) -> None:
+    """Cria um catálogo sintético (sem commit)."""
+    suffix = uuid4().hex[:8]
+    tags = [PraiseTag(name=f"bench-tag-{suffix}-{i}") for i in range(max(tags_per_praise * 2, 1))]
+    kinds = [MaterialKind(name=f"bench-kind-{suffix}-{i}") for i in range(5)]
+    material_type = MaterialType(name=f"bench-type-{suffix}")
+    db.add_all(tags + kinds + [material_type])
+    db.flush()
+
+    for i in range(praise_count):
+        praise = Praise(name=f"Bench Praise {suffix} {i:05d}", number=i)
+        refresh_praise_search_columns(praise)
+        praise.tags = [tags[(i + j) % len(tags)] for j in range(tags_per_praise)]
+        db.add(praise)
+        db.flush()
+        for j in range(materials_per_praise):
+            db.add(PraiseMaterial(
+                praise_id=praise.id,
+                material_kind_id=kinds[j % len(kinds)].id,
+                material_type_id=material_type.id,
+                path=f"praises/{praise.id}/{uuid4()}.pdf",
+            ))
+        if i % 200 == 0:
+            db.flush()
+    db.flush()
+
+
+def load_legacy(db: Session, skip: int, limit: int):
+    """Estratégia anterior: grafo inteiro via joinedload + DISTINCT na mesma consulta."""
+    return (
+        db.query(Praise)
+        .options(
+            joinedload(Praise.tags),
+            joinedload(Praise.materials).joinedload(PraiseMaterial.material_kind),
+            joinedload(Praise.materials).joinedload(PraiseMaterial.material_type)
+        )
+        .order_by(func.lower(Praise.name))
+        .distinct()
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def load_two_phase(db: Session, skip: int, limit: int):
+    """Estratégia atual do repositório (IDs da página + selectinload)."""
+    return PraiseRepository(db).get_all_filtered_sorted(skip=skip, limit=limit)
+
+
+# (sort_by, sort_direction, no_number) conferidos na paginação por cursor
+KEYSET_ORDERINGS = [
+    ("name", "asc", "last"),
+    ("name", "desc", "last"),
+    ("number", "asc", "last"),
+    ("number", "desc", "last"),
+    ("number", "asc", "first"),
+    ("number", "desc", "first"),
+]
+
+
+def plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain(db: Session, query) -> dict:
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    row = db.connection().exec_driver_sql(
+        "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + str(compiled), compiled.params
+    ).fetchone()
+    return row[0][0]
+
+
+def deep_cursor_key(db: Session, repo: PraiseRepository, sort_by: str, sort_direction: str, no_number: str, total: int):
+    """Chave do cursor (como PraiseService.next_cursor) da linha em ~90% da ordenação."""
+    row = repo._filtered_sorted_page(
+        db.query(Praise.id, CURSOR_NAME_COLUMN, Praise.number),
+        int(total * 0.9),
+        1,
+        sort_by=sort_by,
+        sort_direction=sort_direction,
+        no_number=no_number,
+    ).first()
+    if row is None:
+        return None
+    return {"name": row.cursor_name, "number": row.number, "id": row.id}
+
+
+def check_keyset_plans(db: Session, limit: int, total: int) -> int:
+    """EXPLAIN da primeira página e de uma página profunda por ordenação; retorna quantas falharam."""
+    repo = PraiseRepository(db)
+    failures = 0
+    print(f"{'ordenação':<24} {'1ª página ms':>13} {'página ~90% ms':>15} {'linhas lidas':>13}  plano")
+    for sort_by, sort_direction, no_number in KEYSET_ORDERINGS:
+        filters = {"sort_by": sort_by, "sort_direction": sort_direction, "no_number": no_number}
+        first = explain(db, repo._filtered_sorted_page(db.query(Praise.id), 0, limit, **filters))
+        after_key = deep_cursor_key(db, repo, sort_by, sort_direction, no_number, total)
+        if after_key is None:
+            continue
+        deep = explain(db, repo._filtered_sorted_page(db.query(Praise.id), 0, limit, after_key=after_key, **filters))
+
+        nodes = list(plan_nodes(deep["Plan"]))
+        scans = [n for n in nodes if n.get("Relation Name") == "praises"]
+        rows_read = sum(n["Actual Rows"] * n["Actual Loops"] for n in scans)
+        problems = [n["Node Type"] for n in scans if n["Node Type"] == "Seq Scan"]
+        problems += [n["Node Type"] for n in nodes if n["Node Type"] == "BitmapOr"]
+        # Cada faixa do UNION ALL lê no máximo `limit` linhas
+        if rows_read > 3 * limit:
+            problems.append(f"{rows_read} linhas lidas")
+        failures += bool(problems)
+
+        label = f"{sort_by} {sort_direction}" + (f" nulls {no_number}" if sort_by == "number" else "")
+        indexes = sorted({n["Index Name"] for n in scans if n.get("Index Name")})
+        status = "❌ " + ", ".join(problems) if problems else "✅ " + (", ".join(indexes) or "-")
+        print(
+            f"{label:<24} {first['Execution Time']:>13.2f} {deep['Execution Time']:>15.2f} "
+            f"{rows_read:>13}  {status}"
+        )
+    return failures
+
+
+def measure(db: Session, stats: QueryStats, loader, skip: int, limit: int, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        db.expire_all()
+        stats.reset()
+        start = time.perf_counter()
+        praises = loader(db, skip, limit)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "praises": len(praises),
+        "queries": stats.queries,
+        "rows": stats.rows,
+        "median_ms": statistics.median(timings),
+        "p95_ms": sorted(timings)[max(int(len(timings) * 0.95) - 1, 0)],
+    }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark do carregamento de listagens de praises')
+    parser.add_argument('--seed', type=int, default=0, help='Criar N praises sintéticos (desfeito no final)')
+    parser.add_argument('--tags', type=int, default=6, help='Tags por praise sintético (padrão: 6)')
+    parser.add_argument('--materials', type=int, default=15, help='Materiais por praise sintético (padrão: 15)')
+    parser.add_argument('--limit', type=int, default=100, help='Tamanho da página (padrão: 100)')
+    parser.add_argument('--skip', type=int, default=0, help='Offset da página (padrão: 0)')
+    parser.add_argument('--repeat', type=int, default=20, help='Repetições por estratégia (padrão: 20)')
+    args = parser.parse_args()
+
+    stats = QueryStats()
+    event.listen(engine, "after_cursor_execute", stats.after_cursor_execute)
+    db: Session = SessionLocal()
+
+    try:
+        if args.seed:
+            print(f"🌱 Criando catálogo sintético: {args.seed} praises, {args.tags} tags e {args.materials} materiais cada")
+            seed_catalog(db, args.seed, args.tags, args.materials)
+
+        total = db.query(func.count(Praise.id)).scalar()
+        print(f"📊 Praises no catálogo: {total} | página: skip={args.skip} limit={args.limit} | repetições: {args.repeat}")
+        print()
+
+        results = {
+            "antes (joinedload + DISTINCT)": measure(db, stats, load_legacy, args.skip, args.limit, args.repeat),
+            "depois (IDs + selectinload)": measure(db, stats, load_two_phase, args.skip, args.limit, args.repeat),
+        }
+
+        print(f"{'estratégia':<32} {'praises':>8} {'consultas':>10} {'linhas':>10} {'mediana ms':>11} {'p95 ms':>9}")
+        for label, r in results.items():
+            print(f"{label:<32} {r['praises']:>8} {r['queries']:>10} {r['rows']:>10} {r['median_ms']:>11.1f} {r['p95_ms']:>9.1f}")
+
+        print()
+        if args.seed:
+            # Estatísticas para o planner (transacional: desfeitas junto com o rollback)
+            db.execute(text("ANALYZE praises"))
+        keyset_failures = check_keyset_plans(db, args.limit, total)
+    finally:
+        # Nunca persistir o catálogo sintético
+        db.rollback()
+        db.close()
+        event.remove(engine, "after_cursor_execute", stats.after_cursor_execute)
+
+    print()
+    if keyset_failures:
+        print(f"❌ {keyset_failures} ordenação(ões) com página profunda fora do range de índice")
+        return 1
+    print("✅ Páginas profundas por cursor com o mesmo custo da primeira")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Verifica o contrato da serialização rápida (FAST_JSON_RESPONSES=true).
+
+Para cada listagem (praises completos, resumo de praises e materiais), gera o corpo pelos
+dois caminhos e compara byte a byte:
+- padrão: response_model do FastAPI (validação Pydantic + serialize_response) e JSONResponse;
+- rápido: dicts de app.domain.schemas.fast_serializers codificados com ORJSONResponse.
+
+Os dados vêm do banco (amostra com --limit, somente leitura) ou, com --synthetic, de
+objetos montados em memória com casos de borda (acentos, aspas, emoji, nulos, datetime com
+microssegundos e fuso UTC); --synthetic não precisa de banco.
+
+Retorna código 1 se algum corpo divergir, mostrando o trecho da primeira diferença.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.domain.models.material_kind import MaterialKind
+from app.domain.models.material_type import MaterialType
+from app.domain.models.praise import Praise
+from app.domain.models.praise_material import PraiseMaterial
+from app.domain.models.praise_tag import PraiseTag
+from app.domain.schemas.fast_serializers import (
+    praise_documents_to_dicts,
+    praise_materials_to_dicts,
+    praise_summary_to_dict,
+)
+from app.domain.schemas.praise import (
+    PRAISE_SUMMARY_DEFAULT_FIELDS,
+    PRAISE_SUMMARY_FIELDS,
+    PraiseResponse,
+    PraiseSummaryResponse,
+)
+from app.domain.schemas.praise_material import PraiseMaterialResponse
+from app.application.services.praise_catalog_service import build_catalog_document
+
+
+def default_body(response_model: Any, content: Any) -> bytes:
+    """Corpo do caminho padrão: o mesmo que o FastAPI gera para uma rota com response_model."""
+    field = create_response_field(name="Response_contract_check", type_=response_model, mode="serialization")
+    serialized = asyncio.run(serialize_response(field=field, response_content=content, is_coroutine=True))
+    return JSONResponse(content=serialized).body
+
+
+def default_summary_body(items: List[Dict[str, Any]], fields: Tuple[str, ...]) -> bytes:
+    """Corpo do caminho padrão de view=summary (montado na rota, sem response_model)."""
+    return JSONResponse(content=[
+        PraiseSummaryResponse(**item).model_dump(mode="json", include=set(fields))
+        for item in items
+    ]).body
+
+
+def fast_body(content: Any) -> bytes:
+    return ORJSONResponse(content=content).body
+
+
+def first_difference(expected: bytes, actual: bytes) -> str:
+    index = next(
+        (i for i, (a, b) in enumerate(zip(expected, actual)) if a != b),
+        min(len(expected), len(actual)),
+    )
+    start = max(0, index - 60)
+    return (
+        f"  posição {index}\n"
+        f"  padrão: ...{expected[start:index + 60].decode('utf-8', 'replace')}...\n"
+        f"  rápido: ...{actual[start:index + 60].decode('utf-8', 'replace')}..."
+    )
+
+
+def as_jsonb(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Simula a leitura do JSONB (ordem das chaves diferente da gravada)."""
+    return json.loads(json.dumps(document, sort_keys=True))
+
+
+def synthetic_data(count: int):
+    kind = MaterialKind(id=uuid4(), name="Cifra \"Guitarra\" – Ré♯")
+    material_type = MaterialType(id=uuid4(), name="pdf")
+    tags = [PraiseTag(id=uuid4(), name=name) for name in ("Adoração", "Natal 🎄", "<script>/\\")]
+    praises, materials = [], []
+    for i in range(count):
+        created_at = datetime(2024, 1, 2, 3, 4, 5, 123456 if i % 2 else 0)
+        praise = Praise(
+            id=uuid4(),
+            name=f"Glória ao Rei {i}   \"aspas\"",
+            number=i if i % 3 else None,
+            author=None if i % 2 else "José da Silva",
+            rhythm="Valsa",
+            tonality="F#m",
+            category=None,
+            created_at=created_at,
+            updated_at=created_at.replace(tzinfo=timezone.utc) if i % 4 == 0 else created_at,
+            in_review=bool(i % 2),
+            in_review_description="Revisar\tletra\n2ª estrofe" if i % 2 else None,
+            review_history=[{"type": "in_review", "date": "2024-01-02T03:04:05.000Z"}] if i % 2 else None,
+        )
+        praise.tags = tags[: i % 4]
+        praise.materials = [
+            PraiseMaterial(
+                id=uuid4(),
+                praise_id=praise.id,
+                material_kind_id=kind.id,
+                material_type_id=material_type.id,
+                material_kind=kind,
+                material_type=material_type,
+                path=f"{praise.id}/cifra {j}.pdf",
+                is_old=bool(j % 2),
+                old_description="versão antiga" if j % 2 else None,
+                file_version=1 + j,
+            )
+            for j in range(i % 3)
+        ]
+        praises.append(praise)
+        materials.extend(praise.materials)
+
+    summaries = [
+        {
+            "id": p.id, "name": p.name, "number": p.number, "author": p.author, "rhythm": p.rhythm,
+            "tonality": p.tonality, "category": p.category, "in_review": p.in_review,
+            "created_at": p.created_at, "updated_at": p.updated_at,
+            "tags": [{"id": t.id, "name": t.name} for t in p.tags],
+        }
+        for p in praises
+    ]
+    documents = [as_jsonb(build_catalog_document(p)) for p in praises]
+    return documents, summaries, materials
+
+
+def database_data(limit: int):
+    from app.infrastructure.database.database import SessionLocal
+    from app.infrastructure.database.repositories.praise_catalog_repository import PraiseCatalogRepository
+    from app.infrastructure.database.repositories.praise_material_repository import PraiseMaterialRepository
+    from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+
+    db = SessionLocal()
+    try:
+        praise_repo = PraiseRepository(db)
+        ids = praise_repo.get_ids_filtered_sorted(limit=limit)
+        stored = PraiseCatalogRepository(db).get_documents(ids)
+        # Somente leitura: praises sem documento são montados aqui, sem gravar
+        built = {p.id: build_catalog_document(p) for p in praise_repo.get_by_ids([i for i in ids if i not in stored])}
+        documents = [stored.get(i) or as_jsonb(built[i]) for i in ids if i in stored or i in built]
+        summaries = praise_repo.get_summaries_filtered_sorted(list(PRAISE_SUMMARY_FIELDS), limit=limit)
+        materials = PraiseMaterialRepository(db).get_all(limit=limit)
+        # Materializa os relacionamentos antes de fechar a sessão
+        for material in materials:
+            material.material_kind, material.material_type
+        return documents, summaries, materials
+    finally:
+        db.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compara serialização padrão e rápida (byte a byte)")
+    parser.add_argument("--limit", type=int, default=100, help="Itens por listagem (padrão: 100)")
+    parser.add_argument("--synthetic", action="store_true", help="Usar dados em memória (sem banco)")
+    args = parser.parse_args()
+
+    documents, summaries, materials = synthetic_data(args.limit) if args.synthetic else database_data(args.limit)
+
+    checks: List[Tuple[str, Callable[[], bytes], Callable[[], bytes]]] = [
+        (
+            "praises (view=full)",
+            lambda: default_body(List[PraiseResponse], documents),
+            lambda: fast_body(praise_documents_to_dicts(documents)),
+        ),
+        (
+            "praises (view=summary)",
+            lambda: default_summary_body(summaries, PRAISE_SUMMARY_DEFAULT_FIELDS),
+            lambda: fast_body([praise_summary_to_dict(i, PRAISE_SUMMARY_DEFAULT_FIELDS) for i in summaries]),
+        ),
+        (
+            "praises (fields=todos)",
+            lambda: default_summary_body(summaries, PRAISE_SUMMARY_FIELDS),
+            lambda: fast_body([praise_summary_to_dict(i, PRAISE_SUMMARY_FIELDS) for i in summaries]),
+        ),
+        (
+            "praise_materials",
+            lambda: default_body(List[PraiseMaterialResponse], materials),
+            lambda: fast_body(praise_materials_to_dicts(materials)),
+        ),
+    ]
+
+    failed = False
+    for label, expected_body, actual_body in checks:
+        expected, actual = expected_body(), actual_body()
+        if expected == actual:
+            print(f"✅ {label}: {len(expected)} bytes idênticos")
+        else:
+            failed = True
+            print(f"❌ {label}: corpos diferentes ({len(expected)} vs {len(actual)} bytes)")
+            print(first_difference(expected, actual))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
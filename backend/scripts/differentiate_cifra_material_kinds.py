@@ -25,6 +25,7 @@ from app.infrastructure.database.repositories.material_kind_repository import Ma
 from app.infrastructure.database.repositories.praise_material_repository import PraiseMaterialRepository
 from app.infrastructure.database.repositories.praise_repository import PraiseRepository
 from app.application.services.metadata_sync_service import sync_praise_to_metadata
+from app.application.services.praise_catalog_service import PraiseCatalogService
 from app.core.config import settings
 
 
@@ -229,6 +230,7 @@ def update_materials_from_metadata(
                 praise = praise_repo.get_by_id(praise_id)
                 if praise:
                     sync_praise_to_metadata(praise)
+                    PraiseCatalogService(db).refresh(praise)
             except Exception as e:
                 stats['errors'].append(f"Erro ao sincronizar metadata para praise {praise_id}: {e}")
     
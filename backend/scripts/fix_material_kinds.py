@@ -19,6 +19,9 @@ import re
 from app.infrastructure.database.database import SessionLocal
 from app.infrastructure.database.repositories.praise_material_repository import PraiseMaterialRepository
 from app.infrastructure.database.repositories.material_kind_repository import MaterialKindRepository
+from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+from app.application.services.praise_catalog_service import PraiseCatalogService
+from app.application.services.praise_archive_service import invalidate_praise_archive
 
 
 def infer_material_kind_name_from_file(file_path: str) -> str:
@@ -214,6 +217,12 @@ def fix_praise_materials(db: Session, metadata_path: Path, dry_run: bool = False
             print(f"   [DRY RUN] Seria corrigido")
             fixed_count += 1
     
+    if fixed_count and not dry_run:
+        # Atualizar o modelo de leitura (documento do praise com os materiais)
+        PraiseCatalogService(db).refresh(PraiseRepository(db).get_by_id(praise_id))
+        # ZIPs em cache do praise têm os nomes de entrada com os kinds antigos
+        invalidate_praise_archive(praise_id, prewarm=False)
+    
     print(f"\n{'📊 Resumo:' if not dry_run else '📊 Resumo (DRY RUN):'}")
     print(f"   Materiais corrigidos: {fixed_count}")
     if errors:
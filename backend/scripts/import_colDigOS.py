@@ -28,10 +28,17 @@ from app.domain.models.material_kind import MaterialKind
 from app.infrastructure.storage.storage_factory import get_storage_client
 from app.infrastructure.storage.storage_client import StorageClient
 from app.core.config import settings
-from app.application.services.praise_service import PraiseService
+from app.application.services.praise_service import PraiseService, refresh_praise_search_columns
 from app.application.services.praise_tag_service import PraiseTagService
 from app.application.services.material_kind_service import MaterialKindService
 from app.application.services.praise_material_service import PraiseMaterialService
+from app.application.services.praise_catalog_service import PraiseCatalogService
+from app.application.services.material_file_service import (
+    HashingReader,
+    apply_file_metadata,
+    record_file_metadata,
+    uploaded_file_metadata,
+)
 from app.infrastructure.database.repositories.material_kind_repository import MaterialKindRepository
 from app.infrastructure.database.repositories.material_type_repository import MaterialTypeRepository
 from app.infrastructure.database.repositories.praise_tag_repository import PraiseTagRepository
@@ -106,6 +113,14 @@ def normalize_material_kind_name(type_str: str, file_extension: str = '') -> str
     return 'Unknown'
 
 
+def record_material_file(material, storage_client, storage_path: str, uploaded_reader=None) -> None:
+    """Grava os metadados do arquivo: do upload, se houve; senão lidos do storage local"""
+    if uploaded_reader is not None:
+        apply_file_metadata(material, uploaded_file_metadata(storage_client, storage_path, uploaded_reader))
+    else:
+        record_file_metadata(material, storage_client, checksum=True)
+
+
 def get_or_create_material_kind(db: Session, name: str) -> MaterialKind:
     """Obtém ou cria um MaterialKind"""
     repo = MaterialKindRepository(db)
@@ -250,6 +265,7 @@ def process_praise_folder(
                 tonality=praise_tonality or None,
                 category=praise_category or None,
             )
+            refresh_praise_search_columns(praise)
             praise = praise_repo.create(praise)
             print(f"  ✅ Praise criado: {praise_name}")
     
@@ -342,6 +358,7 @@ def process_praise_folder(
                     )
                     material_kind = get_or_create_material_kind(db, material_kind_name)
                 
+                uploaded_reader = None
                 # Com STORAGE_MODE=local, apenas referenciar arquivos existentes
                 # Sem copiá-los, pois já estão no storage local
                 if settings.STORAGE_MODE.lower() == "local":
@@ -354,8 +371,10 @@ def process_praise_folder(
                     try:
                         with open(file_found, 'rb') as f:
                             content_type, _ = mimetypes.guess_type(str(file_found))
+                            # Tamanho e checksum calculados durante o upload (sem baixar o objeto depois)
+                            uploaded_reader = HashingReader(f)
                             storage_path = storage_client.upload_file(
-                                f,
+                                uploaded_reader,
                                 file_found.name,
                                 content_type=content_type,
                                 folder=f"praises/{praise_id}",
@@ -395,6 +414,7 @@ def process_praise_folder(
                     material.material_kind_id = material_kind.id
                     material.material_type_id = material_type.id
                     material.path = storage_path
+                    record_material_file(material, storage_client, storage_path, uploaded_reader)
                     material = material_repo.update(material)
                     print(f"    ✅ Material atualizado: {material_id}")
                 else:
@@ -406,6 +426,7 @@ def process_praise_folder(
                         path=storage_path,
                         praise_id=praise_id
                     )
+                    record_material_file(material, storage_client, storage_path, uploaded_reader)
                     material = material_repo.create(material)
                     print(f"    ✅ Material criado: {material_id}")
     
@@ -429,6 +450,7 @@ def process_praise_folder(
                     existing_lyrics.material_kind_id = material_kind_lyrics.id
                     existing_lyrics.material_type_id = material_type_text.id
                     material_repo.update(existing_lyrics)
+                    material_repo.refresh_lyrics_search_vector(existing_lyrics.id)
                     print(f"  ✅ Material Lyrics atualizado")
                 else:
                     lyrics_material = PraiseMaterial(
@@ -439,8 +461,13 @@ def process_praise_folder(
                         praise_id=praise_id,
                     )
                     material_repo.create(lyrics_material)
+                    material_repo.refresh_lyrics_search_vector(lyrics_material_id)
                     print(f"  ✅ Material Lyrics criado")
     
+    if not dry_run:
+        # Materiais gravados direto pelos repositórios: atualizar o modelo de leitura
+        PraiseCatalogService(db).refresh(PraiseRepository(db).get_by_id(praise_id))
+    
     return True, "Processado com sucesso"
 
 
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reconstrói o modelo de leitura praise_catalog_entries (documento PraiseResponse por praise).
+
+As escritas pelos services mantêm a tabela; linhas ausentes são montadas em memória na
+leitura e gravadas em segundo plano. Com --missing (executado no deploy, após as migrações)
+preenche só os praises sem linha. Sem opções, regrava tudo: use após alterações feitas direto
+no banco (SQL manual, scripts antigos).
+"""
+
+import sys
+import os
+from uuid import UUID
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import Session
+from app.infrastructure.database.database import SessionLocal
+from app.domain.models.praise import Praise
+from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+from app.infrastructure.database.repositories.praise_catalog_repository import PraiseCatalogRepository
+from app.application.services.praise_catalog_service import build_catalog_document
+
+
+def rebuild_catalog(db: Session, praise_ids=None, batch_size: int = 200) -> int:
+    """Regrava os documentos em lotes (um selectinload por lote); retorna quantos foram gravados."""
+    praise_repo = PraiseRepository(db)
+    catalog_repo = PraiseCatalogRepository(db)
+    if praise_ids is None:
+        praise_ids = [row.id for row in db.query(Praise.id).order_by(Praise.id)]
+
+    written = 0
+    for start in range(0, len(praise_ids), batch_size):
+        batch = praise_ids[start:start + batch_size]
+        documents = {praise.id: build_catalog_document(praise) for praise in praise_repo.get_by_ids(batch)}
+        catalog_repo.upsert_many(documents)
+        db.expunge_all()
+        written += len(documents)
+        print(f"  ✅ {written}/{len(praise_ids)} documentos gravados")
+    return written
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Reconstrói o modelo de leitura praise_catalog_entries')
+    parser.add_argument('--praise-id', action='append', type=UUID, help='Reconstruir apenas este praise (pode repetir)')
+    parser.add_argument('--missing', action='store_true', help='Apenas praises sem linha no modelo de leitura')
+    parser.add_argument('--batch-size', type=int, default=200, help='Praises por lote (padrão: 200)')
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        print("🔄 Reconstruindo praise_catalog_entries...")
+        praise_ids = args.praise_id
+        if args.missing:
+            praise_ids = PraiseCatalogRepository(db).get_missing_praise_ids()
+        written = rebuild_catalog(db, praise_ids, args.batch_size)
+        print(f"\n✅ Concluído: {written} documento(s)")
+    except Exception as e:
+        db.rollback()
+        print(f"\n❌ Erro: {e}")
+        return 1
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
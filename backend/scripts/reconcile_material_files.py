@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Confere os metadados de arquivo gravados em praise_materials com o storage e repara divergências.
+
+Para cada material de arquivo (PDF/áudio):
+- sem metadados (materiais anteriores à migração 022) ou sem checksum (materiais criados com o
+  path de um arquivo já no storage): lê o arquivo e grava tamanho, content type, checksum, data
+  de modificação e caminho resolvido;
+- arquivo removido do storage: limpa os metadados (downloads voltam a procurar o arquivo);
+- tamanho, data ou caminho diferentes do registro (arquivo trocado fora da API): relê e grava.
+  Se o checksum mudou, incrementa file_version, para que as URLs de download mudem e o cache
+  immutable dos clientes não sirva o conteúdo antigo.
+
+Com --full o checksum é recalculado para todos, mesmo quando tamanho e data conferem.
+"""
+
+import os
+import sys
+from datetime import timezone
+from typing import Dict, List
+from uuid import UUID
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.infrastructure.database.database import SessionLocal
+from app.domain.models.material_type import MaterialType
+from app.domain.models.praise_material import PraiseMaterial
+from app.infrastructure.database.repositories.praise_repository import PraiseRepository
+from app.infrastructure.storage.storage_client import StorageClient
+from app.infrastructure.storage.storage_factory import get_storage_client
+from app.application.services.bulk_download_service import FILE_MATERIAL_TYPES
+from app.application.services.material_file_service import apply_file_metadata, read_file_metadata
+from app.application.services.praise_catalog_service import PraiseCatalogService
+
+
+def _matches_storage(material: PraiseMaterial, storage: StorageClient) -> bool:
+    """True se tamanho, data e caminho do registro conferem com o storage (sem ler o conteúdo)."""
+    if material.checksum is None or material.file_size is None or material.file_modified_at is None:
+        return False
+    resolved_path = storage.local_path(material.path)
+    if resolved_path != material.resolved_path:
+        return False
+    if resolved_path is not None:
+        stat = os.stat(resolved_path)
+        size, mtime = stat.st_size, stat.st_mtime
+    else:
+        size, mtime = storage.get_file_size(material.path), storage.get_file_mtime(material.path)
+    recorded = material.file_modified_at.replace(tzinfo=timezone.utc).timestamp()
+    return size == material.file_size and mtime is not None and abs(mtime - recorded) <= 1e-3
+
+
+def reconcile(db: Session, storage: StorageClient, full: bool, dry_run: bool, batch_size: int) -> Dict[str, int]:
+    counts = {"ok": 0, "recorded": 0, "updated": 0, "new_version": 0, "missing": 0, "errors": 0}
+    material_ids: List[UUID] = [
+        row.id for row in (
+            db.query(PraiseMaterial.id)
+            .join(MaterialType, MaterialType.id == PraiseMaterial.material_type_id)
+            .filter(func.lower(MaterialType.name).in_(FILE_MATERIAL_TYPES))
+            .order_by(PraiseMaterial.id)
+        )
+    ]
+    print(f"📋 {len(material_ids)} materiais de arquivo")
+    # Praises com file_version alterado: documento do catálogo precisa ser regravado
+    changed_praises = set()
+
+    for start in range(0, len(material_ids), batch_size):
+        batch = db.query(PraiseMaterial).filter(PraiseMaterial.id.in_(material_ids[start:start + batch_size])).all()
+        for material in batch:
+            try:
+                if not full and _matches_storage(material, storage):
+                    counts["ok"] += 1
+                    continue
+                metadata = read_file_metadata(storage, material.path)
+            except Exception as e:
+                counts["errors"] += 1
+                print(f"  ❌ {material.id} ({material.path}): {e}")
+                continue
+
+            if metadata is None:
+                if material.file_size is not None or material.checksum is not None:
+                    print(f"  ⚠️  Arquivo ausente: {material.id} ({material.path})")
+                    if not dry_run:
+                        apply_file_metadata(material, None)
+                counts["missing"] += 1
+                continue
+
+            previous_checksum = material.checksum
+            if previous_checksum is None:
+                counts["recorded"] += 1
+            elif (
+                previous_checksum == metadata.checksum
+                and material.file_size == metadata.file_size
+                and material.resolved_path == metadata.resolved_path
+                and material.file_modified_at == metadata.file_modified_at
+            ):
+                counts["ok"] += 1
+                continue
+            else:
+                counts["updated"] += 1
+                print(f"  🔄 Metadados divergentes: {material.id} ({material.path})")
+
+            if dry_run:
+                continue
+            apply_file_metadata(material, metadata)
+            if previous_checksum is not None and previous_checksum != metadata.checksum:
+                material.file_version = (material.file_version or 1) + 1
+                counts["new_version"] += 1
+                changed_praises.add(material.praise_id)
+
+        if not dry_run:
+            db.commit()
+        db.expunge_all()
+        print(f"  ✅ {min(start + batch_size, len(material_ids))}/{len(material_ids)} conferidos")
+
+    if changed_praises and not dry_run:
+        catalog = PraiseCatalogService(db)
+        praise_repo = PraiseRepository(db)
+        for praise in praise_repo.get_by_ids(list(changed_praises)):
+            catalog.refresh(praise)
+        print(f"  ✅ {len(changed_praises)} documento(s) do catálogo regravado(s) (nova file_version)")
+    return counts
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Confere e repara os metadados de arquivo dos materiais')
+    parser.add_argument('--full', action='store_true', help='Recalcular o checksum de todos os arquivos')
+    parser.add_argument('--dry-run', action='store_true', help='Apenas mostrar as divergências, sem gravar')
+    parser.add_argument('--batch-size', type=int, default=200, help='Materiais por lote (padrão: 200)')
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        print("🔄 Conferindo metadados de arquivo dos materiais...")
+        counts = reconcile(db, get_storage_client(), args.full, args.dry_run, args.batch_size)
+        print(
+            f"\n✅ Concluído{' (dry-run)' if args.dry_run else ''}: {counts['ok']} ok, "
+            f"{counts['recorded']} gravado(s), {counts['updated']} atualizado(s) "
+            f"({counts['new_version']} com nova versão), {counts['missing']} ausente(s), "
+            f"{counts['errors']} erro(s)"
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"\n❌ Erro: {e}")
+        return 1
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -12,6 +12,11 @@ export interface GetMaterialsParams {
   praise_id?: string;
 }
 
+export interface MaterialsByIdsResponse {
+  items: PraiseMaterialResponse[];
+  missing_ids: string[];
+}
+
 export const praiseMaterialsApi = {
   getMaterials: async (
     params: GetMaterialsParams = {}
@@ -30,6 +35,14 @@ export const praiseMaterialsApi = {
     return response.data;
   },
 
+  getMaterialsByIds: async (ids: string[]): Promise<MaterialsByIdsResponse> => {
+    const response = await apiClient.post<MaterialsByIdsResponse>(
+      '/api/v1/praise-materials/by-ids',
+      { ids }
+    );
+    return response.data;
+  },
+
   uploadMaterial: async (
     file: File,
     materialKindId: string,
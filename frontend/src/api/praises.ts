@@ -12,11 +12,53 @@ export interface GetPraisesParams {
   name?: string;
   tag_id?: string;
   search_in_lyrics?: boolean;
-  sort_by?: 'name' | 'number';
+  fuzzy?: boolean;
+  sort_by?: 'name' | 'number' | 'relevance';
   sort_direction?: 'asc' | 'desc';
   no_number?: 'first' | 'last' | 'hide';
 }
 
+export interface ArchivePart {
+  filename: string;
+  size: number;
+  file_count: number;
+  url: string;
+}
+
+export interface ArchiveManifest {
+  archive_id: string;
+  created_at: string;
+  expires_at: string;
+  total_files: number;
+  parts: ArchivePart[];
+  skipped: { material_id: string; praise_name: string; path: string; reason: string }[];
+}
+
+export interface ArchiveJob {
+  job_id: string;
+  status: 'queued' | 'running' | 'completed' | 'failed' | 'expired';
+  created_at: string;
+  updated_at: string;
+  files_total: number;
+  files_done: number;
+  bytes_written: number;
+  skipped: ArchiveManifest['skipped'];
+  error: string | null;
+  archive: ArchiveManifest | null;
+}
+
+export interface ArchiveJobCreate {
+  material_kind_ids?: string[];
+  tag_ids?: string[];
+  operation?: 'union' | 'intersection';
+  max_zip_size_mb?: number;
+}
+
+export interface PraisesByIdsResponse {
+  items: PraiseResponse[];
+  missing_ids: string[];
+}
+
 export const praisesApi = {
   getPraises: async (params: GetPraisesParams = {}): Promise<PraiseResponse[]> => {
     const requestParams: Record<string, string | number | boolean | undefined> = {
@@ -31,6 +73,9 @@ export const praisesApi = {
     if (params.search_in_lyrics === true) {
       requestParams.search_in_lyrics = true;
     }
+    if (params.fuzzy === true) {
+      requestParams.fuzzy = true;
+    }
     const response = await apiClient.get<PraiseResponse[]>('/api/v1/praises/', {
       params: requestParams,
     });
@@ -42,6 +87,13 @@ export const praisesApi = {
     return response.data;
   },
 
+  getPraisesByIds: async (ids: string[]): Promise<PraisesByIdsResponse> => {
+    const response = await apiClient.post<PraisesByIdsResponse>('/api/v1/praises/by-ids', {
+      ids,
+    });
+    return response.data;
+  },
+
   createPraise: async (data: PraiseCreate): Promise<PraiseResponse> => {
     const response = await apiClient.post<PraiseResponse>('/api/v1/praises/', data);
     return response.data;
@@ -80,11 +132,12 @@ export const praisesApi = {
     return response.data;
   },
 
+  // Mesmo fluxo de createArchiveJob: responde o job (202), acompanhado com getArchiveJob
   downloadPraisesByMaterialKind: async (
     materialKindId: string,
     tagId?: string,
     maxZipSizeMb?: number
-  ): Promise<Blob> => {
+  ): Promise<ArchiveJob> => {
     const params: Record<string, string | number> = {
       material_kind_id: materialKindId,
     };
@@ -97,10 +150,24 @@ export const praisesApi = {
       params.max_zip_size_mb = maxZipSizeMb;
     }
     
-    const response = await apiClient.get('/api/v1/praises/download-by-material-kind', {
-      params,
-      responseType: 'blob',
-    });
+    const response = await apiClient.get<ArchiveJob>(
+      '/api/v1/praises/download-by-material-kind',
+      { params }
+    );
+    return response.data;
+  },
+
+  // Lote em segundo plano: cria o job e acompanha com getArchiveJob até "completed"
+  createArchiveJob: async (data: ArchiveJobCreate): Promise<ArchiveJob> => {
+    const response = await apiClient.post<ArchiveJob>('/api/v1/archives/jobs', data);
+    return response.data;
+  },
+
+  getArchiveJob: async (jobId: string): Promise<ArchiveJob> => {
+    const response = await apiClient.get<ArchiveJob>(`/api/v1/archives/jobs/${jobId}`);
     return response.data;
   },
+
+  // URL assinada (?token=) das partes: o navegador baixa direto, com retomada (Range)
+  archivePartDownloadUrl: (url: string): string => `${apiClient.defaults.baseURL ?? ''}${url}`,
 };
@@ -6,7 +6,28 @@ import { Modal } from '@/components/ui/Modal';
 import { Button } from '@/components/ui/Button';
 import { Loading } from '@/components/ui/Loading';
 import { AlertTriangle } from 'lucide-react';
-import { praisesApi } from '@/api/praises';
+import { praisesApi, type ArchiveJob, type ArchiveManifest } from '@/api/praises';
+
+const JOB_POLL_INTERVAL_MS = 1500;
+// Intervalo entre os downloads das partes (o navegador pode ignorar cliques simultâneos)
+const PART_DOWNLOAD_INTERVAL_MS = 500;
+
+// Acompanha o job de lote até terminar, repassando o progresso
+const waitForArchiveJob = async (
+  job: ArchiveJob,
+  onProgress: (job: ArchiveJob) => void
+): Promise<ArchiveManifest> => {
+  let current = job;
+  while (current.status === 'queued' || current.status === 'running') {
+    onProgress(current);
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    current = await praisesApi.getArchiveJob(current.job_id);
+  }
+  if (current.status !== 'completed' || !current.archive) {
+    throw new Error(current.error || `Archive job ${current.status}`);
+  }
+  return current.archive;
+};
 
 interface DownloadByMaterialKindModalProps {
   isOpen: boolean;
@@ -27,6 +48,7 @@ export const DownloadByMaterialKindModal = ({
   const [selectedMaterialKindId, setSelectedMaterialKindId] = useState<string>('');
   const [maxZipSizeMb, setMaxZipSizeMb] = useState<number>(100);
   const [isDownloading, setIsDownloading] = useState(false);
+  const [jobProgress, setJobProgress] = useState<ArchiveJob | null>(null);
 
   const handleDownload = async () => {
     if (!selectedMaterialKindId) {
@@ -35,33 +57,40 @@ export const DownloadByMaterialKindModal = ({
 
     setIsDownloading(true);
     try {
-      const blob = await praisesApi.downloadPraisesByMaterialKind(
-        selectedMaterialKindId,
-        tagId,
-        maxZipSizeMb
-      );
-
-      // Criar URL do blob
-      const url = window.URL.createObjectURL(blob);
-
-      // Criar elemento <a> temporário para download
-      const link = document.createElement('a');
-      link.href = url;
-
-      // Obter nome do material kind para nomear o arquivo
+      // O ZIP é montado em segundo plano no servidor; aqui só acompanhamos o progresso
+      const job = await praisesApi.createArchiveJob({
+        material_kind_ids: [selectedMaterialKindId],
+        tag_ids: tagId ? [tagId] : [],
+        max_zip_size_mb: maxZipSizeMb,
+      });
+      const manifest = await waitForArchiveJob(job, setJobProgress);
+      setJobProgress(null);
+
+      // Obter nome do material kind para nomear os arquivos
       const materialKind = materialKinds?.find(k => k.id === selectedMaterialKindId);
       const materialKindName = materialKind ? getMaterialKindName(materialKind.id, materialKind.name) : 'materials';
-      const fileName = `materials_${materialKindName.replace(/[^a-z0-9._-]/gi, '_').toLowerCase()}.zip`;
+      const baseName = `materials_${materialKindName.replace(/[^a-z0-9._-]/gi, '_').toLowerCase()}`;
 
-      link.download = fileName;
+      // As partes ficam no servidor: o navegador baixa cada uma direto da URL assinada,
+      // sem carregá-la na memória da página e podendo retomar downloads interrompidos
+      for (const [index, part] of manifest.parts.entries()) {
+        if (index > 0) {
+          await new Promise((resolve) => setTimeout(resolve, PART_DOWNLOAD_INTERVAL_MS));
+        }
 
-      // Disparar download
-      document.body.appendChild(link);
-      link.click();
+        // Criar elemento <a> temporário para download
+        const link = document.createElement('a');
+        link.href = praisesApi.archivePartDownloadUrl(part.url);
+        link.download =
+          manifest.parts.length === 1 ? `${baseName}.zip` : `${baseName}_${part.filename}`;
 
-      // Limpar
-      document.body.removeChild(link);
-      window.URL.revokeObjectURL(url);
+        // Disparar download
+        document.body.appendChild(link);
+        link.click();
+
+        // Limpar
+        document.body.removeChild(link);
+      }
 
       // Fechar modal e resetar
       onClose();
@@ -72,6 +101,7 @@ export const DownloadByMaterialKindModal = ({
       // TODO: Mostrar mensagem de erro ao usuário
     } finally {
       setIsDownloading(false);
+      setJobProgress(null);
     }
   };
 
@@ -150,6 +180,12 @@ export const DownloadByMaterialKindModal = ({
           </p>
         </div>
 
+        {jobProgress && (
+          <p className="text-sm text-gray-600">
+            {t('message.preparingArchive') || 'Preparando arquivos'}: {jobProgress.files_done + jobProgress.skipped.length} / {jobProgress.files_total}
+          </p>
+        )}
+
         <div className="flex justify-end space-x-3 pt-4 border-t">
           <Button
             variant="outline"
@@ -118,11 +118,11 @@ export const PraiseMaterialsList = ({ materials, praiseId }: PraiseMaterialsList
     
     // URL do endpoint que serve o arquivo diretamente (redireciona para URL assinada)
     // Token é passado como query parameter porque <a> não envia headers
-    // Adiciona hash do path para cache-busting (muda quando o path muda)
-    // O path pode mudar quando o arquivo é substituído (mesmo material_id, mas pode ter extensão diferente)
-    const pathHash = material.path ? `&v=${btoa(material.path).slice(-16).replace(/[^a-zA-Z0-9]/g, '')}` : '';
-    const tokenParam = token ? `?token=${encodeURIComponent(token)}${pathHash}` : pathHash ? `?${pathHash.substring(1)}` : '';
-    return `${baseUrl}/api/v1/praise-materials/${material.id}/download${tokenParam}`;
+    // Versão do arquivo (file_version): muda quando ele é substituído, então a URL versionada
+    // pode ficar em cache como immutable no navegador
+    const version = `v=${material.file_version ?? 1}`;
+    const query = token ? `?token=${encodeURIComponent(token)}&${version}` : `?${version}`;
+    return `${baseUrl}/api/v1/praise-materials/${material.id}/download${query}`;
   };
 
   // Handler para cliques nos botões de ação
@@ -85,6 +85,7 @@ export interface PraiseMaterialResponse {
   path: string; // URL ou caminho do arquivo
   is_old?: boolean;
   old_description?: string | null;
+  file_version?: number; // incrementa quando o arquivo é substituído (versiona a URL de download)
   material_kind?: MaterialKindResponse;
   material_type?: MaterialTypeResponse;
 }
@@ -113,6 +114,7 @@ export interface PraiseMaterialSimple {
   path: string;
   is_old?: boolean;
   old_description?: string | null;
+  file_version?: number; // incrementa quando o arquivo é substituído (versiona a URL de download)
   material_kind?: MaterialKindResponse;
   material_type?: MaterialTypeResponse;
 }